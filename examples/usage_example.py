@@ -1,5 +1,6 @@
 """Example usage of the AI assistant workflow interface."""
 
+import asyncio
 import logging
 from aia.workflow_coordinator import WorkflowCoordinator
 from aia.models import WorkflowConfig, WorkflowStatus
@@ -11,6 +12,17 @@ def setup_logging():
     logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
 
 
+async def fetch_overview(coordinator: WorkflowCoordinator) -> tuple:
+    """Fetch the independent board reads concurrently instead of one gh call after another."""
+    return await asyncio.gather(
+        coordinator.get_workflow_status_counts_async(),
+        coordinator.get_todo_issues_async(),
+        coordinator.get_issues_for_ai_async(AiaType.AI_CODER, WorkflowStatus.DOING),
+        coordinator.get_issues_for_ai_async(AiaType.AI_REVIEWER, WorkflowStatus.REVIEW),
+        coordinator.get_issues_for_ai_async(AiaType.AI_TESTER, WorkflowStatus.TESTING),
+    )
+
+
 def main():
     """Example usage of the AI assistant workflow."""
     setup_logging()
@@ -24,19 +36,20 @@ def main():
     )
 
     # Initialize workflow coordinator for GitHub
-    coordinator = WorkflowCoordinator("github", config)
+    coordinator = WorkflowCoordinator(config, "github")
 
     print("=== AI Assistant Workflow Example ===")
 
+    # Snapshot of the board; the reads below don't depend on each other
+    status_counts, todo_issues, coder_issues, reviewer_issues, tester_issues = asyncio.run(fetch_overview(coordinator))
+
     # Example 1: Get workflow status overview
     print("\n1. Getting workflow status overview...")
-    status_counts = coordinator.get_workflow_status()
     for status, count in status_counts.items():
         print(f"   {status.value}: {count} issues")
 
     # Example 2: Get issues ready for ai-coder
     print("\n2. Getting issues ready for ai-coder...")
-    todo_issues = coordinator.get_todo_issues()
     print(f"   Found {len(todo_issues)} issues in ToDo status")
     for issue in todo_issues[:3]:  # Show first 3
         print(f"   - #{issue.number}: {issue.title}")
@@ -55,7 +68,6 @@ def main():
 
     # Example 4: Get issues assigned to ai-coder
     print("\n4. Getting issues assigned to ai-coder...")
-    coder_issues = coordinator.get_issues_for_ai(AiaType.AI_CODER, WorkflowStatus.DOING)
     print(f"   Found {len(coder_issues)} issues assigned to ai-coder")
     for issue in coder_issues[:3]:  # Show first 3
         print(f"   - #{issue.number}: {issue.title}")
@@ -73,7 +85,6 @@ def main():
 
     # Example 6: Get issues assigned to ai-reviewer
     print("\n6. Getting issues assigned to ai-reviewer...")
-    reviewer_issues = coordinator.get_issues_for_ai(AiaType.AI_REVIEWER, WorkflowStatus.REVIEW)
     print(f"   Found {len(reviewer_issues)} issues assigned to ai-reviewer")
     for issue in reviewer_issues[:3]:  # Show first 3
         print(f"   - #{issue.number}: {issue.title}")
@@ -91,7 +102,6 @@ def main():
 
     # Example 8: Get issues assigned to ai-tester
     print("\n8. Getting issues assigned to ai-tester...")
-    tester_issues = coordinator.get_issues_for_ai(AiaType.AI_TESTER, WorkflowStatus.TESTING)
     print(f"   Found {len(tester_issues)} issues assigned to ai-tester")
     for issue in tester_issues[:3]:  # Show first 3
         print(f"   - #{issue.number}: {issue.title}")
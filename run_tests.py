@@ -1,46 +1,67 @@
 #!/usr/bin/env python3
 """Test runner script for AIA project."""
 
+import io
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 
-def run_command(command, description):
-    """Run a command and print results."""
-    print(f"\n🔧 {description}")
-    print("=" * (len(description) + 4))
+def run_command(command, description, output):
+    """Run a command, streaming its combined stdout/stderr into output, and return its success."""
+    output.write(f"\n🔧 {description}\n")
+    output.write("=" * (len(description) + 4) + "\n")
 
     try:
-        result = subprocess.run(command, shell=True, check=True, capture_output=True, text=True)
-        print(result.stdout)
-        return True
-    except subprocess.CalledProcessError as e:
-        print(f"❌ Error: {e}")
-        if e.stderr:
-            print(f"stderr: {e.stderr}")
+        with subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True) as process:
+            for line in process.stdout:
+                output.write(line)
+            return_code = process.wait()
+    except OSError as e:
+        output.write(f"❌ Error: {e}\n")
         return False
 
+    if return_code != 0:
+        output.write(f"❌ Error: command {command} returned non-zero exit status {return_code}\n")
+    return return_code == 0
+
+
+def run_group(commands):
+    """Run commands one after another into a private buffer, returning success count and report."""
+    output = io.StringIO()
+    success_count = sum(run_command(command, description, output) for command, description in commands)
+    return success_count, output.getvalue()
+
 
 def main():
     """Run all tests and checks."""
     print("🧪 AIA Test Suite")
     print("=" * 20)
 
-    commands = [
-        ("uv run pytest -v --no-cov", "Running pytest unit tests"),
-        ("uv run pytest --cov --cov-report=xml", "Running tests with coverage"),
-        ("uv run ruff check src tests", "Running ruff linting"),
-        ("uv run ruff format --check src tests", "Checking code formatting"),
+    # Commands in one group run serially; groups run concurrently.
+    # Both pytest runs share .pytest_cache and coverage data, so they stay in one group.
+    groups = [
+        [
+            (["uv", "run", "pytest", "-v", "--no-cov"], "Running pytest unit tests"),
+            (["uv", "run", "pytest", "--cov", "--cov-report=xml"], "Running tests with coverage"),
+        ],
+        [(["uv", "run", "ruff", "check", "src", "tests"], "Running ruff linting")],
+        [(["uv", "run", "ruff", "format", "--check", "src", "tests"], "Checking code formatting")],
     ]
+    total = sum(len(group) for group in groups)
 
     success_count = 0
-    for command, description in commands:
-        if run_command(command, description):
-            success_count += 1
+    with ThreadPoolExecutor(max_workers=len(groups)) as executor:
+        futures = [executor.submit(run_group, group) for group in groups]
+        for future in as_completed(futures):
+            # Each group reports as one block, so concurrent output never interleaves
+            group_success_count, report = future.result()
+            sys.stdout.write(report)
+            success_count += group_success_count
 
-    print(f"\n📊 Results: {success_count}/{len(commands)} checks passed")
+    print(f"\n📊 Results: {success_count}/{total} checks passed")
 
-    if success_count == len(commands):
+    if success_count == total:
         print("✅ All tests and checks passed!")
         return 0
     else:
@@ -5,14 +5,61 @@ This script allows you to clone aia into any repository and quickly configure
 the AI assistant workflow for that specific repository.
 """
 
+import hashlib
 import json
+import os
 import subprocess
 import sys
+import time
 from pathlib import Path
 
 
+# Repository node id and one page of existing label names, followed via pageInfo before creating labels
+LABELS_QUERY = """
+query($owner: String!, $name: String!, $cursor: String) {
+  repository(owner: $owner, name: $name) {
+    id
+    labels(first: 100, after: $cursor) { nodes { name } pageInfo { hasNextPage endCursor } }
+  }
+}
+"""
+
+
+CACHE_PATH = Path.home() / ".cache" / "aia" / "setup_repo_workflow.json"
+# Kept short: a revoked or keyring-held token changes auth without touching hosts.yml
+GH_AUTH_TTL_SECONDS = 300
+
+
+def _load_cache() -> dict:
+    """Load cached setup results, empty if missing or unreadable."""
+    try:
+        return json.loads(CACHE_PATH.read_bytes())
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_cache(entry: str, value: dict) -> None:
+    """Persist one cached setup result; caching is best effort."""
+    cache = _load_cache()
+    cache[entry] = value
+    try:
+        CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        CACHE_PATH.write_text(json.dumps(cache))
+    except OSError:
+        pass
+
+
 def get_current_repo_info() -> tuple[str, str]:
-    """Get current repository owner and name from git remote."""
+    """Get current repository owner and name from git remote.
+
+    Cached under the hash of .git/config, which holds the remote URL.
+    """
+    git_config = Path(".git/config")
+    key = hashlib.sha256(git_config.read_bytes()).hexdigest() if git_config.is_file() else None
+    cached = _load_cache().get("repo_info")
+    if key and cached and cached.get("key") == key:
+        return cached["owner"], cached["repo"]
+
     try:
         # Get remote URL
         result = subprocess.run(["git", "remote", "get-url", "origin"], capture_output=True, text=True, check=True)
@@ -30,6 +77,8 @@ def get_current_repo_info() -> tuple[str, str]:
             raise ValueError(f"Unsupported remote URL format: {remote_url}")
 
         owner, repo_name = repo_part.split("/")
+        if key:
+            _save_cache("repo_info", {"key": key, "owner": owner, "repo": repo_name})
         return owner, repo_name
 
     except subprocess.CalledProcessError as e:
@@ -41,23 +90,38 @@ def get_current_repo_info() -> tuple[str, str]:
 
 
 def check_github_cli() -> bool:
-    """Check if GitHub CLI is installed and authenticated."""
+    """Check if GitHub CLI is installed and authenticated.
+
+    A successful check is reused for five minutes unless gh's hosts.yml changes (login/logout).
+    """
+    hosts_file = Path(os.environ.get("GH_CONFIG_DIR", Path.home() / ".config" / "gh")) / "hosts.yml"
     try:
-        subprocess.run(["gh", "auth", "status"], capture_output=True, check=True)
+        hosts_mtime = hosts_file.stat().st_mtime
+    except OSError:
+        hosts_mtime = None
+    cached = _load_cache().get("gh_auth")
+    if hosts_mtime and cached and cached.get("mtime") == hosts_mtime and time.time() - cached.get("checked", 0) < GH_AUTH_TTL_SECONDS:
         return True
+
+    try:
+        subprocess.run(["gh", "auth", "status"], capture_output=True, check=True)
     except (subprocess.CalledProcessError, FileNotFoundError):
         return False
 
+    if hosts_mtime:
+        _save_cache("gh_auth", {"mtime": hosts_mtime, "checked": time.time()})
+    return True
+
 
 def get_project_boards(owner: str, repo: str) -> list[dict]:
     """Get available project boards for the repository."""
     try:
         # List organization/user projects
         cmd = ["gh", "project", "list", "--owner", owner, "--format", "json"]
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+        result = subprocess.run(cmd, capture_output=True, check=True)
 
-        projects = json.loads(result.stdout)
-        return projects
+        # json.loads decodes the raw UTF-8 output directly; gh wraps the list in {"projects": [...]}
+        return json.loads(result.stdout).get("projects", [])
 
     except subprocess.CalledProcessError:
         return []
@@ -71,7 +135,7 @@ def create_project_board(owner: str, repo: str) -> int | None:
         # Create project
         cmd = ["gh", "project", "create", "--owner", owner, "--title", f"{repo} - AI Assistant Workflow", "--format", "json"]
 
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+        result = subprocess.run(cmd, capture_output=True, check=True)
         project_data = json.loads(result.stdout)
         project_number = project_data["number"]
 
@@ -79,10 +143,56 @@ def create_project_board(owner: str, repo: str) -> int | None:
         return project_number
 
     except subprocess.CalledProcessError as e:
-        print(f"❌ Failed to create project board: {e.stderr}")
+        print(f"❌ Failed to create project board: {e.stderr.decode(errors='replace')}")
         return None
 
 
+def gh_graphql(query: str, **variables: str) -> dict:
+    """Run a GraphQL query through the GitHub CLI and return its data."""
+    cmd = ["gh", "api", "graphql", "-f", f"query={query}"]
+    for name, value in variables.items():
+        cmd.extend(["-f", f"{name}={value}"])
+    result = subprocess.run(cmd, capture_output=True, check=True)
+    return json.loads(result.stdout)["data"]
+
+
+def create_labels(owner: str, repo: str, labels: list[tuple[str, str, str]]) -> int:
+    """Create missing labels with one query for existing labels and one batched mutation.
+
+    Returns:
+        Number of labels created
+    """
+    try:
+        repository = gh_graphql(LABELS_QUERY, owner=owner, name=repo)["repository"]
+        existing = {label["name"].lower() for label in repository["labels"]["nodes"]}
+        page_info = repository["labels"]["pageInfo"]
+        while page_info["hasNextPage"]:
+            page = gh_graphql(LABELS_QUERY, owner=owner, name=repo, cursor=page_info["endCursor"])["repository"]["labels"]
+            existing.update(label["name"].lower() for label in page["nodes"])
+            page_info = page["pageInfo"]
+
+        missing = [label for label in labels if label[0].lower() not in existing]
+        if not missing:
+            return 0
+
+        params = ["$repositoryId: ID!"]
+        fields = []
+        variables = {"repositoryId": repository["id"]}
+        for i, (label_name, color, description) in enumerate(missing):
+            params.append(f"$n{i}: String!, $c{i}: String!, $d{i}: String")
+            label_input = f"repositoryId: $repositoryId, name: $n{i}, color: $c{i}, description: $d{i}"
+            fields.append(f"l{i}: createLabel(input: {{{label_input}}}) {{ label {{ id }} }}")
+            variables.update({f"n{i}": label_name, f"c{i}": color, f"d{i}": description})
+
+        mutation = f"mutation({', '.join(params)}) {{ {' '.join(fields)} }}"
+        gh_graphql(mutation, **variables)
+        return len(missing)
+
+    except subprocess.CalledProcessError as e:
+        print(f"❌ Failed to create labels: {e.stderr.decode(errors='replace')}")
+        return 0
+
+
 def setup_repository_workflow():
     """Main setup function for repository AI workflow."""
     print("🚀 Setting up AI Assistant Workflow for Repository")
@@ -169,8 +279,7 @@ def setup_repository_workflow():
 
     # Save configuration
     config_path = Path(".aia_config.json")
-    with open(config_path, "w") as f:
-        json.dump(config_data, f, indent=2)
+    config_path.write_text(json.dumps(config_data, indent=2))
 
     print(f"\\n✅ Configuration saved to {config_path}")
 
@@ -189,15 +298,7 @@ def setup_repository_workflow():
         ("assigned:ai-marketeer", "ff9aa2", "Assigned to AI marketeer"),
     ]
 
-    created_count = 0
-    for label_name, color, description in required_labels:
-        try:
-            cmd = ["gh", "label", "create", label_name, "--repo", f"{owner}/{repo_name}", "--color", color, "--description", description]
-            subprocess.run(cmd, capture_output=True, check=True)
-            created_count += 1
-        except subprocess.CalledProcessError:
-            # Label probably already exists
-            pass
+    created_count = create_labels(owner, repo_name, required_labels)
 
     print(f"✅ Repository labels configured ({created_count} new labels created)")
 
@@ -17,14 +17,39 @@ Example:
         from aia import WorkflowCoordinator, WorkflowConfig
 
         config = WorkflowConfig(repo_owner="user", repo_name="repo", project_number=1)
-        coordinator = WorkflowCoordinator("github", config)
-        result = coordinator.start_coder_workflow(123)
+        with WorkflowCoordinator(config, "github") as coordinator:
+            result = coordinator.start_coder_workflow(123)
 """
 
-from aia.workflow_coordinator import WorkflowCoordinator
-from aia.git_aia_manager import AiaType, GitBranchType, AiaManagerFactory
+import importlib
+from typing import TYPE_CHECKING
+
 from aia.models import WorkflowConfig, WorkflowStatus, Issue, GitOperation
 
+if TYPE_CHECKING:
+    from aia.workflow_coordinator import WorkflowCoordinator
+    from aia.async_workflow_coordinator import AsyncWorkflowCoordinator
+    from aia.git_aia_manager import AiaType, GitBranchType, AiaManagerFactory
+
+
+# Exports imported on first access, so the CLI starts without loading the managers and asyncio
+_LAZY_EXPORTS = {
+    "WorkflowCoordinator": "aia.workflow_coordinator",
+    "AsyncWorkflowCoordinator": "aia.async_workflow_coordinator",
+    "AiaType": "aia.git_aia_manager",
+    "GitBranchType": "aia.git_aia_manager",
+    "AiaManagerFactory": "aia.git_aia_manager",
+}
+
+
+def __getattr__(name: str):
+    """Import lazily exported names on first access."""
+    if name in _LAZY_EXPORTS:
+        value = getattr(importlib.import_module(_LAZY_EXPORTS[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 def main() -> None:
     """Main entry point for the CLI interface.
@@ -38,6 +63,7 @@ def main() -> None:
 
 __all__ = [
     "WorkflowCoordinator",
+    "AsyncWorkflowCoordinator",
     "AiaType",
     "GitBranchType",
     "AiaManagerFactory",
@@ -1,8 +1,18 @@
 """Common functionality."""
 
 # Standard library imports
+import functools
+import inspect
 import logging
-import timeit
+import os
+import time
+
+
+# -----------------------------------------------------------------------------
+# constants
+# -----------------------------------------------------------------------------
+# Set (e.g. AIA_TRACE=1) to wrap the public methods of TracedMeta classes in function_trace
+TRACE_ENV_VAR = "AIA_TRACE"
 
 
 # -----------------------------------------------------------------------------
@@ -11,20 +21,45 @@ import timeit
 def function_trace(original_function):
     """Decorator function to help to trace function call entry and exit.
 
+    Logging may be configured after decoration, so the INFO level check is made per call.
+
     Args:
         original_function (_type_): function above which the decorator is defined
     """
+    name = original_function.__name__
+    _logger = logging.getLogger(name)
 
+    @functools.wraps(original_function)
     def function_wrapper(*args, **kwargs):
-        _logger = logging.getLogger(original_function.__name__)
-        _logger.info(f"Entering {original_function.__name__}")
+        if not _logger.isEnabledFor(logging.INFO):
+            return original_function(*args, **kwargs)
+        _logger.info("Entering %s", name)
         result = original_function(*args, **kwargs)
-        _logger.info(f"Exiting {original_function.__name__}")
+        _logger.info("Exiting %s", name)
         return result
 
     return function_wrapper
 
 
+class TracedMeta(type):
+    """Metaclass applying function_trace to the public methods of a class.
+
+    Methods are wrapped once, at class creation, and only when the AIA_TRACE
+    environment variable is set; otherwise the class is built unchanged.
+    """
+
+    def __new__(mcs, name, bases, namespace, **kwargs):
+        """Create the class, tracing its public synchronous methods if enabled."""
+        if os.environ.get(TRACE_ENV_VAR):
+            namespace = {
+                key: function_trace(value)
+                if inspect.isfunction(value) and not inspect.iscoroutinefunction(value) and not key.startswith("_")
+                else value
+                for key, value in namespace.items()
+            }
+        return super().__new__(mcs, name, bases, namespace, **kwargs)
+
+
 class PerformanceTimer:
     """Performance Times class."""
 
@@ -35,12 +70,13 @@ class PerformanceTimer:
 
     def __enter__(self):
         """Enter for performance timer."""
-        self.start = timeit.default_timer()
+        self.start = time.perf_counter_ns()
 
     def __exit__(self, exc_type, exc_value, traceback):
         """Exit for performance timer."""
-        time_took = (timeit.default_timer() - self.start) * 1000.0
-        self._logger.info(f"Executing {self._timer_name} took {str(time_took)} ms")
+        elapsed_ns = time.perf_counter_ns() - self.start
+        if self._logger.isEnabledFor(logging.INFO):
+            self._logger.info("Executing %s took %.3f ms", self._timer_name, elapsed_ns / 1_000_000)
 
 
 if __name__ == "__main__":
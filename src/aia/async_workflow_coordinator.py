@@ -0,0 +1,117 @@
+"""Async workflow coordinator for AI assistant collaboration.
+
+Exposes the WorkflowCoordinator operations as coroutines so commands that work
+on many issues at once can overlap their provider round-trips with asyncio.gather.
+"""
+
+import asyncio
+from collections.abc import Iterable
+
+from aia.cache import IssueCache
+from aia.gh_client import GhHttpClient
+from aia.git_aia_manager import AiaType
+from aia.models import Issue, WorkflowConfig, WorkflowStatus, GitOperation
+from aia.webhook_server import WorkflowCache
+from aia.workflow_coordinator import WorkflowCoordinator
+
+
+class AsyncWorkflowCoordinator:
+    """Coordinates workflow between AI assistants with coroutine methods.
+
+    Each method runs the matching WorkflowCoordinator method in a worker thread
+    through the coordinator's own provider call limit, so these coroutines and the
+    coordinator's *_async methods share one bound, MAX_CONCURRENT_PROVIDER_CALLS.
+    Managers, caches and the keep-alive HTTP client are shared as well.
+
+    Args:
+        config: Workflow configuration with repository settings
+        provider: Git provider name ("github", "gitlab", "bitbucket")
+        cache: Optional workflow cache kept warm by the webhook server
+        issue_cache: ETag cache for single issue reads, see WorkflowCoordinator
+        http_client: Keep-alive GitHub API client, see WorkflowCoordinator
+    """
+
+    def __init__(
+        self,
+        config: WorkflowConfig,
+        provider: str = "github",
+        cache: WorkflowCache | None = None,
+        issue_cache: IssueCache | None = None,
+        http_client: GhHttpClient | None = None,
+    ):
+        """Initialize async coordinator around a synchronous WorkflowCoordinator."""
+        self.coordinator = WorkflowCoordinator(config, provider, cache, issue_cache, http_client)
+        self._run = self.coordinator._run_provider_call
+
+    async def __aenter__(self) -> "AsyncWorkflowCoordinator":
+        """Enter context, returning the coordinator."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        """Exit context, closing the HTTP client connection."""
+        self.coordinator.__exit__(exc_type, exc_value, traceback)
+
+    async def get_issues(self, issue_numbers: Iterable[int], ai_type: AiaType = AiaType.AI_CODER) -> list[Issue | None]:
+        """Fetch several issues concurrently.
+
+        Args:
+            issue_numbers: Issue numbers to fetch
+            ai_type: AI assistant type whose manager fetches the issues
+
+        Returns:
+            Issues in the order of issue_numbers, None for issues not found
+        """
+        manager = self.coordinator.get_manager(ai_type)
+        return list(await asyncio.gather(*(self._run(manager.get_issue, number) for number in issue_numbers)))
+
+    async def start_coder_workflow(self, issue_number: int) -> GitOperation:
+        """Async variant of WorkflowCoordinator.start_coder_workflow."""
+        return await self._run(self.coordinator.start_coder_workflow, issue_number)
+
+    async def complete_coder_workflow(self, issue_number: int) -> GitOperation:
+        """Async variant of WorkflowCoordinator.complete_coder_workflow."""
+        return await self._run(self.coordinator.complete_coder_workflow, issue_number)
+
+    async def complete_reviewer_workflow(self, issue_number: int) -> GitOperation:
+        """Async variant of WorkflowCoordinator.complete_reviewer_workflow."""
+        return await self._run(self.coordinator.complete_reviewer_workflow, issue_number)
+
+    async def complete_tester_workflow(self, issue_number: int, pr_title: str, pr_body: str) -> GitOperation:
+        """Async variant of WorkflowCoordinator.complete_tester_workflow."""
+        return await self._run(self.coordinator.complete_tester_workflow, issue_number, pr_title, pr_body)
+
+    async def assign_researcher_to_issue(self, issue_number: int) -> GitOperation:
+        """Async variant of WorkflowCoordinator.assign_researcher_to_issue."""
+        return await self._run(self.coordinator.assign_researcher_to_issue, issue_number)
+
+    async def complete_research_workflow(self, issue_number: int) -> GitOperation:
+        """Async variant of WorkflowCoordinator.complete_research_workflow."""
+        return await self._run(self.coordinator.complete_research_workflow, issue_number)
+
+    async def get_issues_for_ai(self, ai_type: AiaType, status: WorkflowStatus | None = None) -> list[Issue]:
+        """Async variant of WorkflowCoordinator.get_issues_for_ai."""
+        return await self.coordinator.get_issues_for_ai_async(ai_type, status)
+
+    async def get_todo_issues(self) -> list[Issue]:
+        """Async variant of WorkflowCoordinator.get_todo_issues."""
+        return await self.coordinator.get_todo_issues_async()
+
+    async def get_workflow_status(self) -> dict[WorkflowStatus, int]:
+        """Async variant of WorkflowCoordinator.get_workflow_status."""
+        return await self.coordinator.get_workflow_status_async()
+
+    async def get_workflow_status_counts(self) -> dict[WorkflowStatus, int]:
+        """Async variant of WorkflowCoordinator.get_workflow_status_counts."""
+        return await self.coordinator.get_workflow_status_counts_async()
+
+    async def trigger_ai_coder(self) -> GitOperation:
+        """Async variant of WorkflowCoordinator.trigger_ai_coder."""
+        return await self._run(self.coordinator.trigger_ai_coder)
+
+    async def trigger_ai_reviewer(self) -> GitOperation:
+        """Async variant of WorkflowCoordinator.trigger_ai_reviewer."""
+        return await self._run(self.coordinator.trigger_ai_reviewer)
+
+    async def trigger_ai_tester(self) -> GitOperation:
+        """Async variant of WorkflowCoordinator.trigger_ai_tester."""
+        return await self._run(self.coordinator.trigger_ai_tester)
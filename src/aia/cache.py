@@ -0,0 +1,93 @@
+"""Persistent issue cache for conditional GitHub requests.
+
+Stores the last REST payload and ETag of each issue so later reads can send
+``If-None-Match`` and reuse the stored payload when GitHub answers 304 Not Modified.
+304 responses carry no body and don't count against the API rate limit.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+
+DEFAULT_CACHE_PATH = Path.home() / ".cache" / "aia" / "issues.sqlite"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS issues (
+    repo TEXT NOT NULL,
+    number INTEGER NOT NULL,
+    etag TEXT NOT NULL,
+    payload_json TEXT NOT NULL,
+    fetched_at REAL NOT NULL,
+    PRIMARY KEY (repo, number)
+)
+"""
+
+
+class IssueCache:
+    """SQLite backed store of issue payloads keyed by repository and issue number.
+
+    Args:
+        path: Database file, ":memory:" for a process local cache
+    """
+
+    def __init__(self, path: Path | str = DEFAULT_CACHE_PATH):
+        """Open (and create if needed) the cache database."""
+        if str(path) != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(str(path), check_same_thread=False)
+        with self._connection:
+            self._connection.execute(_SCHEMA)
+
+    def get(self, repo: str, number: int) -> tuple[str, dict[str, Any]] | None:
+        """Get the cached ETag and payload of an issue.
+
+        Args:
+            repo: Repository in owner/name form
+            number: Issue number
+
+        Returns:
+            Tuple of (etag, payload) or None if the issue is not cached
+        """
+        with self._lock:
+            row = self._connection.execute("SELECT etag, payload_json FROM issues WHERE repo = ? AND number = ?", (repo, number)).fetchone()
+        if row is None:
+            return None
+        return row[0], json.loads(row[1])
+
+    def put(self, repo: str, number: int, etag: str, payload: dict[str, Any]) -> None:
+        """Store the ETag and payload of an issue.
+
+        Args:
+            repo: Repository in owner/name form
+            number: Issue number
+            etag: ETag header returned with the payload
+            payload: Issue payload
+        """
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO issues (repo, number, etag, payload_json, fetched_at) VALUES (?, ?, ?, ?, ?)",
+                (repo, number, etag, json.dumps(payload), time.time()),
+            )
+
+    def invalidate(self, repo: str, number: int | None = None) -> None:
+        """Drop one issue, or every issue of a repository, from the cache.
+
+        Args:
+            repo: Repository in owner/name form
+            number: Issue number, None for the whole repository
+        """
+        with self._lock, self._connection:
+            if number is None:
+                self._connection.execute("DELETE FROM issues WHERE repo = ?", (repo,))
+            else:
+                self._connection.execute("DELETE FROM issues WHERE repo = ? AND number = ?", (repo, number))
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._connection.close()
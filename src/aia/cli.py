@@ -5,16 +5,39 @@ and automating the AI assistant workflow.
 """
 
 import argparse
+import hashlib
 import json
 import os
+import re
+import shutil
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache, cached_property
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from aia.git_aia_manager import AiaManagerFactory, AiaType
-from aia.github_app_setup import GitHubAppSetup
+# Managers and the coordinator are imported by the commands that use them, keeping help and info fast
 from aia.models import WorkflowConfig
-from aia.workflow_coordinator import WorkflowCoordinator
+
+if TYPE_CHECKING:
+    from aia.git_aia_manager import AiaManagerBase, AiaType
+
+
+# Environment variables configuring the repository, read by config loading and info
+CONFIG_ENV_VARS = ("GITHUB_REPO_OWNER", "GITHUB_REPO_NAME", "GITHUB_PROJECT_NUMBER")
+
+# Directory of origin remote URLs cached per working directory, reused while .git/config is unchanged
+REMOTE_CACHE_DIR = Path.home() / ".cache" / "aia"
+
+# GitHub HTTPS or SSH remote URL, capturing owner and repository name without ".git"
+_GITHUB_REMOTE_RE = re.compile(r"(?:https://github\.com/|git@github\.com:)([^/]+)/([^/\s]+?)(?:\.git)?$")
+
+
+@cache
+def _gh_path() -> str:
+    """Path of the gh executable, looked up on PATH once per process."""
+    return shutil.which("gh") or "gh"
 
 
 class AiaCLI:
@@ -23,20 +46,18 @@ class AiaCLI:
     def __init__(self):
         """Initialize CLI with configuration."""
         self.config = self._load_config()
-        self.github_app_setup = GitHubAppSetup()
+        self._managers: dict[tuple, AiaManagerBase] = {}
 
     def _load_config(self) -> WorkflowConfig | None:
         """Load workflow configuration from environment or config file."""
         # Try environment variables first
-        repo_owner = os.getenv("GITHUB_REPO_OWNER")
-        repo_name = os.getenv("GITHUB_REPO_NAME")
-        project_number = os.getenv("GITHUB_PROJECT_NUMBER")
+        repo_owner, repo_name, project_number = self.config_env.values()
 
         if repo_owner and repo_name:
             return WorkflowConfig(
                 repo_owner=repo_owner,
                 repo_name=repo_name,
-                project_number=int(project_number) if project_number else None,
+                project_number=int(project_number) if project_number and project_number.isdigit() else None,
                 default_base_branch=os.getenv("DEFAULT_BASE_BRANCH", "main"),
             )
 
@@ -44,8 +65,7 @@ class AiaCLI:
         config_path = Path(".aia_config.json")
         if config_path.exists():
             try:
-                with open(config_path, encoding="utf-8") as f:
-                    config_data = json.load(f)
+                config_data = json.loads(config_path.read_bytes())
 
                 return WorkflowConfig(
                     repo_owner=config_data["repo_owner"],
@@ -57,30 +77,82 @@ class AiaCLI:
                 print(f"Error loading config: {e}")
 
         # Try auto-detecting from git remote
+        match = _GITHUB_REMOTE_RE.match(self.git_remote_url or "")
+        if match:
+            owner, name = match.groups()
+            print(f"🔍 Auto-detected repository: {owner}/{name}")
+            print("💡 Run 'aia setup' to configure the AI workflow for this repository")
+
+            return WorkflowConfig(repo_owner=owner, repo_name=name, project_number=None, default_base_branch="main")
+
+        return None
+
+    @cached_property
+    def config_env(self) -> dict[str, str | None]:
+        """Snapshot of the CONFIG_ENV_VARS environment variables, in CONFIG_ENV_VARS order."""
+        env = os.environ
+        return {name: env.get(name) for name in CONFIG_ENV_VARS}
+
+    @cached_property
+    def git_remote_url(self) -> str | None:
+        """URL of the origin remote, read with one git call shared by config detection and info.
+
+        The URL is cached on disk per working directory and reused while the
+        repository's .git/config keeps its modification time.
+        """
+        cwd = Path.cwd()
+        git_config = next((path / ".git" / "config" for path in (cwd, *cwd.parents) if (path / ".git" / "config").is_file()), None)
+        if git_config is None:
+            return self._read_git_remote_url()
+
+        cache_path = REMOTE_CACHE_DIR / f"remote-{hashlib.sha256(str(cwd).encode()).hexdigest()[:16]}.json"
+        key = {"git_config": str(git_config), "mtime_ns": git_config.stat().st_mtime_ns}
         try:
-            result = subprocess.run(["git", "remote", "get-url", "origin"], capture_output=True, text=True, check=True)
-
-            remote_url = result.stdout.strip()
-
-            # Parse GitHub URL
-            if "github.com" in remote_url:
-                if remote_url.startswith("https://github.com/"):
-                    repo_part = remote_url.replace("https://github.com/", "").replace(".git", "")
-                elif remote_url.startswith("git@github.com:"):
-                    repo_part = remote_url.replace("git@github.com:", "").replace(".git", "")
-                else:
-                    return None
-
-                if "/" in repo_part:
-                    owner, name = repo_part.split("/", 1)
-                    print(f"🔍 Auto-detected repository: {owner}/{name}")
-                    print("💡 Run 'aia setup' to configure the AI workflow for this repository")
-
-                    return WorkflowConfig(repo_owner=owner, repo_name=name, project_number=None, default_base_branch="main")
-        except subprocess.CalledProcessError:
+            cached = json.loads(cache_path.read_text(encoding="utf-8"))
+            if cached["key"] == key:
+                return cached["remote_url"]
+        except (OSError, ValueError, KeyError, TypeError):
             pass
 
-        return None
+        remote_url = self._read_git_remote_url()
+        if remote_url is not None:
+            try:
+                cache_path.parent.mkdir(parents=True, exist_ok=True)
+                cache_path.write_text(json.dumps({"key": key, "remote_url": remote_url}), encoding="utf-8")
+            except OSError:
+                pass
+        return remote_url
+
+    @staticmethod
+    def _read_git_remote_url() -> str | None:
+        """Run git to read the origin remote URL, None if there is no repository or remote."""
+        try:
+            result = subprocess.run(["git", "remote", "get-url", "origin"], capture_output=True, check=False)
+        except FileNotFoundError:
+            return None
+        # Outside a repository, or without an origin remote, git exits non-zero
+        return result.stdout.decode(errors="replace").strip() if result.returncode == 0 else None
+
+    @cached_property
+    def github_app_setup(self):
+        """GitHub App setup helper, imported and created only for the commands that use it.
+
+        With GITHUB_TOKEN set it calls the GitHub API directly instead of through gh.
+        """
+        from aia.gh_client import GhHttpClient
+        from aia.github_app_setup import GitHubAppSetup
+
+        token = os.getenv("GITHUB_TOKEN")
+        return GitHubAppSetup(http_client=GhHttpClient(token=token) if token else None)
+
+    def _get_manager(self, provider: str, ai_type: "AiaType", config: WorkflowConfig) -> "AiaManagerBase":
+        """Get a manager, created once per provider, AI type and repository for this CLI run."""
+        from aia.git_aia_manager import AiaManagerFactory
+
+        key = (provider, ai_type, config.repo_full_name, config.project_number)
+        if key not in self._managers:
+            self._managers[key] = AiaManagerFactory.create_manager(provider, ai_type, config)
+        return self._managers[key]
 
     def _ensure_config(self) -> WorkflowConfig:
         """Ensure configuration is available or exit."""
@@ -92,6 +164,8 @@ class AiaCLI:
 
     def setup_command(self, _args) -> None:
         """Set up GitHub project and AI assistant workflow."""
+        from aia.git_aia_manager import AiaType
+
         print("🚀 Setting up AI Assistant Workflow...")
 
         # Interactive setup
@@ -115,25 +189,27 @@ class AiaCLI:
             "default_base_branch": config.default_base_branch,
         }
 
-        with open(config_path, "w", encoding="utf-8") as f:
-            json.dump(config_data, f, indent=2)
+        config_path.write_text(json.dumps(config_data, indent=2), encoding="utf-8")
 
         print(f"✅ Configuration saved to {config_path}")
 
-        # Set up GitHub App
-        print("\n🔧 Setting up GitHub App...")
-        setup_result = self.github_app_setup.setup_github_app_complete(config.repo_full_name)
+        # Set up GitHub App while the independent project board validation runs in the background
+        manager = self._get_manager("github", AiaType.AI_CODER, config)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            validation_future = executor.submit(manager.validate_project_board_setup)
 
-        if setup_result.success:
-            print("✅ GitHub App setup completed")
-            print(f"📝 Setup details:\n{setup_result.output}")
-        else:
-            print(f"❌ GitHub App setup failed: {setup_result.message}")
+            print("\n🔧 Setting up GitHub App...")
+            setup_result = self.github_app_setup.setup_github_app_complete(config.repo_full_name)
 
-        # Validate project board
-        print("\n🔍 Validating project board...")
-        manager = AiaManagerFactory.create_manager("github", AiaType.AI_CODER, config)
-        validation_result = manager.validate_project_board_setup()
+            if setup_result.success:
+                print("✅ GitHub App setup completed")
+                print(f"📝 Setup details:\n{setup_result.output}")
+            else:
+                print(f"❌ GitHub App setup failed: {setup_result.message}")
+
+            # Validate project board
+            print("\n🔍 Validating project board...")
+            validation_result = validation_future.result()
 
         if validation_result.success:
             print(f"✅ Project board validated: {validation_result.message}")
@@ -142,13 +218,15 @@ class AiaCLI:
 
     def status_command(self, args) -> None:
         """Show project board status and workflow information."""
+        from aia.git_aia_manager import AiaType
+
         config = self._ensure_config()
 
         print(f"📊 Project Board Status: {config.repo_full_name}")
         print("=" * 50)
 
         # Get project board info
-        manager = AiaManagerFactory.create_manager("github", AiaType.AI_CODER, config)
+        manager = self._get_manager("github", AiaType.AI_CODER, config)
         board_info = manager.get_project_board_info()
 
         if "error" in board_info:
@@ -168,6 +246,9 @@ class AiaCLI:
 
     def trigger_command(self, args) -> None:
         """Trigger AI assistant to work on issues."""
+        from aia.git_aia_manager import AIA_TYPE_VALUES, AiaType
+        from aia.workflow_coordinator import WorkflowCoordinator
+
         config = self._ensure_config()
 
         # Parse AI type
@@ -175,26 +256,26 @@ class AiaCLI:
             ai_type = AiaType(args.ai_type)
         except ValueError:
             print(f"❌ Invalid AI type: {args.ai_type}")
-            print(f"Available types: {', '.join([t.value for t in AiaType])}")
+            print(f"Available types: {', '.join(AIA_TYPE_VALUES)}")
             return
 
         print(f"🤖 Triggering {ai_type.value} workflow...")
 
         # Create workflow coordinator
-        coordinator = WorkflowCoordinator(config, "github")
-
-        if args.ai_type == "ai-coder":
-            # AI Coder: Pick up top priority ToDo issue
-            result = coordinator.trigger_ai_coder()
-        elif args.ai_type == "ai-reviewer":
-            # AI Reviewer: Review issues in Review column
-            result = coordinator.trigger_ai_reviewer()
-        elif args.ai_type == "ai-tester":
-            # AI Tester: Test issues in Testing column
-            result = coordinator.trigger_ai_tester()
-        else:
-            print(f"❌ AI type {args.ai_type} triggering not implemented yet")
-            return
+        with WorkflowCoordinator(config, "github") as coordinator:
+            triggers = {
+                # AI Coder: Pick up top priority ToDo issue
+                AiaType.AI_CODER: coordinator.trigger_ai_coder,
+                # AI Reviewer: Review issues in Review column
+                AiaType.AI_REVIEWER: coordinator.trigger_ai_reviewer,
+                # AI Tester: Test issues in Testing column
+                AiaType.AI_TESTER: coordinator.trigger_ai_tester,
+            }
+            trigger = triggers.get(ai_type)
+            if trigger is None:
+                print(f"❌ AI type {args.ai_type} triggering not implemented yet")
+                return
+            result = trigger()
 
         if result.success:
             print(f"✅ {ai_type.value} workflow completed: {result.message}")
@@ -203,6 +284,8 @@ class AiaCLI:
 
     def validate_command(self, _args) -> None:
         """Validate GitHub App setup and permissions."""
+        from aia.git_aia_manager import AiaType
+
         config = self._ensure_config()
 
         print("🔍 Validating GitHub App setup...")
@@ -215,18 +298,19 @@ class AiaCLI:
 
         print("✅ GitHub App configuration found")
 
-        # Validate permissions
-        permission_result = self.github_app_setup.validate_app_permissions(config.repo_full_name)
+        # Validate permissions and project board; independent API calls, so they run concurrently
+        manager = self._get_manager("github", AiaType.AI_CODER, config)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            permission_future = executor.submit(self.github_app_setup.validate_app_permissions, config.repo_full_name)
+            board_future = executor.submit(manager.validate_project_board_setup)
+        permission_result = permission_future.result()
+        board_result = board_future.result()
 
         if permission_result.success:
             print("✅ GitHub App permissions validated")
         else:
             print(f"❌ Permission validation failed: {permission_result.message}")
 
-        # Validate project board
-        manager = AiaManagerFactory.create_manager("github", AiaType.AI_CODER, config)
-        board_result = manager.validate_project_board_setup()
-
         if board_result.success:
             print(f"✅ Project board access validated: {board_result.message}")
         else:
@@ -248,7 +332,8 @@ class AiaCLI:
 
         # Create issue using GitHub CLI
         try:
-            cmd = ["gh", "issue", "create", "--repo", config.repo_full_name, "--title", title, "--body", body or "No description provided"]
+            gh = _gh_path()
+            cmd = [gh, "issue", "create", "--repo", config.repo_full_name, "--title", title, "--body", body or "No description provided"]
 
             result = subprocess.run(cmd, capture_output=True, text=True, check=True)
 
@@ -265,91 +350,115 @@ class AiaCLI:
 
     def info_command(self, _args) -> None:
         """Show current repository and configuration information."""
-        print("📋 AI Assistant Workflow - Repository Information")
-        print("=" * 50)
+        # Collected and written at once rather than one write per line
+        lines = []
+        lines.append("📋 AI Assistant Workflow - Repository Information")
+        lines.append("=" * 50)
 
         # Show current working directory
-        print(f"📁 Current Directory: {Path.cwd()}")
+        lines.append(f"📁 Current Directory: {Path.cwd()}")
 
         # Show git repository info
-        try:
-            result = subprocess.run(["git", "remote", "get-url", "origin"], capture_output=True, text=True, check=True)
-            print(f"🔗 Git Remote: {result.stdout.strip()}")
-        except subprocess.CalledProcessError:
-            print("⚠️  Not in a git repository or no remote configured")
+        if self.git_remote_url is not None:
+            lines.append(f"🔗 Git Remote: {self.git_remote_url}")
+        else:
+            lines.append("⚠️  Not in a git repository or no remote configured")
 
         # Show current configuration
         if self.config:
-            print(f"✅ Configured Repository: {self.config.repo_full_name}")
-            print(f"📊 Project Number: {self.config.project_number or 'Not configured'}")
-            print(f"🌿 Default Branch: {self.config.default_base_branch}")
+            lines.append(f"✅ Configured Repository: {self.config.repo_full_name}")
+            lines.append(f"📊 Project Number: {self.config.project_number or 'Not configured'}")
+            lines.append(f"🌿 Default Branch: {self.config.default_base_branch}")
         else:
-            print("❌ No AI workflow configuration found")
+            lines.append("❌ No AI workflow configuration found")
 
         # Show configuration file location
         config_path = Path(".aia_config.json")
         if config_path.exists():
-            print(f"⚙️  Config File: {config_path.absolute()}")
+            lines.append(f"⚙️  Config File: {config_path.absolute()}")
         else:
-            print("⚙️  Config File: Not found")
+            lines.append("⚙️  Config File: Not found")
 
         # Show environment variables
-        env_vars = {
-            "GITHUB_REPO_OWNER": os.getenv("GITHUB_REPO_OWNER"),
-            "GITHUB_REPO_NAME": os.getenv("GITHUB_REPO_NAME"),
-            "GITHUB_PROJECT_NUMBER": os.getenv("GITHUB_PROJECT_NUMBER"),
-        }
-
-        active_env_vars = {k: v for k, v in env_vars.items() if v}
+        active_env_vars = {k: v for k, v in self.config_env.items() if v}
         if active_env_vars:
-            print("\n🔧 Active Environment Variables:")
+            lines.append("\n🔧 Active Environment Variables:")
             for key, value in active_env_vars.items():
-                print(f"  {key}: {value}")
+                lines.append(f"  {key}: {value}")
 
         # Show aia installation
-        try:
-            import aia
-
-            print(f"\n🤖 AIA Version: Installed at {Path(aia.__file__).parent}")
-        except ImportError:
-            print("\n❌ AIA not properly installed")
+        from importlib.metadata import PackageNotFoundError, version
 
-    def run(self):
-        """Main CLI entry point."""
-        parser = argparse.ArgumentParser(prog="aia", description="AI Assistant Workflow Management CLI")
+        try:
+            lines.append(f"\n🤖 AIA Version: {version('aia')}, installed at {Path(__file__).parent}")
+        except PackageNotFoundError:
+            lines.append("\n❌ AIA not properly installed")
 
-        subparsers = parser.add_subparsers(dest="command", help="Available commands")
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
 
-        # Setup command
+    def _add_setup_parser(self, subparsers) -> None:
+        """Register the setup command."""
         setup_parser = subparsers.add_parser("setup", help="Set up GitHub project and AI workflow")
         setup_parser.set_defaults(func=self.setup_command)
 
-        # Status command
+    def _add_status_parser(self, subparsers) -> None:
+        """Register the status command."""
         status_parser = subparsers.add_parser("status", help="Show project board status")
         status_parser.add_argument("-v", "--verbose", action="store_true", help="Show detailed issue information")
         status_parser.set_defaults(func=self.status_command)
 
-        # Trigger command
+    def _add_trigger_parser(self, subparsers) -> None:
+        """Register the trigger command."""
+        from aia.git_aia_manager import AIA_TYPE_VALUES
+
         trigger_parser = subparsers.add_parser("trigger", help="Trigger AI assistant workflow")
-        trigger_parser.add_argument("ai_type", choices=[t.value for t in AiaType], help="AI assistant type to trigger")
+        trigger_parser.add_argument("ai_type", choices=AIA_TYPE_VALUES, help="AI assistant type to trigger")
         trigger_parser.set_defaults(func=self.trigger_command)
 
-        # Validate command
+    def _add_validate_parser(self, subparsers) -> None:
+        """Register the validate command."""
         validate_parser = subparsers.add_parser("validate", help="Validate GitHub App setup and permissions")
         validate_parser.set_defaults(func=self.validate_command)
 
-        # Create issue command
+    def _add_create_issue_parser(self, subparsers) -> None:
+        """Register the create-issue command."""
         create_parser = subparsers.add_parser("create-issue", help="Create new issue in Triage column")
         create_parser.add_argument("--title", help="Issue title")
         create_parser.add_argument("--body", help="Issue description")
         create_parser.set_defaults(func=self.create_issue_command)
 
-        # Info command
+    def _add_info_parser(self, subparsers) -> None:
+        """Register the info command."""
         info_parser = subparsers.add_parser("info", help="Show repository and configuration information")
         info_parser.set_defaults(func=self.info_command)
 
+    def run(self, argv: list[str] | None = None):
+        """Main CLI entry point.
+
+        Args:
+            argv: Command line arguments, sys.argv[1:] when not given
+        """
+        argv = sys.argv[1:] if argv is None else argv
+        parser = argparse.ArgumentParser(prog="aia", description="AI Assistant Workflow Management CLI")
+
+        subparsers = parser.add_subparsers(dest="command", help="Available commands")
+
+        parser_builders = {
+            "setup": self._add_setup_parser,
+            "status": self._add_status_parser,
+            "trigger": self._add_trigger_parser,
+            "validate": self._add_validate_parser,
+            "create-issue": self._add_create_issue_parser,
+            "info": self._add_info_parser,
+        }
+        # Only the invoked command needs its parser; the full set is built for top-level help and errors
+        command = argv[0] if argv else None
+        for build_parser in [parser_builders[command]] if command in parser_builders else parser_builders.values():
+            build_parser(subparsers)
+
         # Parse and execute
-        args = parser.parse_args()
+        args = parser.parse_args(argv)
 
         if not args.command:
             parser.print_help()
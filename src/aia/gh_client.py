@@ -0,0 +1,216 @@
+"""Persistent HTTPS client for the GitHub API.
+
+Reuses keep-alive connections to api.github.com for REST and GraphQL requests,
+authenticated with the token of the GitHub CLI, instead of starting a ``gh``
+process (and a new TLS session) for every call. Each request checks a connection
+out of a small pool, so requests from concurrent threads run in parallel.
+"""
+
+import http.client
+import json
+import subprocess
+import threading
+from dataclasses import dataclass
+from typing import Any
+
+
+GITHUB_API_HOST = "api.github.com"
+
+# Idle keep-alive connections kept for reuse, matching the largest worker pool fanning out requests
+MAX_IDLE_CONNECTIONS = 10
+
+# Methods safe to resend after the connection dropped, whether or not GitHub already processed them
+_IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "PUT", "DELETE"})
+
+
+class GhApiError(subprocess.CalledProcessError):
+    """Failed GitHub API request.
+
+    Subclasses CalledProcessError so callers handle gh CLI and HTTP failures alike.
+    """
+
+    def __init__(self, request: str, message: str):
+        """Initialize with the failed request and GitHub's error message."""
+        super().__init__(1, request, stderr=message)
+
+
+def decode_json(body: bytes | str, request: str) -> Any:
+    """Decode a JSON API response body, an empty body decodes to {}.
+
+    Args:
+        body: Raw response body
+        request: Request description for the error
+
+    Raises:
+        GhApiError: If the body is not JSON, e.g. an HTML error page from a proxy
+    """
+    if not body:
+        return {}
+    try:
+        return json.loads(body)
+    except ValueError as e:
+        raise GhApiError(request, f"Invalid JSON response: {e}") from e
+
+
+@dataclass(frozen=True, slots=True)
+class GhResponse:
+    """GitHub API response.
+
+    Attributes:
+        status: HTTP status code
+        headers: Response headers with lower-case names
+        body: Raw response body
+    """
+
+    status: int
+    headers: dict[str, str]
+    body: bytes
+
+
+class GhHttpClient:
+    """Keep-alive GitHub API client authenticated with the gh CLI token.
+
+    Thread safe: every request runs on a connection of its own, taken from the idle pool
+    or opened when the pool is empty, and is returned to the pool afterwards.
+
+    Args:
+        token: API token, read once from `gh auth token` when not given
+        host: API host name
+        timeout: Socket timeout in seconds
+        max_idle: Number of idle connections kept for reuse
+    """
+
+    def __init__(self, token: str | None = None, host: str = GITHUB_API_HOST, timeout: float = 10.0, max_idle: int = MAX_IDLE_CONNECTIONS):
+        """Initialize client; connections are opened on first request."""
+        self._token = token
+        self._host = host
+        self._timeout = timeout
+        self._max_idle = max_idle
+        self._idle: list[http.client.HTTPSConnection] = []
+        self._lock = threading.Lock()
+
+    @property
+    def token(self) -> str:
+        """API token of the authenticated gh CLI user."""
+        if self._token is None:
+            with self._lock:
+                if self._token is None:
+                    try:
+                        result = subprocess.run(["gh", "auth", "token"], capture_output=True, text=True, check=True)
+                    except FileNotFoundError as e:
+                        raise GhApiError("gh auth token", "GitHub CLI not found") from e
+                    self._token = result.stdout.strip()
+        return self._token
+
+    def request(
+        self, method: str, path: str, body: dict[str, Any] | None = None, headers: dict[str, str] | None = None, retry: bool | None = None
+    ) -> GhResponse:
+        """Send a request over a pooled connection.
+
+        Args:
+            method: HTTP method
+            path: API path, e.g. "/repos/owner/repo/issues/1"
+            body: Optional JSON body
+            headers: Optional extra request headers
+            retry: Whether to resend once on a fresh connection when the kept-alive one was closed,
+                by default only for idempotent methods so a POST is never applied twice
+
+        Returns:
+            GhResponse with status, headers and body
+        """
+        request_headers = {
+            "Authorization": f"Bearer {self.token}",
+            "Accept": "application/vnd.github+json",
+            "User-Agent": "aia",
+            **(headers or {}),
+        }
+        payload = None
+        if body is not None:
+            payload = json.dumps(body).encode()
+            request_headers["Content-Type"] = "application/json"
+
+        if retry is None:
+            retry = method in _IDEMPOTENT_METHODS
+
+        connection = self._checkout()
+        try:
+            try:
+                response = self._send(connection, method, path, payload, request_headers)
+            except (http.client.RemoteDisconnected, ConnectionError):
+                if not retry:
+                    raise
+                # The server closed the kept-alive connection, retry once on a fresh one
+                connection.close()
+                connection = self._connect()
+                response = self._send(connection, method, path, payload, request_headers)
+        except (http.client.HTTPException, OSError) as e:
+            connection.close()
+            raise GhApiError(f"{method} {path}", str(e)) from e
+        self._checkin(connection)
+        return response
+
+    def graphql(self, query: str, **variables: str | int) -> dict[str, Any]:
+        """Run a GraphQL query.
+
+        Args:
+            query: GraphQL query document
+            **variables: Query variables
+
+        Returns:
+            The "data" member of the response
+
+        Raises:
+            GhApiError: If the request fails or GitHub reports errors
+        """
+        # Queries are read-only and safe to resend, mutations are not
+        is_mutation = query.lstrip().startswith("mutation")
+        response = self.request("POST", "/graphql", body={"query": query, "variables": variables}, retry=not is_mutation)
+        if response.status != 200:
+            raise GhApiError("POST /graphql", f"HTTP {response.status}: {response.body.decode(errors='replace')}")
+        result = decode_json(response.body, "POST /graphql")
+        if result.get("errors"):
+            raise GhApiError("POST /graphql", json.dumps(result["errors"]))
+        return result["data"]
+
+    def close(self) -> None:
+        """Close the idle connections."""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for connection in idle:
+            connection.close()
+
+    def _connect(self) -> http.client.HTTPSConnection:
+        """Create a connection; it connects on its first request."""
+        return http.client.HTTPSConnection(self._host, timeout=self._timeout)
+
+    def _checkout(self) -> http.client.HTTPSConnection:
+        """Take an idle connection, or create one when none is idle."""
+        with self._lock:
+            if self._idle:
+                return self._idle.pop()
+        return self._connect()
+
+    def _checkin(self, connection: http.client.HTTPSConnection) -> None:
+        """Return a connection to the idle pool, closing it when the pool is full."""
+        with self._lock:
+            if len(self._idle) < self._max_idle:
+                self._idle.append(connection)
+                return
+        connection.close()
+
+    @staticmethod
+    def _send(
+        connection: http.client.HTTPSConnection, method: str, path: str, payload: bytes | None, headers: dict[str, str]
+    ) -> GhResponse:
+        """Send request on the given connection and read the whole response."""
+        connection.request(method, path, body=payload, headers=headers)
+        response = connection.getresponse()
+        return GhResponse(response.status, {name.lower(): value for name, value in response.getheaders()}, response.read())
+
+    def __enter__(self) -> "GhHttpClient":
+        """Enter context, returning the client."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Exit context, closing the idle connections."""
+        self.close()
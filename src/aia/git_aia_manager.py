@@ -6,20 +6,96 @@ Implements Strategy pattern for extensible provider support.
 
 # Standard lib imports
 from abc import ABCMeta, abstractmethod
+from collections import Counter
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from enum import Enum
+from itertools import islice
 import json
+from operator import itemgetter
 import subprocess
+from urllib.parse import quote
 
 # Third party imports
 
 # Local imports
 from aia import abk_common
-from aia.models import Issue, WorkflowConfig, GitOperation, WorkflowStatus
+from aia.cache import IssueCache
+from aia.gh_client import GhApiError, GhHttpClient, decode_json
+from aia.models import Issue, IssueState, WorkflowConfig, GitOperation, WorkflowStatus
 
 
 # -----------------------------------------------------------------------------
 # Local Constants
 # -----------------------------------------------------------------------------
+# Issue selection shared by batched GraphQL lookups. Unlike `gh issue list`,
+# GraphQL also exposes the project board Status field of each issue.
+_GRAPHQL_ISSUE_FIELDS = """
+number title body state url createdAt updatedAt
+labels(first: 50) { nodes { name } }
+assignees(first: 20) { nodes { login } }
+projectItems(first: 10) {
+  nodes {
+    project { number }
+    fieldValueByName(name: "Status") { ... on ProjectV2ItemFieldSingleSelectValue { name } }
+  }
+}
+"""
+
+# Status of every item on a project board, without any issue content
+_GRAPHQL_PROJECT_STATUS_QUERY = """
+query($owner: String!, $number: Int!, $cursor: String) {
+  repositoryOwner(login: $owner) {
+    ... on ProjectV2Owner {
+      projectV2(number: $number) {
+        items(first: 100, after: $cursor) {
+          pageInfo { hasNextPage endCursor }
+          nodes { type fieldValueByName(name: "Status") { ... on ProjectV2ItemFieldSingleSelectValue { name } } }
+        }
+      }
+    }
+  }
+}
+"""
+
+# Open issues matching a search query, with their project status
+_GRAPHQL_ISSUE_SEARCH_QUERY = f"""
+query($search: String!, $cursor: String) {{
+  search(type: ISSUE, query: $search, first: 100, after: $cursor) {{
+    pageInfo {{ hasNextPage endCursor }}
+    nodes {{ ... on Issue {{ ...IssueFields }} }}
+  }}
+}}
+fragment IssueFields on Issue {{ {_GRAPHQL_ISSUE_FIELDS} }}
+"""
+
+# Node ids a workflow transition mutation refers to: the issue, its labels and
+# project items with their Status field options, and the label to be added
+_GRAPHQL_TRANSITION_TARGETS_QUERY = """
+query($owner: String!, $name: String!, $number: Int!, $label: String!) {
+  repository(owner: $owner, name: $name) {
+    label(name: $label) { id }
+    issue(number: $number) {
+      id
+      labels(first: 50) { nodes { id name } }
+      projectItems(first: 10) {
+        nodes {
+          id
+          project { id number field(name: "Status") { ... on ProjectV2SingleSelectField { id options { id name } } } }
+        }
+      }
+    }
+  }
+}
+"""
+
+# Accessors for label names and assignee logins in issue payloads
+_get_name = itemgetter("name")
+_get_login = itemgetter("login")
+
+# Template for status counts, copied instead of rebuilt on every count
+_ZERO_STATUS_COUNTS: dict[WorkflowStatus, int] = dict.fromkeys(WorkflowStatus, 0)
 
 
 # -----------------------------------------------------------------------------
@@ -38,6 +114,16 @@ class GitBranchType(Enum):
     TEST = "T"
 
 
+# Branch type of each issue type label
+_LABEL_TO_BRANCH_TYPE = {
+    "bug": GitBranchType.BUG,
+    "documentation": GitBranchType.DOCUMENTATION,
+    "feature": GitBranchType.FEATURE,
+    "research": GitBranchType.RESEARCH,
+    "test": GitBranchType.TEST,
+}
+
+
 # -----------------------------------------------------------------------------
 # AI assistant type
 # -----------------------------------------------------------------------------
@@ -54,6 +140,10 @@ class AiaType(Enum):
     AI_TESTER = "ai-tester"
 
 
+# Values of all AI assistant types, e.g. for CLI choices
+AIA_TYPE_VALUES = tuple(ai_type.value for ai_type in AiaType)
+
+
 # -----------------------------------------------------------------------------
 # git AI assistant manager base
 # -----------------------------------------------------------------------------
@@ -85,7 +175,7 @@ class AiaManagerBase(metaclass=ABCMeta):
         return f"{branch_type.value}/{issue.number}/{short_name}"
 
     def _get_branch_type_from_labels(self, labels: list[str]) -> GitBranchType:
-        """Determine branch type from issue labels using set intersection.
+        """Determine branch type from the first issue type label.
 
         Args:
             labels: List of issue labels
@@ -93,33 +183,86 @@ class AiaManagerBase(metaclass=ABCMeta):
         Returns:
             Branch type, defaults to FEATURE if no type labels found
         """
-        type_labels = {"bug", "documentation", "feature", "research", "test"}
-        labels_set = set(labels)
-
-        # Find intersection - should contain exactly one type label
-        found_types = type_labels.intersection(labels_set)
-
-        if found_types:
-            # Get the single type label (since there should only be one)
-            type_label = found_types.pop()
-            match type_label:
-                case "bug":
-                    return GitBranchType.BUG
-                case "documentation":
-                    return GitBranchType.DOCUMENTATION
-                case "feature":
-                    return GitBranchType.FEATURE
-                case "research":
-                    return GitBranchType.RESEARCH
-                case "test":
-                    return GitBranchType.TEST
-
-        # Default to feature if no type label found
-        return GitBranchType.FEATURE
+        return next((_LABEL_TO_BRANCH_TYPE[label] for label in labels if label in _LABEL_TO_BRANCH_TYPE), GitBranchType.FEATURE)
+
+    def get_status_counts(self) -> dict[WorkflowStatus, int]:
+        """Get count of issues by workflow status.
+
+        Providers can override this with a cheaper server side count.
+
+        Returns:
+            Dictionary mapping workflow status to issue count
+        """
+        status_counts = _ZERO_STATUS_COUNTS.copy()
+        status_counts.update(Counter(issue.project_status for issue in self.get_issues() if issue.project_status))
+        return status_counts
+
+    def get_project_issues(self) -> list[Issue]:
+        """Get all open issues with their project status.
+
+        Providers can override this with a paginated query.
+
+        Returns:
+            List of all open issues
+        """
+        return self.get_issues()
+
+    def batch_fetch_issues(self, numbers: list[int]) -> list[Issue]:
+        """Get several issues by number.
+
+        Providers can override this with a single batched request.
+
+        Args:
+            numbers: Issue numbers to fetch
+
+        Returns:
+            List of issues found, in the order requested
+        """
+        issues = (self.get_issue(number) for number in dict.fromkeys(numbers))
+        return [issue for issue in issues if issue is not None]
+
+    def batch_transition(
+        self,
+        issue: Issue,
+        status: WorkflowStatus | None = None,
+        assign_ai: AiaType | None = None,
+        extra_labels_remove: tuple[str, ...] = (),
+    ) -> GitOperation:
+        """Apply the status and label changes of a workflow step.
+
+        Providers can override this with a single batched request.
+
+        Args:
+            issue: Issue to transition
+            status: New project board status, None to keep the current one
+            assign_ai: AI assistant to assign, replacing any current AI assignment
+            extra_labels_remove: Further labels to remove from the issue
+
+        Returns:
+            GitOperation of the first failing change, or success
+        """
+        if status is not None:
+            result = self.update_issue_status(issue, status)
+            if not result.success:
+                return result
+
+        if assign_ai is not None:
+            result = self.assign_to_ai(issue, assign_ai)
+            if not result.success:
+                return result
+
+        for label in extra_labels_remove:
+            result = self.remove_label_from_issue(issue, label)
+            if not result.success:
+                return result
+
+        return GitOperation(success=True, message=f"Transitioned issue {issue.number}")
 
     @abstractmethod
-    def get_issues(self, status: WorkflowStatus | None = None) -> list[Issue]:
-        """Get issues from the repository."""
+    def get_issues(
+        self, status: WorkflowStatus | None = None, label: str | None = None, exclude_labels: tuple[str, ...] = ()
+    ) -> list[Issue]:
+        """Get issues from the repository, optionally narrowed by status and labels."""
         raise NotImplementedError
 
     @abstractmethod
@@ -186,30 +329,66 @@ class GitHubAiaManager(AiaManagerBase):
 
     Uses GitHub CLI (gh) for all GitHub operations.
     Requires: gh CLI installed and authenticated.
+
+    Args:
+        aia_type: AI assistant type
+        config: Workflow configuration
+        issue_cache: Optional ETag cache; single issue reads become conditional requests
+        http_client: Optional keep-alive API client for GraphQL and REST requests, including label, PR and
+            comment writes, instead of a gh process per call
     """
 
+    def __init__(
+        self, aia_type: AiaType, config: WorkflowConfig, issue_cache: IssueCache | None = None, http_client: GhHttpClient | None = None
+    ) -> None:
+        """Initialize the GitHub AI assistant manager."""
+        super().__init__(aia_type, config)
+        self.issue_cache = issue_cache
+        self.http_client = http_client
+        self._repo_args = ("--repo", config.repo_full_name)
+
     @abk_common.function_trace
-    def get_issues(self, status: WorkflowStatus | None = None) -> list[Issue]:
-        """Get issues from GitHub repository."""
+    def get_issues(
+        self, status: WorkflowStatus | None = None, label: str | None = None, exclude_labels: tuple[str, ...] = (), limit: int | None = None
+    ) -> list[Issue]:
+        """Get issues from GitHub repository.
+
+        Label filters are applied by GitHub, so only matching issues are returned.
+        With a status filter the issues come from a GraphQL search, which also returns
+        their project status.
+
+        Args:
+            status: Optional project board status filter
+            label: Optional label the issues must have
+            exclude_labels: Labels the issues must not have
+            limit: Optional maximum number of issues; status filtered searches stop
+                fetching result pages once enough matching issues were found
+
+        Returns:
+            List of matching issues
+        """
+        exclude_filter = " ".join(f'-label:"{excluded}"' for excluded in exclude_labels)
         try:
-            cmd = [
-                "gh",
-                "issue",
-                "list",
-                "--repo",
-                self.config.repo_full_name,
-                "--json",
-                "number,title,body,state,labels,assignees,createdAt,updatedAt,url",
-            ]
+            if status is not None:
+                label_filter = f'label:"{label}"' if label else ""
+                issues = self._iter_search_issues(f"repo:{self.config.repo_full_name} is:issue is:open {label_filter} {exclude_filter}")
+                return list(islice((issue for issue in issues if issue.project_status == status), limit))
+
+            cmd = ["gh", "issue", "list", *self._repo_args]
+            if label:
+                cmd.extend(["--label", label])
+            if exclude_filter:
+                cmd.extend(["--search", exclude_filter])
+            if limit is not None:
+                cmd.extend(["--limit", str(limit)])
+            cmd.extend(["--json", "number,title,body,state,labels,assignees,createdAt,updatedAt,url"])
 
             result = subprocess.run(cmd, capture_output=True, text=True, check=True)
             issues_data = json.loads(result.stdout)
 
             issues = []
             for issue_data in issues_data:
-                issue = self._parse_issue_data(issue_data)
-                if status is None or issue.project_status == status:
-                    issues.append(issue)
+                issues.append(self._parse_issue_data(issue_data))
 
             return issues
         except subprocess.CalledProcessError as e:
@@ -219,14 +398,16 @@ class GitHubAiaManager(AiaManagerBase):
     @abk_common.function_trace
     def get_issue(self, issue_number: int) -> Issue | None:
         """Get a specific issue by number."""
+        if self.issue_cache is not None:
+            return self._get_issue_conditional(issue_number)
+
         try:
             cmd = [
                 "gh",
                 "issue",
                 "view",
                 str(issue_number),
-                "--repo",
-                self.config.repo_full_name,
+                *self._repo_args,
                 "--json",
                 "number,title,body,state,labels,assignees,createdAt,updatedAt,url",
             ]
@@ -239,6 +420,152 @@ class GitHubAiaManager(AiaManagerBase):
             print(f"Error getting issue {issue_number}: {e.stderr}")
             return None
 
+    @abk_common.function_trace
+    def batch_fetch_issues(self, numbers: list[int]) -> list[Issue]:
+        """Fetch several issues, including their project status, in one GraphQL round trip.
+
+        Args:
+            numbers: Issue numbers to fetch
+
+        Returns:
+            Issues in the order of the given numbers, unknown numbers are skipped
+        """
+        numbers = list(dict.fromkeys(int(number) for number in numbers))
+        if not numbers:
+            return []
+
+        aliases = " ".join(f"i{number}: issue(number: {number}) {{ ...IssueFields }}" for number in numbers)
+        query = (
+            f"query($owner: String!, $name: String!) {{ repository(owner: $owner, name: $name) {{ {aliases} }} }}\n"
+            f"fragment IssueFields on Issue {{ {_GRAPHQL_ISSUE_FIELDS} }}"
+        )
+
+        try:
+            repository = self._graphql(query, owner=self.config.repo_owner, name=self.config.repo_name)["repository"]
+        except subprocess.CalledProcessError as e:
+            print(f"Error fetching issues {numbers}: {e.stderr}")
+            return []
+
+        return [self._parse_graphql_issue(repository[f"i{number}"]) for number in numbers if repository.get(f"i{number}")]
+
+    @abk_common.function_trace
+    def get_project_issues(self) -> list[Issue]:
+        """Get all open issues with their project status, following all search result pages.
+
+        Returns:
+            List of all open issues
+
+        Raises:
+            subprocess.CalledProcessError: If the issues can't be read
+        """
+        return self._search_issues(f"repo:{self.config.repo_full_name} is:issue is:open")
+
+    @abk_common.function_trace
+    def get_status_counts(self) -> dict[WorkflowStatus, int]:
+        """Count project board issues by status, reading only the Status field of each item.
+
+        Returns:
+            Dictionary mapping workflow status to issue count
+        """
+        if not self.config.project_number:
+            return super().get_status_counts()
+
+        status_counts = _ZERO_STATUS_COUNTS.copy()
+        variables: dict[str, str | int] = {"owner": self.config.repo_owner, "number": self.config.project_number}
+        try:
+            while True:
+                data = self._graphql(_GRAPHQL_PROJECT_STATUS_QUERY, **variables)
+                items = data["repositoryOwner"]["projectV2"]["items"]
+                for item in items["nodes"]:
+                    status = self._parse_status_field(item.get("fieldValueByName"))
+                    if item["type"] == "ISSUE" and status:
+                        status_counts[status] += 1
+                if not items["pageInfo"]["hasNextPage"]:
+                    return status_counts
+                variables["cursor"] = items["pageInfo"]["endCursor"]
+        except subprocess.CalledProcessError as e:
+            print(f"Error getting status counts: {e.stderr}")
+            return status_counts
+
+    @abk_common.function_trace
+    def batch_transition(
+        self,
+        issue: Issue,
+        status: WorkflowStatus | None = None,
+        assign_ai: AiaType | None = None,
+        extra_labels_remove: tuple[str, ...] = (),
+    ) -> GitOperation:
+        """Apply the status and label changes of a workflow step in one GraphQL mutation.
+
+        The node ids the mutation needs are read in one query beforehand, so a transition
+        takes two round trips however many changes it makes.
+
+        Args:
+            issue: Issue to transition
+            status: New project board status, None to keep the current one
+            assign_ai: AI assistant to assign, replacing any current AI assignment
+            extra_labels_remove: Further labels to remove from the issue
+
+        Returns:
+            GitOperation with success/failure details
+        """
+        if status is not None and not self.config.project_number:
+            return GitOperation(success=False, message="No project number configured")
+
+        add_label = f"assigned:{assign_ai.value}" if assign_ai else None
+        variables = {"owner": self.config.repo_owner, "name": self.config.repo_name, "number": issue.number, "label": add_label or ""}
+
+        try:
+            repository = self._graphql(_GRAPHQL_TRANSITION_TARGETS_QUERY, **variables)["repository"]
+            target = repository["issue"]
+            if target is None:
+                return GitOperation(success=False, message=f"Issue {issue.number} not found")
+
+            issue_id = json.dumps(target["id"])
+            mutations = []
+
+            if status is not None:
+                items = target["projectItems"]["nodes"]
+                item = next((item for item in items if item["project"]["number"] == self.config.project_number), None)
+                if item is None:
+                    return GitOperation(success=False, message=f"Issue {issue.number} is not on project {self.config.project_number}")
+                field = item["project"]["field"]
+                option_id = next((option["id"] for option in field["options"] if option["name"] == status.value), None)
+                if option_id is None:
+                    return GitOperation(success=False, message=f"Project {self.config.project_number} has no '{status.value}' status")
+                mutations.append(
+                    f"status: updateProjectV2ItemFieldValue(input: {{projectId: {json.dumps(item['project']['id'])}, "
+                    f"itemId: {json.dumps(item['id'])}, fieldId: {json.dumps(field['id'])}, "
+                    f"value: {{singleSelectOptionId: {json.dumps(option_id)}}}}}) {{ clientMutationId }}"
+                )
+
+            current_labels = {label["name"]: label["id"] for label in target["labels"]["nodes"]}
+            remove_ids = [
+                label_id
+                for name, label_id in current_labels.items()
+                if name in extra_labels_remove or (add_label and name.startswith("assigned:ai-") and name != add_label)
+            ]
+
+            if add_label and add_label not in current_labels:
+                if repository["label"] is None:
+                    return GitOperation(success=False, message=f"Label '{add_label}' does not exist in {self.config.repo_full_name}")
+                mutations.append(
+                    f"addLabels: addLabelsToLabelable(input: {{labelableId: {issue_id}, "
+                    f"labelIds: [{json.dumps(repository['label']['id'])}]}}) {{ clientMutationId }}"
+                )
+            if remove_ids:
+                mutations.append(
+                    f"removeLabels: removeLabelsFromLabelable(input: {{labelableId: {issue_id}, "
+                    f"labelIds: {json.dumps(remove_ids)}}}) {{ clientMutationId }}"
+                )
+
+            if mutations:
+                self._graphql("mutation { " + " ".join(mutations) + " }")
+        except subprocess.CalledProcessError as e:
+            return GitOperation(success=False, message=f"Error transitioning issue {issue.number}: {e.stderr}", error=e.stderr)
+
+        return GitOperation(success=True, message=f"Transitioned issue {issue.number}")
+
     @abk_common.function_trace
     def update_issue_status(self, issue: Issue, new_status: WorkflowStatus) -> GitOperation:
         """Update issue status in GitHub project board."""
@@ -258,7 +585,7 @@ class GitHubAiaManager(AiaManagerBase):
                     str(issue.number),
                 ]
 
-                subprocess.run(cmd, capture_output=True, text=True, check=True)
+                subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, check=True)
                 return GitOperation(success=True, message=f"Updated issue {issue.number} status to {new_status.value}")
             else:
                 return GitOperation(success=False, message="No project number configured")
@@ -269,9 +596,11 @@ class GitHubAiaManager(AiaManagerBase):
     def add_label_to_issue(self, issue: Issue, label: str) -> GitOperation:
         """Add label to GitHub issue."""
         try:
-            cmd = ["gh", "issue", "edit", str(issue.number), "--repo", self.config.repo_full_name, "--add-label", label]
-
-            subprocess.run(cmd, capture_output=True, text=True, check=True)
+            if self.http_client is not None:
+                self._rest_send("POST", f"repos/{self.config.repo_full_name}/issues/{issue.number}/labels", {"labels": [label]})
+            else:
+                cmd = ["gh", "issue", "edit", str(issue.number), *self._repo_args, "--add-label", label]
+                subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, check=True)
             return GitOperation(success=True, message=f"Added label '{label}' to issue {issue.number}")
         except subprocess.CalledProcessError as e:
             return GitOperation(success=False, message=f"Error adding label: {e.stderr}", error=e.stderr)
@@ -280,9 +609,11 @@ class GitHubAiaManager(AiaManagerBase):
     def remove_label_from_issue(self, issue: Issue, label: str) -> GitOperation:
         """Remove label from GitHub issue."""
         try:
-            cmd = ["gh", "issue", "edit", str(issue.number), "--repo", self.config.repo_full_name, "--remove-label", label]
-
-            subprocess.run(cmd, capture_output=True, text=True, check=True)
+            if self.http_client is not None:
+                self._rest_send("DELETE", f"repos/{self.config.repo_full_name}/issues/{issue.number}/labels/{quote(label, safe='')}")
+            else:
+                cmd = ["gh", "issue", "edit", str(issue.number), *self._repo_args, "--remove-label", label]
+                subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, check=True)
             return GitOperation(success=True, message=f"Removed label '{label}' from issue {issue.number}")
         except subprocess.CalledProcessError as e:
             return GitOperation(success=False, message=f"Error removing label: {e.stderr}", error=e.stderr)
@@ -295,7 +626,7 @@ class GitHubAiaManager(AiaManagerBase):
 
             # Create and checkout new branch
             cmd = ["git", "checkout", "-b", branch_name]
-            subprocess.run(cmd, capture_output=True, text=True, check=True)
+            subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, check=True)
 
             return GitOperation(success=True, message=f"Created branch '{branch_name}' for issue {issue.number}", output=branch_name)
         except subprocess.CalledProcessError as e:
@@ -305,10 +636,10 @@ class GitHubAiaManager(AiaManagerBase):
     def create_commit(self, branch: str, files: list[str], message: str) -> GitOperation:
         """Create commit with specified files."""
         try:
-            # Add files to staging area
-            for file in files:
-                cmd = ["git", "add", file]
-                subprocess.run(cmd, capture_output=True, text=True, check=True)
+            # Add all files to staging area in one git call
+            if files:
+                cmd = ["git", "add", "--", *files]
+                subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, check=True)
 
             # Create commit
             cmd = ["git", "commit", "-m", message]
@@ -334,21 +665,14 @@ class GitHubAiaManager(AiaManagerBase):
     def create_pr(self, title: str, body: str, head: str, base: str) -> GitOperation:
         """Create pull request on GitHub."""
         try:
-            cmd = [
-                "gh",
-                "pr",
-                "create",
-                "--repo",
-                self.config.repo_full_name,
-                "--title",
-                title,
-                "--body",
-                body,
-                "--head",
-                head,
-                "--base",
-                base,
-            ]
+            if self.http_client is not None:
+                pr = self._rest_send(
+                    "POST", f"repos/{self.config.repo_full_name}/pulls", {"title": title, "body": body, "head": head, "base": base}
+                )
+                # Same output as gh pr create: the URL of the new PR
+                return GitOperation(success=True, message=f"Created PR: {title}", output=f"{pr['html_url']}\n")
+
+            cmd = ["gh", "pr", "create", *self._repo_args, "--title", title, "--body", body, "--head", head, "--base", base]
 
             result = subprocess.run(cmd, capture_output=True, text=True, check=True)
 
@@ -360,9 +684,11 @@ class GitHubAiaManager(AiaManagerBase):
     def comment_on_pr(self, repo: str, pr_number: int, message: str) -> GitOperation:
         """Comment on GitHub pull request."""
         try:
-            cmd = ["gh", "pr", "comment", str(pr_number), "--repo", repo, "--body", message]
-
-            subprocess.run(cmd, capture_output=True, text=True, check=True)
+            if self.http_client is not None:
+                self._rest_send("POST", f"repos/{repo}/issues/{pr_number}/comments", {"body": message})
+            else:
+                cmd = ["gh", "pr", "comment", str(pr_number), "--repo", repo, "--body", message]
+                subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, check=True)
 
             return GitOperation(success=True, message=f"Added comment to PR #{pr_number}")
         except subprocess.CalledProcessError as e:
@@ -370,27 +696,28 @@ class GitHubAiaManager(AiaManagerBase):
 
     @abk_common.function_trace
     def assign_to_ai(self, issue: Issue, ai_type: AiaType) -> GitOperation:
-        """Assign issue to AI assistant."""
-        # Remove existing AI assignment labels
-        for label in issue.labels:
-            if label.startswith("assigned:ai-"):
-                self.remove_label_from_issue(issue, label)
+        """Assign issue to AI assistant.
 
-        # Add new AI assignment label
+        Other AI assignment labels are removed concurrently with adding the new one.
+        The first failed removal or addition is returned, so a left-over assignment label is not hidden.
+        """
         new_label = f"assigned:{ai_type.value}"
-        return self.add_label_to_issue(issue, new_label)
+        stale_labels = [label for label in issue.labels if label.startswith("assigned:ai-") and label != new_label]
+        if not stale_labels:
+            return self.add_label_to_issue(issue, new_label)
+
+        with ThreadPoolExecutor(max_workers=len(stale_labels) + 1) as executor:
+            futures = [executor.submit(self.remove_label_from_issue, issue, label) for label in stale_labels]
+            futures.append(executor.submit(self.add_label_to_issue, issue, new_label))
+        results = [future.result() for future in futures]
+        return next((result for result in results if not result.success), results[-1])
 
     @abk_common.function_trace
     def get_assigned_issues(self) -> list[Issue]:
         """Get issues assigned to this AI assistant."""
-        all_issues = self.get_issues()
-        assigned_issues = []
-
-        for issue in all_issues:
-            if issue.get_assigned_ai() == self.aia_type.value:
-                assigned_issues.append(issue)
-
-        return assigned_issues
+        target = self.aia_type.value
+        all_issues = self.get_issues(label=f"assigned:{target}")
+        return [issue for issue in all_issues if issue.get_assigned_ai() == target]
 
     @abk_common.function_trace
     def get_issues_in_column(self, column_status: WorkflowStatus) -> list[Issue]:
@@ -404,7 +731,7 @@ class GitHubAiaManager(AiaManagerBase):
         Returns:
             The first issue from ToDo column (assuming GitHub orders by priority)
         """
-        todo_issues = self.get_issues_in_column(WorkflowStatus.TODO)
+        todo_issues = self.get_issues(status=WorkflowStatus.TODO, limit=1)
         if todo_issues:
             return todo_issues[0]  # First issue is highest priority
         return None
@@ -429,16 +756,14 @@ class GitHubAiaManager(AiaManagerBase):
             if not self.config.project_number:
                 return {"error": "No project number configured"}
 
-            # Get all issues and group by status
-            all_issues = self.get_issues()
-            column_counts = {}
+            # Get all open issues with their project status in one paginated GraphQL search, then group by status
+            all_issues = self.get_project_issues()
+            column_issues: dict[WorkflowStatus, list[dict]] = {status: [] for status in WorkflowStatus}
+            for issue in all_issues:
+                if issue.project_status is not None:
+                    column_issues[issue.project_status].append({"number": issue.number, "title": issue.title})
 
-            for status in WorkflowStatus:
-                column_issues = [issue for issue in all_issues if issue.project_status == status]
-                column_counts[status.value] = {
-                    "count": len(column_issues),
-                    "issues": [{"number": issue.number, "title": issue.title} for issue in column_issues],
-                }
+            column_counts = {status.value: {"count": len(issues), "issues": issues} for status, issues in column_issues.items()}
 
             return {
                 "project_number": self.config.project_number,
@@ -469,33 +794,159 @@ class GitHubAiaManager(AiaManagerBase):
         except subprocess.CalledProcessError as e:
             return GitOperation(success=False, message=f"Project board validation failed: {e.stderr}", error=e.stderr)
 
+    def _graphql(self, query: str, **variables: str | int) -> dict:
+        """Run a GraphQL query through the HTTP client, or `gh api graphql`, and return its data payload."""
+        if self.http_client is not None:
+            return self.http_client.graphql(query, **variables)
+
+        cmd = ["gh", "api", "graphql", "-f", f"query={query}"]
+        for name, value in variables.items():
+            # -F would turn numeric looking strings into numbers, so only ints are sent typed
+            cmd += ["-F" if isinstance(value, int) else "-f", f"{name}={value}"]
+
+        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+        return json.loads(result.stdout)["data"]
+
+    def _search_issues(self, query: str) -> list[Issue]:
+        """Run a GraphQL issue search, following all result pages."""
+        return list(self._iter_search_issues(query))
+
+    def _iter_search_issues(self, query: str) -> Iterator[Issue]:
+        """Yield the issues of a GraphQL issue search, fetching the next result page only when needed."""
+        variables: dict[str, str | int] = {"search": " ".join(query.split())}
+        while True:
+            search = self._graphql(_GRAPHQL_ISSUE_SEARCH_QUERY, **variables)["search"]
+            yield from (self._parse_graphql_issue(node) for node in search["nodes"] if node)
+            if not search["pageInfo"]["hasNextPage"]:
+                return
+            variables["cursor"] = search["pageInfo"]["endCursor"]
+
+    def _rest_get(self, path: str, headers: dict[str, str]) -> tuple[int | None, dict[str, str], str | bytes, str]:
+        """GET a REST API path, returning status, lower-cased headers, body and error text."""
+        if self.http_client is not None:
+            try:
+                response = self.http_client.request("GET", f"/{path}", headers=headers)
+            except GhApiError as e:
+                return None, {}, b"", e.stderr
+            return response.status, response.headers, response.body, response.body.decode(errors="replace")
+
+        cmd = ["gh", "api", "--include", path]
+        for name, value in headers.items():
+            cmd.extend(["-H", f"{name}: {value}"])
+
+        # gh exits non-zero on 304, so the status line decides instead of the exit code
+        result = subprocess.run(cmd, capture_output=True, text=True, check=False)
+        return *_split_http_response(result.stdout), result.stderr
+
+    def _rest_send(self, method: str, path: str, body: dict | None = None) -> dict:
+        """Send a REST API request through the HTTP client and return its decoded JSON body.
+
+        Raises:
+            GhApiError: If the request fails or GitHub answers with an error status
+        """
+        response = self.http_client.request(method, f"/{path}", body=body)
+        if response.status >= 400:
+            raise GhApiError(f"{method} /{path}", response.body.decode(errors="replace"))
+        return decode_json(response.body, f"{method} /{path}")
+
+    def _parse_graphql_issue(self, issue_node: dict) -> Issue:
+        """Parse GraphQL issue node into Issue object."""
+        issue = self._parse_issue_data(
+            {**issue_node, "labels": issue_node["labels"]["nodes"], "assignees": issue_node["assignees"]["nodes"]}
+        )
+        issue.project_status = self._get_project_status(issue_node["projectItems"]["nodes"])
+        return issue
+
+    def _get_project_status(self, project_items: list[dict]) -> WorkflowStatus | None:
+        """Get workflow status from the issue's item on the configured project board."""
+        for item in project_items:
+            if self.config.project_number and item["project"]["number"] != self.config.project_number:
+                continue
+            return self._parse_status_field(item.get("fieldValueByName"))
+        return None
+
+    def _parse_status_field(self, field_value: dict | None) -> WorkflowStatus | None:
+        """Parse project Status field value into WorkflowStatus."""
+        return WorkflowStatus.from_column((field_value or {}).get("name"))
+
+    def _get_issue_conditional(self, issue_number: int) -> Issue | None:
+        """Get an issue through the REST API, revalidating the cached copy with its ETag.
+
+        Like `gh issue view`, the REST issue carries no project fields, so project_status
+        stays unset; batch_fetch_issues reads issues with their status.
+        """
+        repo = self.config.repo_full_name
+        cached = self.issue_cache.get(repo, issue_number)
+
+        status, headers, body, error = self._rest_get(f"repos/{repo}/issues/{issue_number}", {"If-None-Match": cached[0]} if cached else {})
+
+        if status == 304 and cached:
+            payload = cached[1]
+        elif status == 200:
+            try:
+                payload = decode_json(body, f"GET issue {issue_number}")
+            except GhApiError as e:
+                print(f"Error getting issue {issue_number}: {e.stderr}")
+                return None
+            if headers.get("etag"):
+                self.issue_cache.put(repo, issue_number, headers["etag"], payload)
+        else:
+            print(f"Error getting issue {issue_number}: {error}")
+            return None
+
+        return self._parse_issue_data(
+            {
+                **payload,
+                "url": payload["html_url"],
+                "createdAt": payload["created_at"],
+                "updatedAt": payload["updated_at"],
+                "body": payload.get("body") or "",
+            }
+        )
+
     def _parse_issue_data(self, issue_data: dict) -> Issue:
         """Parse GitHub issue data into Issue object."""
-        from datetime import datetime
-
-        labels = [label["name"] for label in issue_data.get("labels", [])]
-        assignees = [assignee["login"] for assignee in issue_data.get("assignees", [])]
+        labels = tuple(map(_get_name, issue_data.get("labels", [])))
+        assignees = list(map(_get_login, issue_data.get("assignees", [])))
 
         return Issue(
             number=issue_data["number"],
             title=issue_data["title"],
             body=issue_data.get("body", ""),
-            state=issue_data["state"],
+            # gh and GraphQL report "OPEN", the REST API "open"
+            state=IssueState(issue_data["state"].lower()),
             labels=labels,
             assignees=assignees,
-            created_at=datetime.fromisoformat(issue_data["createdAt"].replace("Z", "+00:00")),
-            updated_at=datetime.fromisoformat(issue_data["updatedAt"].replace("Z", "+00:00")),
+            # fromisoformat accepts GitHub's "Z" UTC suffix since Python 3.11
+            created_at=datetime.fromisoformat(issue_data["createdAt"]),
+            updated_at=datetime.fromisoformat(issue_data["updatedAt"]),
             url=issue_data["url"],
         )
 
 
+def _split_http_response(output: str) -> tuple[int | None, dict[str, str], str]:
+    """Split `gh api --include` output into status code, lower-cased headers and body."""
+    head, _, body = output.replace("\r\n", "\n").partition("\n\n")
+    status_line, *header_lines = head.split("\n")
+    parts = status_line.split(" ", 2)
+    if len(parts) < 2 or not parts[0].startswith("HTTP/") or not parts[1].isdigit():
+        return None, {}, output
+    headers = {}
+    for line in header_lines:
+        name, _, value = line.partition(":")
+        headers[name.strip().lower()] = value.strip()
+    return int(parts[1]), headers, body
+
+
 # -----------------------------------------------------------------------------
 # GitLab AI assistant Manager
 # -----------------------------------------------------------------------------
 class GitLabAiaManager(AiaManagerBase):
     """GitLab AI assistant manager (placeholder implementation)."""
 
-    def get_issues(self, status: WorkflowStatus | None = None) -> list[Issue]:
+    def get_issues(
+        self, status: WorkflowStatus | None = None, label: str | None = None, exclude_labels: tuple[str, ...] = ()
+    ) -> list[Issue]:
         """GitLab implementation - not implemented yet."""
         raise NotImplementedError("GitLab implementation pending")
 
@@ -550,7 +1001,9 @@ class GitLabAiaManager(AiaManagerBase):
 class BitbucketAiaManager(AiaManagerBase):
     """Bitbucket AI assistant manager (placeholder implementation)."""
 
-    def get_issues(self, status: WorkflowStatus | None = None) -> list[Issue]:
+    def get_issues(
+        self, status: WorkflowStatus | None = None, label: str | None = None, exclude_labels: tuple[str, ...] = ()
+    ) -> list[Issue]:
         """Bitbucket implementation - not implemented yet."""
         raise NotImplementedError("Bitbucket implementation pending")
 
@@ -609,13 +1062,21 @@ class AiaManagerFactory:
     """
 
     @staticmethod
-    def create_manager(provider: str, aia_type: AiaType, config: WorkflowConfig) -> AiaManagerBase:
+    def create_manager(
+        provider: str,
+        aia_type: AiaType,
+        config: WorkflowConfig,
+        issue_cache: IssueCache | None = None,
+        http_client: GhHttpClient | None = None,
+    ) -> AiaManagerBase:
         """Create manager for specified Git provider.
 
         Args:
             provider: Git provider ("github", "gitlab", "bitbucket")
             aia_type: AI assistant type
             config: Workflow configuration
+            issue_cache: Optional ETag issue cache (GitHub only)
+            http_client: Optional GitHub API client (GitHub only)
 
         Returns:
             Manager instance for the provider
@@ -625,7 +1086,7 @@ class AiaManagerFactory:
         """
         match provider.lower():
             case "github":
-                return GitHubAiaManager(aia_type, config)
+                return GitHubAiaManager(aia_type, config, issue_cache, http_client)
             case "gitlab":
                 return GitLabAiaManager(aia_type, config)
             case "bitbucket":
@@ -4,15 +4,109 @@ Provides utilities for creating and configuring GitHub Apps with required permis
 for AI assistant automation, including project board management and issue handling.
 """
 
+import copy
 import json
 import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
+from aia.gh_client import GhApiError, GhHttpClient, decode_json
 from aia.models import GitOperation
 
 
+# Seconds installation permissions of a repository are reused before asking GitHub again
+PERMISSIONS_CACHE_TTL = 300.0
+
+# Static setup files, built once instead of on every setup run
+_APP_MANIFEST: dict[str, Any] = {
+    "name": "AI Assistant Workflow Bot",
+    "description": "Automated AI assistant workflow management for GitHub projects",
+    "url": "https://github.com/your-org/aia",
+    "hook_attributes": {"url": "https://your-domain.com/webhook"},
+    "redirect_url": "https://your-domain.com/auth/callback",
+    "public": False,
+    "default_permissions": {
+        # Repository permissions
+        "issues": "write",
+        "pull_requests": "write",
+        "contents": "write",
+        "metadata": "read",
+        # Project permissions
+        "projects": "write",
+        # Organization permissions (if needed)
+        "organization_projects": "write",
+    },
+    "default_events": ["issues", "pull_request", "project_card", "project_column", "push"],
+}
+# Installation permissions the workflow needs, as (permission, level) pairs
+_REQUIRED_PERMISSIONS = (("issues", "write"), ("pull_requests", "write"), ("contents", "write"), ("projects", "write"))
+
+_APP_MANIFEST_JSON = json.dumps(_APP_MANIFEST, indent=2).encode()
+
+_ENV_TEMPLATE = b"""# GitHub App Configuration
+# Copy this file to .env and fill in your values
+
+# GitHub App ID (from GitHub App settings)
+GITHUB_APP_ID=
+
+# Path to GitHub App private key file
+GITHUB_APP_PRIVATE_KEY_PATH=
+
+# Installation ID for your repository
+GITHUB_APP_INSTALLATION_ID=
+
+# Webhook secret for validating webhooks
+GITHUB_APP_WEBHOOK_SECRET=
+
+# Repository configuration
+GITHUB_REPO_OWNER=
+GITHUB_REPO_NAME=
+GITHUB_PROJECT_NUMBER=
+
+# Default branch for pull requests
+DEFAULT_BASE_BRANCH=main
+"""
+
+_SETUP_INSTRUCTIONS = b"""# GitHub App Setup Instructions
+
+## 1. Create GitHub App
+
+1. Go to your GitHub repository or organization settings
+2. Navigate to "Developer settings" > "GitHub Apps"
+3. Click "New GitHub App"
+4. Use the manifest file generated in `.github_app/app_manifest.json`
+5. Or manually configure with these settings:
+   - Name: AI Assistant Workflow Bot
+   - Permissions: Issues (write), Pull Requests (write), Contents (write), Projects (write)
+   - Events: issues, pull_request, project_card, project_column, push
+
+## 2. Configure Environment Variables
+
+1. Copy `.github_app/.env.template` to `.env`
+2. Fill in your GitHub App credentials:
+   - GITHUB_APP_ID: From GitHub App settings
+   - GITHUB_APP_PRIVATE_KEY_PATH: Download private key from GitHub App settings
+   - GITHUB_APP_INSTALLATION_ID: Install app to your repository and get ID
+   - GITHUB_APP_WEBHOOK_SECRET: Set webhook secret in GitHub App settings
+
+## 3. Install GitHub App
+
+1. Go to your GitHub App settings
+2. Click "Install App"
+3. Choose your repository
+4. Note the installation ID from URL
+
+## 4. Validate Setup
+
+Run: `aia validate-github-app`
+
+This will check permissions and connectivity.
+"""
+
+
 @dataclass
 class GitHubAppConfig:
     """Configuration for GitHub App.
@@ -33,14 +127,21 @@ class GitHubAppConfig:
 class GitHubAppSetup:
     """GitHub App setup and configuration manager."""
 
-    def __init__(self, config_dir: str = ".github_app"):
+    def __init__(self, config_dir: str = ".github_app", http_client: GhHttpClient | None = None, cache_ttl: float = PERMISSIONS_CACHE_TTL):
         """Initialize GitHub App setup.
 
         Args:
             config_dir: Directory to store GitHub App configuration
+            http_client: Optional GitHub API client for API reads, instead of a gh process per call
+            cache_ttl: Seconds installation permissions are cached per repository, 0 disables caching
         """
         self.config_dir = Path(config_dir)
         self.config_dir.mkdir(exist_ok=True)
+        self.http_client = http_client
+        self.cache_ttl = cache_ttl
+        self._permissions_cache: dict[str, tuple[float, dict[str, str]]] = {}
+        # (inode, mtime_ns, size) of config.json and the configuration parsed from it
+        self._app_config_cache: tuple[tuple[int, int, int], GitHubAppConfig] | None = None
 
     def generate_app_manifest(self) -> dict[str, Any]:
         """Generate GitHub App manifest with required permissions.
@@ -48,26 +149,7 @@ class GitHubAppSetup:
         Returns:
             GitHub App manifest dictionary
         """
-        return {
-            "name": "AI Assistant Workflow Bot",
-            "description": "Automated AI assistant workflow management for GitHub projects",
-            "url": "https://github.com/your-org/aia",
-            "hook_attributes": {"url": "https://your-domain.com/webhook"},
-            "redirect_url": "https://your-domain.com/auth/callback",
-            "public": False,
-            "default_permissions": {
-                # Repository permissions
-                "issues": "write",
-                "pull_requests": "write",
-                "contents": "write",
-                "metadata": "read",
-                # Project permissions
-                "projects": "write",
-                # Organization permissions (if needed)
-                "organization_projects": "write",
-            },
-            "default_events": ["issues", "pull_request", "project_card", "project_column", "push"],
-        }
+        return copy.deepcopy(_APP_MANIFEST)
 
     def create_app_manifest_file(self) -> GitOperation:
         """Create GitHub App manifest file.
@@ -76,11 +158,8 @@ class GitHubAppSetup:
             GitOperation result
         """
         try:
-            manifest = self.generate_app_manifest()
             manifest_path = self.config_dir / "app_manifest.json"
-
-            with open(manifest_path, "w") as f:
-                json.dump(manifest, f, indent=2)
+            manifest_path.write_bytes(_APP_MANIFEST_JSON)
 
             return GitOperation(success=True, message=f"GitHub App manifest created: {manifest_path}", output=str(manifest_path))
         except Exception as e:
@@ -124,8 +203,7 @@ class GitHubAppSetup:
                 "webhook_secret": app_config.webhook_secret,
             }
 
-            with open(config_path, "w") as f:
-                json.dump(config_data, f, indent=2)
+            config_path.write_bytes(json.dumps(config_data, indent=2).encode())
 
             return GitOperation(success=True, message=f"GitHub App config saved: {config_path}", output=str(config_path))
         except Exception as e:
@@ -134,27 +212,31 @@ class GitHubAppSetup:
     def load_app_config(self) -> GitHubAppConfig | None:
         """Load GitHub App configuration from file.
 
+        The parsed configuration is reused until the file changes.
+
         Returns:
-            GitHubAppConfig if exists, None otherwise
+            GitHubAppConfig if exists and is valid, None otherwise
         """
+        config_path = self.config_dir / "config.json"
         try:
-            config_path = self.config_dir / "config.json"
-
-            if not config_path.exists():
-                return None
+            stat = config_path.stat()
+            key = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+            if self._app_config_cache is not None and self._app_config_cache[0] == key:
+                return self._app_config_cache[1]
 
-            with open(config_path) as f:
-                config_data = json.load(f)
-
-            return GitHubAppConfig(
+            config_data = json.loads(config_path.read_bytes())
+            app_config = GitHubAppConfig(
                 app_id=config_data["app_id"],
                 private_key_path=config_data["private_key_path"],
                 installation_id=config_data["installation_id"],
                 webhook_secret=config_data["webhook_secret"],
             )
-        except Exception:
+        except (OSError, ValueError, KeyError, TypeError):
             return None
 
+        self._app_config_cache = (key, app_config)
+        return app_config
+
     def validate_app_permissions(self, repo_full_name: str) -> GitOperation:
         """Validate GitHub App has required permissions for repository.
 
@@ -166,27 +248,52 @@ class GitHubAppSetup:
         """
         try:
             # Check if app has access to repository
-            cmd = ["gh", "api", f"/repos/{repo_full_name}/installation", "--jq", ".permissions"]
-
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-            permissions = json.loads(result.stdout)
-
-            required_permissions = {"issues": "write", "pull_requests": "write", "contents": "write", "projects": "write"}
-
-            missing_permissions = []
-            for perm, level in required_permissions.items():
-                if perm not in permissions or permissions[perm] != level:
-                    missing_permissions.append(f"{perm}:{level}")
+            permissions = self._get_installation_permissions(repo_full_name)
+            missing_permissions = [f"{perm}:{level}" for perm, level in _REQUIRED_PERMISSIONS if permissions.get(perm) != level]
 
             if missing_permissions:
                 return GitOperation(
                     success=False, message=f"Missing permissions: {', '.join(missing_permissions)}", error="Insufficient permissions"
                 )
 
-            return GitOperation(success=True, message="All required permissions validated", output=result.stdout)
+            return GitOperation(success=True, message="All required permissions validated", output=json.dumps(permissions))
         except subprocess.CalledProcessError as e:
             return GitOperation(success=False, message=f"Permission validation failed: {e.stderr}", error=e.stderr)
 
+    def _get_installation_permissions(self, repo_full_name: str) -> dict[str, str]:
+        """Get the permissions of the app installation on a repository, cached for cache_ttl seconds.
+
+        Raises:
+            subprocess.CalledProcessError: If the installation can't be read
+        """
+        cached = self._permissions_cache.get(repo_full_name)
+        if cached is not None and time.monotonic() < cached[0]:
+            return cached[1]
+
+        path = f"/repos/{repo_full_name}/installation"
+        try:
+            if self.http_client is None:
+                try:
+                    body = subprocess.run(["gh", "api", path], capture_output=True, check=True).stdout
+                except subprocess.CalledProcessError as e:
+                    # Output is captured as bytes, only the error message of a failure is decoded
+                    e.stderr = e.stderr.decode(errors="replace")
+                    raise
+            else:
+                response = self.http_client.request("GET", path)
+                if response.status != 200:
+                    raise GhApiError(f"GET {path}", response.body.decode(errors="replace"))
+                body = response.body
+            permissions = decode_json(body, f"GET {path}")["permissions"]
+        except subprocess.CalledProcessError:
+            # Revoked access (401/403) or a removed installation must not be served from the cache
+            self._permissions_cache.pop(repo_full_name, None)
+            raise
+
+        if self.cache_ttl > 0:
+            self._permissions_cache[repo_full_name] = (time.monotonic() + self.cache_ttl, permissions)
+        return permissions
+
     def create_environment_template(self) -> GitOperation:
         """Create .env template file with required environment variables.
 
@@ -194,34 +301,8 @@ class GitHubAppSetup:
             GitOperation result
         """
         try:
-            env_template = """# GitHub App Configuration
-# Copy this file to .env and fill in your values
-
-# GitHub App ID (from GitHub App settings)
-GITHUB_APP_ID=
-
-# Path to GitHub App private key file
-GITHUB_APP_PRIVATE_KEY_PATH=
-
-# Installation ID for your repository
-GITHUB_APP_INSTALLATION_ID=
-
-# Webhook secret for validating webhooks
-GITHUB_APP_WEBHOOK_SECRET=
-
-# Repository configuration
-GITHUB_REPO_OWNER=
-GITHUB_REPO_NAME=
-GITHUB_PROJECT_NUMBER=
-
-# Default branch for pull requests
-DEFAULT_BASE_BRANCH=main
-"""
-
             env_path = self.config_dir / ".env.template"
-
-            with open(env_path, "w") as f:
-                f.write(env_template)
+            env_path.write_bytes(_ENV_TEMPLATE)
 
             return GitOperation(success=True, message=f"Environment template created: {env_path}", output=str(env_path))
         except Exception as e:
@@ -237,19 +318,17 @@ DEFAULT_BASE_BRANCH=main
             GitOperation result with setup summary
         """
         try:
-            results = []
-
-            # Step 1: Create app manifest
-            manifest_result = self.create_app_manifest_file()
-            results.append(f"✓ Manifest: {manifest_result.message}")
-
-            # Step 2: Create environment template
-            env_result = self.create_environment_template()
-            results.append(f"✓ Environment template: {env_result.message}")
-
-            # Step 3: Create setup instructions
-            instructions = self._create_setup_instructions()
-            results.append(f"✓ Setup instructions: {instructions}")
+            # Manifest, environment template and instructions are independent files, written concurrently
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                manifest_future = executor.submit(self.create_app_manifest_file)
+                env_future = executor.submit(self.create_environment_template)
+                instructions_future = executor.submit(self._create_setup_instructions)
+
+            results = [
+                f"✓ Manifest: {manifest_future.result().message}",
+                f"✓ Environment template: {env_future.result().message}",
+                f"✓ Setup instructions: {instructions_future.result()}",
+            ]
 
             return GitOperation(success=True, message="GitHub App setup completed", output="\n".join(results))
         except Exception as e:
@@ -257,45 +336,7 @@ DEFAULT_BASE_BRANCH=main
 
     def _create_setup_instructions(self) -> str:
         """Create setup instructions file."""
-        instructions = """# GitHub App Setup Instructions
-
-## 1. Create GitHub App
-
-1. Go to your GitHub repository or organization settings
-2. Navigate to "Developer settings" > "GitHub Apps"
-3. Click "New GitHub App"
-4. Use the manifest file generated in `.github_app/app_manifest.json`
-5. Or manually configure with these settings:
-   - Name: AI Assistant Workflow Bot
-   - Permissions: Issues (write), Pull Requests (write), Contents (write), Projects (write)
-   - Events: issues, pull_request, project_card, project_column, push
-
-## 2. Configure Environment Variables
-
-1. Copy `.github_app/.env.template` to `.env`
-2. Fill in your GitHub App credentials:
-   - GITHUB_APP_ID: From GitHub App settings
-   - GITHUB_APP_PRIVATE_KEY_PATH: Download private key from GitHub App settings
-   - GITHUB_APP_INSTALLATION_ID: Install app to your repository and get ID
-   - GITHUB_APP_WEBHOOK_SECRET: Set webhook secret in GitHub App settings
-
-## 3. Install GitHub App
-
-1. Go to your GitHub App settings
-2. Click "Install App"
-3. Choose your repository
-4. Note the installation ID from URL
-
-## 4. Validate Setup
-
-Run: `aia validate-github-app`
-
-This will check permissions and connectivity.
-"""
-
         instructions_path = self.config_dir / "SETUP_INSTRUCTIONS.md"
-
-        with open(instructions_path, "w") as f:
-            f.write(instructions)
+        instructions_path.write_bytes(_SETUP_INSTRUCTIONS)
 
         return str(instructions_path)
@@ -4,11 +4,20 @@ Defines data structures for issues, pull requests, workflow configuration,
 and Git operations used throughout the AI assistant workflow system.
 """
 
-from dataclasses import dataclass
+import re
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 
 
+# Characters dropped from branch short names: everything except alphanumerics and whitespace
+_SHORT_NAME_STRIP_RE = re.compile(r"[^\w\s]|_")
+
+# Label prefix marking the AI assistant an issue is assigned to, e.g. "assigned:ai-coder"
+_AI_PREFIX = "assigned:ai-"
+_AI_TYPE_START = len("assigned:")
+
+
 class IssueState(Enum):
     """GitHub issue state enumeration."""
 
@@ -29,6 +38,22 @@ class WorkflowStatus(Enum):
     TESTING = "🧪 Testing"
     DONE = "✅ Done"
 
+    @classmethod
+    def from_column(cls, column: str | None) -> "WorkflowStatus | None":
+        """Get the workflow status for a project board column name.
+
+        Args:
+            column: Column (Status field option) name
+
+        Returns:
+            Matching workflow status, or None for unknown columns
+        """
+        return _STATUS_BY_COLUMN.get(column)
+
+
+# Plain dict lookup, avoiding Enum value lookup and its ValueError on unknown columns
+_STATUS_BY_COLUMN = {status.value: status for status in WorkflowStatus}
+
 
 class PullRequestState(Enum):
     """GitHub pull request state enumeration."""
@@ -38,7 +63,7 @@ class PullRequestState(Enum):
     MERGED = "merged"
 
 
-@dataclass
+@dataclass(slots=True)
 class Issue:
     """GitHub issue data model.
 
@@ -47,24 +72,43 @@ class Issue:
         title: Issue title
         body: Issue description
         state: Issue state (open/closed)
-        labels: List of label strings
+        labels: Label strings in GitHub's order, stored as a tuple
         assignees: List of assignee usernames
         created_at: Creation timestamp
         updated_at: Last update timestamp
         url: Issue URL
         project_status: Optional workflow status
+
+    Labels are indexed in a frozenset for constant time lookups. The index is rebuilt
+    on the first lookup after labels is reassigned; the tuple itself can't be mutated.
     """
 
     number: int
     title: str
     body: str
     state: IssueState
-    labels: list[str]
+    labels: tuple[str, ...]
     assignees: list[str]
     created_at: datetime
     updated_at: datetime
     url: str
     project_status: WorkflowStatus | None = None
+    _indexed_labels: tuple[str, ...] | None = field(default=None, init=False, repr=False, compare=False)
+    _label_set: frozenset[str] = field(default=frozenset(), init=False, repr=False, compare=False)
+    _assigned_ai: str | None = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        """Store labels as a tuple and index them."""
+        self._index_labels()
+
+    def _index_labels(self) -> None:
+        """Index labels for membership tests and resolve the assigned AI, unless labels is unchanged."""
+        if self.labels is self._indexed_labels:
+            return
+        self.labels = tuple(self.labels)
+        self._indexed_labels = self.labels
+        self._label_set = frozenset(self.labels)
+        self._assigned_ai = next((label[_AI_TYPE_START:] for label in self.labels if label.startswith(_AI_PREFIX)), None)
 
     def get_short_name(self) -> str:
         """Generate short name for branch naming from issue title.
@@ -72,10 +116,8 @@ class Issue:
         Returns:
             Lowercase, hyphenated name limited to 30 characters
         """
-        # Remove special characters and convert to lowercase
-        short_name = "".join(c for c in self.title if c.isalnum() or c.isspace())
-        # Replace spaces with hyphens and limit length
-        short_name = short_name.replace(" ", "-").lower()
+        # Remove special characters, replace spaces with hyphens and convert to lowercase
+        short_name = _SHORT_NAME_STRIP_RE.sub("", self.title).replace(" ", "-").lower()
         # Limit to 30 characters
         if len(short_name) > 30:
             short_name = short_name[:30].rstrip("-")
@@ -90,7 +132,8 @@ class Issue:
         Returns:
             True if label is present
         """
-        return label in self.labels
+        self._index_labels()
+        return label in self._label_set
 
     def is_assigned_to_ai(self) -> bool:
         """Check if issue is assigned to any AI assistant.
@@ -98,7 +141,8 @@ class Issue:
         Returns:
             True if issue has any "assigned:ai-*" label
         """
-        return any(label.startswith("assigned:ai-") for label in self.labels)
+        self._index_labels()
+        return self._assigned_ai is not None
 
     def get_assigned_ai(self) -> str | None:
         """Get the AI assistant assigned to this issue.
@@ -106,13 +150,11 @@ class Issue:
         Returns:
             AI assistant type string (e.g., "ai-coder") or None
         """
-        for label in self.labels:
-            if label.startswith("assigned:ai-"):
-                return label.split(":", 1)[1]
-        return None
+        self._index_labels()
+        return self._assigned_ai
 
 
-@dataclass
+@dataclass(slots=True)
 class PullRequest:
     """GitHub pull request data model.
 
@@ -155,33 +197,32 @@ class PullRequest:
         return not self.draft and self.state == PullRequestState.OPEN
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class WorkflowConfig:
     """Configuration for AI assistant workflow.
 
+    Immutable, use dataclasses.replace() to derive a changed configuration.
+
     Attributes:
         repo_owner: GitHub repository owner
         repo_name: GitHub repository name
         project_number: Optional GitHub project number
         default_base_branch: Default base branch for PRs
+        repo_full_name: Repository name in "owner/repo" format (derived)
     """
 
     repo_owner: str
     repo_name: str
     project_number: int | None = None
     default_base_branch: str = "main"
+    repo_full_name: str = field(init=False, repr=False)
 
-    @property
-    def repo_full_name(self) -> str:
-        """Get full repository name.
-
-        Returns:
-            Repository name in "owner/repo" format
-        """
-        return f"{self.repo_owner}/{self.repo_name}"
+    def __post_init__(self):
+        """Compute the full repository name once."""
+        object.__setattr__(self, "repo_full_name", f"{self.repo_owner}/{self.repo_name}")
 
 
-@dataclass
+@dataclass(slots=True)
 class GitOperation:
     """Git operation result data model.
 
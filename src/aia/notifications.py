@@ -4,15 +4,41 @@ Provides notifications and status updates for AI assistant workflows,
 including issue comments, progress tracking, and workflow state changes.
 """
 
+import asyncio
 import json
 import logging
+import math
+import time
+from array import array
+from collections import Counter, defaultdict
+from collections.abc import Generator, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Any
+from itertools import filterfalse
+from pathlib import Path
+from typing import IO, Any
 
 from aia.models import Issue, WorkflowStatus, GitOperation
 from aia.git_aia_manager import AiaType, AiaManagerBase
 
 
+# Upper bound of issues whose queued comments are posted at the same time by flush()
+MAX_CONCURRENT_COMMENTS = 8
+
+# Epoch second and ISO timestamp last formatted by _now_iso
+_timestamp_cache: tuple[int, str] = (0, "")
+
+
+def _now_iso() -> str:
+    """Current local time in ISO format at second resolution, formatted once per second."""
+    global _timestamp_cache
+    second = int(time.time())
+    if _timestamp_cache[0] != second:
+        _timestamp_cache = (second, datetime.fromtimestamp(second).isoformat())
+    return _timestamp_cache[1]
+
+
 class WorkflowNotifications:
     """Handles notifications and status tracking for AI workflows."""
 
@@ -24,6 +50,82 @@ class WorkflowNotifications:
         """
         self.manager = manager
         self.logger = logging.getLogger(__name__)
+        self._repo = manager.config.repo_full_name
+        self._comment_on_pr = manager.comment_on_pr
+        self._queue: list[tuple[int, str]] | None = None
+
+    @contextmanager
+    def batched(self) -> Generator[None]:
+        """Queue the comments of notifications sent inside the block and post them on exit.
+
+        Comments on different issues are posted concurrently, those on one issue in order.
+        Inside the block the notify methods return a successful "queued" result.
+        """
+        self._queue = []
+        try:
+            yield
+        finally:
+            self.flush()
+            self._queue = None
+
+    def flush(self) -> list[GitOperation]:
+        """Post all queued comments.
+
+        Returns:
+            GitOperation result of each comment, in the order they were queued
+        """
+        if not self._queue:
+            return []
+        queued, self._queue[:] = list(self._queue), []
+        return self._comment_all(queued)
+
+    async def notify_many(self, items: Iterable[tuple[Issue, str]]) -> list[GitOperation]:
+        """Post comments on several issues concurrently without blocking the event loop.
+
+        Args:
+            items: Issue and comment message pairs
+
+        Returns:
+            GitOperation result of each comment, in the order of items
+        """
+        comments = [(issue.number, message) for issue, message in items]
+        if not comments:
+            return []
+        return await asyncio.to_thread(self._comment_all, comments)
+
+    def _comment_all(self, comments: list[tuple[int, str]]) -> list[GitOperation]:
+        """Post comments concurrently across issues and in order within each issue.
+
+        Args:
+            comments: Issue number and comment message pairs
+
+        Returns:
+            GitOperation result of each comment, in the order of comments
+        """
+        by_issue: dict[int, list[int]] = {}
+        for position, (issue_number, _message) in enumerate(comments):
+            by_issue.setdefault(issue_number, []).append(position)
+
+        results: list[GitOperation | None] = [None] * len(comments)
+
+        def post_issue_comments(positions: list[int]) -> None:
+            for position in positions:
+                results[position] = self._comment(*comments[position])
+
+        with ThreadPoolExecutor(max_workers=min(MAX_CONCURRENT_COMMENTS, len(by_issue))) as executor:
+            list(executor.map(post_issue_comments, by_issue.values()))
+        return results
+
+    def _post(self, issue_number: int, message: str) -> GitOperation:
+        """Post a notification comment, or queue it inside a batched() block."""
+        if self._queue is not None:
+            self._queue.append((issue_number, message))
+            return GitOperation(success=True, message=f"Queued comment on issue #{issue_number}")
+        return self._comment(issue_number, message)
+
+    def _comment(self, issue_number: int, message: str) -> GitOperation:
+        """Comment on an issue of the manager's repository."""
+        return self._comment_on_pr(self._repo, issue_number, message)
 
     def notify_workflow_start(self, issue: Issue, ai_type: AiaType, branch_name: str) -> GitOperation:
         """Notify that an AI workflow has started.
@@ -36,7 +138,7 @@ class WorkflowNotifications:
         Returns:
             GitOperation result of notification
         """
-        timestamp = datetime.now().isoformat()
+        timestamp = _now_iso()
 
         message = f"""🚀 **{ai_type.value} workflow started**
 
@@ -47,7 +149,7 @@ class WorkflowNotifications:
 {ai_type.value} is now working on this issue. Progress updates will be posted here.
 """
 
-        return self.manager.comment_on_pr(self.manager.config.repo_full_name, issue.number, message)
+        return self._post(issue.number, message)
 
     def notify_workflow_progress(self, issue: Issue, ai_type: AiaType, progress_message: str) -> GitOperation:
         """Notify workflow progress update.
@@ -60,7 +162,7 @@ class WorkflowNotifications:
         Returns:
             GitOperation result of notification
         """
-        timestamp = datetime.now().isoformat()
+        timestamp = _now_iso()
 
         message = f"""⚡ **{ai_type.value} progress update**
 
@@ -69,7 +171,7 @@ class WorkflowNotifications:
 **Updated:** {timestamp}
 """
 
-        return self.manager.comment_on_pr(self.manager.config.repo_full_name, issue.number, message)
+        return self._post(issue.number, message)
 
     def notify_workflow_transition(
         self, issue: Issue, from_status: WorkflowStatus, to_status: WorkflowStatus, next_ai: AiaType
@@ -85,7 +187,7 @@ class WorkflowNotifications:
         Returns:
             GitOperation result of notification
         """
-        timestamp = datetime.now().isoformat()
+        timestamp = _now_iso()
 
         message = f"""🔄 **Workflow transition**
 
@@ -98,7 +200,7 @@ class WorkflowNotifications:
 {next_ai.value} will now take over this issue.
 """
 
-        return self.manager.comment_on_pr(self.manager.config.repo_full_name, issue.number, message)
+        return self._post(issue.number, message)
 
     def notify_workflow_complete(self, issue: Issue, ai_type: AiaType, pr_url: str | None = None) -> GitOperation:
         """Notify that an AI workflow has completed.
@@ -111,20 +213,17 @@ class WorkflowNotifications:
         Returns:
             GitOperation result of notification
         """
-        timestamp = datetime.now().isoformat()
+        timestamp = _now_iso()
+        pr_line = f"**Pull Request:** {pr_url}\n" if pr_url else ""
 
         message = f"""✅ **{ai_type.value} workflow completed**
 
 **Issue:** #{issue.number} - {issue.title}
 **Completed:** {timestamp}
-"""
-
-        if pr_url:
-            message += f"**Pull Request:** {pr_url}\n"
-
-        message += f"\n{ai_type.value} has completed work on this issue. Ready for human review!"
+{pr_line}
+{ai_type.value} has completed work on this issue. Ready for human review!"""
 
-        return self.manager.comment_on_pr(self.manager.config.repo_full_name, issue.number, message)
+        return self._post(issue.number, message)
 
     def notify_workflow_error(self, issue: Issue, ai_type: AiaType, error_message: str) -> GitOperation:
         """Notify workflow error that requires human intervention.
@@ -137,7 +236,7 @@ class WorkflowNotifications:
         Returns:
             GitOperation result of notification
         """
-        timestamp = datetime.now().isoformat()
+        timestamp = _now_iso()
 
         message = f"""❌ **{ai_type.value} workflow error**
 
@@ -148,7 +247,7 @@ class WorkflowNotifications:
 Human intervention required. Please review and resolve the error.
 """
 
-        return self.manager.comment_on_pr(self.manager.config.repo_full_name, issue.number, message)
+        return self._post(issue.number, message)
 
     def create_workflow_summary(self, issue: Issue) -> dict[str, Any]:
         """Create a summary of workflow activities for an issue.
@@ -182,26 +281,20 @@ Human intervention required. Please review and resolve the error.
         if not issues:
             return "No issues to report."
 
-        report = []
-        report.append("📊 **AI Workflow Status Report**")
-        report.append("=" * 40)
-        report.append("")
+        report = ["📊 **AI Workflow Status Report**", "=" * 40, ""]
 
         # Group issues by status
-        status_groups = {}
+        status_groups: defaultdict[str, list[Issue]] = defaultdict(list)
         for issue in issues:
-            status = issue.project_status.value if issue.project_status else "Unknown"
-            if status not in status_groups:
-                status_groups[status] = []
-            status_groups[status].append(issue)
+            status_groups[issue.project_status.value if issue.project_status else "Unknown"].append(issue)
 
         # Report each status group
         for status, status_issues in status_groups.items():
             report.append(f"**{status}** ({len(status_issues)} issues)")
-            for issue in status_issues:
-                assigned_ai = issue.get_assigned_ai()
-                ai_info = f" [{assigned_ai}]" if assigned_ai else ""
-                report.append(f"  • #{issue.number}: {issue.title}{ai_info}")
+            report.extend(
+                f"  • #{issue.number}: {issue.title}{f' [{assigned_ai}]' if (assigned_ai := issue.get_assigned_ai()) else ''}"
+                for issue in status_issues
+            )
             report.append("")
 
         return "\n".join(report)
@@ -215,8 +308,11 @@ Human intervention required. Please review and resolve the error.
             ai_type: AI assistant type
             details: Additional event details
         """
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+
         event_data = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _now_iso(),
             "event_type": event_type,
             "issue_number": issue.number,
             "issue_title": issue.title,
@@ -224,17 +320,33 @@ Human intervention required. Please review and resolve the error.
             "status": issue.project_status.value if issue.project_status else None,
             "details": details,
         }
-
-        self.logger.info(f"Workflow event: {json.dumps(event_data, indent=2)}")
+        self.logger.info("Workflow event: %s", json.dumps(event_data, indent=2))
 
 
 class WorkflowTracker:
-    """Tracks workflow progress and generates analytics."""
+    """Tracks workflow progress and generates analytics.
+
+    Events are stored column by column, in compact arrays the metrics scan
+    directly. With a log_path each event is also appended to that file, as a
+    JSON line, when it is tracked.
 
-    def __init__(self):
+    Args:
+        log_path: Optional JSON Lines file tracked events are appended to
+    """
+
+    def __init__(self, log_path: str | Path | None = None):
         """Initialize workflow tracker."""
-        self.events = []
         self.logger = logging.getLogger(__name__)
+        self._timestamps: list[str] = []
+        self._event_types: list[str] = []
+        self._issue_numbers = array("q")
+        self._ai_types: list[str] = []
+        # NaN marks events without a duration
+        self._durations = array("d")
+        self._successes = bytearray()
+        self.log_path = Path(log_path) if log_path else None
+        self._log: IO[str] | None = None
+        self._events: list[dict[str, Any]] | None = None
 
     def track_event(
         self, event_type: str, issue_number: int, ai_type: AiaType, duration: float | None = None, success: bool = True
@@ -248,17 +360,47 @@ class WorkflowTracker:
             duration: Optional duration in seconds
             success: Whether the event was successful
         """
-        event = {
-            "timestamp": datetime.now().isoformat(),
-            "event_type": event_type,
-            "issue_number": issue_number,
-            "ai_type": ai_type.value,
-            "duration": duration,
-            "success": success,
-        }
+        self._timestamps.append(datetime.now().isoformat())
+        self._event_types.append(event_type)
+        self._issue_numbers.append(issue_number)
+        self._ai_types.append(ai_type.value)
+        self._durations.append(math.nan if duration is None else duration)
+        self._successes.append(success)
+        self._events = None
+
+        log_info = self.logger.isEnabledFor(logging.INFO)
+        if self.log_path or log_info:
+            line = json.dumps(self._event(len(self._successes) - 1))
+            if self.log_path:
+                if self._log is None:
+                    # line buffered, so every event reaches the file as soon as it is tracked
+                    self._log = open(self.log_path, "a", buffering=1)  # noqa: SIM115
+                self._log.write(f"{line}\n")
+            if log_info:
+                self.logger.info("Tracked event: %s", line)
+
+    @property
+    def events(self) -> list[dict[str, Any]]:
+        """Snapshot of the tracked events as dictionaries.
+
+        Built on first access after an event is tracked and reused until the next one,
+        so indexing it in a loop stays linear.
+        """
+        if self._events is None:
+            self._events = [self._event(index) for index in range(len(self._successes))]
+        return self._events
 
-        self.events.append(event)
-        self.logger.info(f"Tracked event: {json.dumps(event)}")
+    def _event(self, index: int) -> dict[str, Any]:
+        """Build the dictionary of the tracked event at index."""
+        duration = self._durations[index]
+        return {
+            "timestamp": self._timestamps[index],
+            "event_type": self._event_types[index],
+            "issue_number": self._issue_numbers[index],
+            "ai_type": self._ai_types[index],
+            "duration": None if math.isnan(duration) else duration,
+            "success": bool(self._successes[index]),
+        }
 
     def get_workflow_metrics(self) -> dict[str, Any]:
         """Get workflow performance metrics.
@@ -266,34 +408,30 @@ class WorkflowTracker:
         Returns:
             Dictionary containing workflow metrics
         """
-        if not self.events:
+        total_events = len(self._successes)
+        if not total_events:
             return {"total_events": 0, "message": "No events tracked yet"}
 
-        total_events = len(self.events)
-        successful_events = sum(1 for e in self.events if e["success"])
+        successful_events = sum(self._successes)
         success_rate = (successful_events / total_events) * 100
 
         # Calculate average duration for events that have duration
-        durations = [e["duration"] for e in self.events if e["duration"] is not None]
+        durations = list(filterfalse(math.isnan, self._durations))
         avg_duration = sum(durations) / len(durations) if durations else 0
 
-        # Count events by AI type
-        ai_counts = {}
-        for event in self.events:
-            ai_type = event["ai_type"]
-            ai_counts[ai_type] = ai_counts.get(ai_type, 0) + 1
-
         return {
             "total_events": total_events,
             "successful_events": successful_events,
             "success_rate": round(success_rate, 2),
             "average_duration": round(avg_duration, 2),
-            "ai_type_distribution": ai_counts,
-            "latest_event": self.events[-1] if self.events else None,
+            "ai_type_distribution": dict(Counter(self._ai_types)),
+            "latest_event": self._event(total_events - 1),
         }
 
     def export_events(self, filename: str) -> bool:
-        """Export tracked events to JSON file.
+        """Export the events tracked by this tracker to JSON Lines file, one event per line.
+
+        Events from earlier runs in the log_path file are not exported.
 
         Args:
             filename: Output filename
@@ -303,8 +441,22 @@ class WorkflowTracker:
         """
         try:
             with open(filename, "w") as f:
-                json.dump(self.events, f, indent=2)
+                f.writelines(f"{json.dumps(self._event(index))}\n" for index in range(len(self._successes)))
             return True
         except Exception as e:
-            self.logger.error(f"Failed to export events: {e}")
+            self.logger.error("Failed to export events: %s", e)
             return False
+
+    def close(self) -> None:
+        """Close the event log file."""
+        if self._log:
+            self._log.close()
+            self._log = None
+
+    def __enter__(self) -> "WorkflowTracker":
+        """Enter context, returning the tracker."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Exit context, closing the event log file."""
+        self.close()
@@ -7,22 +7,146 @@ GitHub repositories and project boards for AI assistant workflows.
 import json
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
 from pathlib import Path
 
+from aia.gh_client import GhApiError, GhHttpClient, decode_json
 from aia.models import WorkflowConfig, WorkflowStatus, GitOperation
 from aia.git_aia_manager import AiaType
 
 
+# Upper bound of labels created at the same time
+MAX_CONCURRENT_LABEL_CREATES = 10
+
+# Project board title of the repository owner's project with the given number
+_GRAPHQL_PROJECT_QUERY = """
+query($owner: String!, $number: Int!) {
+  repositoryOwner(login: $owner) {
+    ... on ProjectV2Owner { projectV2(number: $number) { number title url } }
+  }
+}
+"""
+
+# Node ids of the repository and its owner, needed to create a project
+_GRAPHQL_REPOSITORY_IDS_QUERY = """
+query($owner: String!, $name: String!) {
+  repository(owner: $owner, name: $name) { id owner { id } }
+}
+"""
+
+# Project creation, linked to the repository
+_GRAPHQL_CREATE_PROJECT_MUTATION = """
+mutation($ownerId: ID!, $repositoryId: ID!, $title: String!) {
+  createProjectV2(input: {ownerId: $ownerId, repositoryId: $repositoryId, title: $title}) { projectV2 { number } }
+}
+"""
+
+
+# Issue templates written to .github/ISSUE_TEMPLATE, as (file name, content) pairs
+_ISSUE_TEMPLATES = (
+    (
+        "bug_report.md",
+        b"""---
+name: Bug Report
+about: Create a bug report for ai-coder to fix
+title: '[BUG] '
+labels: bug
+assignees: ''
+
+---
+
+**Describe the bug**
+A clear and concise description of what the bug is.
+
+**To Reproduce**
+Steps to reproduce the behavior:
+1. Go to '...'
+2. Click on '....'
+3. Scroll down to '....'
+4. See error
+
+**Expected behavior**
+A clear and concise description of what you expected to happen.
+
+**Screenshots**
+If applicable, add screenshots to help explain your problem.
+
+**Additional context**
+Add any other context about the problem here.
+""",
+    ),
+    (
+        "feature_request.md",
+        b"""---
+name: Feature Request
+about: Suggest a new feature for ai-coder to implement
+title: '[FEATURE] '
+labels: feature
+assignees: ''
+
+---
+
+**Is your feature request related to a problem? Please describe.**
+A clear and concise description of what the problem is. Ex. I'm always frustrated when [...]
+
+**Describe the solution you'd like**
+A clear and concise description of what you want to happen.
+
+**Describe alternatives you've considered**
+A clear and concise description of any alternative solutions or features you've considered.
+
+**Additional context**
+Add any other context or screenshots about the feature request here.
+""",
+    ),
+    (
+        "documentation.md",
+        b"""---
+name: Documentation
+about: Request documentation creation or updates
+title: '[DOCS] '
+labels: documentation
+assignees: ''
+
+---
+
+**Documentation needed**
+Describe what documentation needs to be created or updated.
+
+**Target audience**
+Who is this documentation for? (developers, users, maintainers)
+
+**Scope**
+What should be covered in the documentation?
+
+**Format**
+What format should the documentation be in? (README, Wiki, inline comments, etc.)
+
+**Additional context**
+Add any other context about the documentation request here.
+""",
+    ),
+)
+
+
 class ProjectBoardSetup:
-    """Handles GitHub project board setup and validation."""
+    """Handles GitHub project board setup and validation.
+
+    Args:
+        config: Workflow configuration
+        http_client: Optional keep-alive GitHub API client used instead of a gh process per call
+    """
 
-    def __init__(self, config: WorkflowConfig):
+    def __init__(self, config: WorkflowConfig, http_client: GhHttpClient | None = None):
         """Initialize setup with workflow configuration.
 
         Args:
             config: Workflow configuration
+            http_client: Optional keep-alive GitHub API client
         """
         self.config = config
+        self.http_client = http_client
         self.required_columns = [status.value for status in WorkflowStatus]
         self.required_labels = [
             "bug",
@@ -69,12 +193,16 @@ class ProjectBoardSetup:
             GitOperation result of validation
         """
         try:
-            cmd = ["gh", "repo", "view", self.config.repo_full_name, "--json", "name,owner,url"]
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-
-            repo_data = json.loads(result.stdout)
+            if self.http_client is not None:
+                repo = self._rest_send("GET", f"/repos/{self.config.repo_full_name}")
+                repo_data = {"name": repo["name"], "owner": {"login": repo["owner"]["login"]}, "url": repo["html_url"]}
+                output = json.dumps(repo_data)
+            else:
+                cmd = ["gh", "repo", "view", self.config.repo_full_name, "--json", "name,owner,url"]
+                output = subprocess.run(cmd, capture_output=True, text=True, check=True).stdout
+                repo_data = json.loads(output)
 
-            return GitOperation(success=True, message=f"Repository access validated: {repo_data['url']}", output=result.stdout)
+            return GitOperation(success=True, message=f"Repository access validated: {repo_data['url']}", output=output)
         except subprocess.CalledProcessError as e:
             return GitOperation(success=False, message=f"Repository access validation failed: {e.stderr}", error=e.stderr)
 
@@ -88,6 +216,12 @@ class ProjectBoardSetup:
             GitOperation result with project number if successful
         """
         try:
+            if self.http_client is not None:
+                project_number = self._create_project_graphql(project_name)
+                return GitOperation(
+                    success=True, message=f"Project board created with number: {project_number}", output=str(project_number)
+                )
+
             # Create project
             cmd = ["gh", "project", "create", "--owner", self.config.repo_owner, "--title", project_name, "--format", "json"]
 
@@ -115,18 +249,22 @@ class ProjectBoardSetup:
 
         try:
             # Get project details
-            cmd = ["gh", "project", "view", str(self.config.project_number), "--format", "json"]
-
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-            project_data = json.loads(result.stdout)
+            if self.http_client is not None:
+                data = self.http_client.graphql(_GRAPHQL_PROJECT_QUERY, owner=self.config.repo_owner, number=self.config.project_number)
+                project_data = (data.get("repositoryOwner") or {}).get("projectV2")
+                if project_data is None:
+                    return GitOperation(success=False, message=f"Project board {self.config.project_number} not found")
+                output = json.dumps(project_data)
+            else:
+                cmd = ["gh", "project", "view", str(self.config.project_number), "--format", "json"]
+                output = subprocess.run(cmd, capture_output=True, text=True, check=True).stdout
+                project_data = json.loads(output)
 
             # Check if all required columns exist
             # Note: This is a simplified check - actual column validation would require
             # more complex GitHub API calls
 
-            return GitOperation(
-                success=True, message=f"Project board validated: {project_data.get('title', 'Unknown')}", output=result.stdout
-            )
+            return GitOperation(success=True, message=f"Project board validated: {project_data.get('title', 'Unknown')}", output=output)
         except subprocess.CalledProcessError as e:
             return GitOperation(success=False, message=f"Project board validation failed: {e.stderr}", error=e.stderr)
 
@@ -136,22 +274,11 @@ class ProjectBoardSetup:
         Returns:
             GitOperation result of label creation
         """
-        created_labels = []
-        failed_labels = []
+        with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_LABEL_CREATES) as executor:
+            results = list(executor.map(self._create_one_label, self.required_labels))
 
-        for label in self.required_labels:
-            try:
-                # Try to create the label
-                cmd = ["gh", "label", "create", label, "--repo", self.config.repo_full_name, "--description", f"AI workflow label: {label}"]
-
-                subprocess.run(cmd, capture_output=True, text=True, check=True)
-                created_labels.append(label)
-            except subprocess.CalledProcessError as e:
-                # Label might already exist
-                if "already exists" in e.stderr:
-                    created_labels.append(f"{label} (already exists)")
-                else:
-                    failed_labels.append(f"{label}: {e.stderr}")
+        created_labels = [label for label, success, _error in results if success]
+        failed_labels = [f"{label}: {error}" for label, success, error in results if not success]
 
         if failed_labels:
             return GitOperation(
@@ -162,103 +289,82 @@ class ProjectBoardSetup:
             success=True, message=f"Labels created/validated: {len(created_labels)}", output=f"Created: {', '.join(created_labels)}"
         )
 
-    def setup_issue_templates(self) -> GitOperation:
-        """Create issue templates for AI workflow.
+    def _create_one_label(self, label: str) -> tuple[str, bool, str | None]:
+        """Create one required label.
 
         Returns:
-            GitOperation result of template creation
+            Label as reported, whether it was created or already exists, and the error otherwise
         """
         try:
-            # Create .github directory if it doesn't exist
-            github_dir = Path(".github")
-            github_dir.mkdir(exist_ok=True)
-
-            issue_template_dir = github_dir / "ISSUE_TEMPLATE"
-            issue_template_dir.mkdir(exist_ok=True)
-
-            # Create bug report template
-            bug_template = """---
-name: Bug Report
-about: Create a bug report for ai-coder to fix
-title: '[BUG] '
-labels: bug
-assignees: ''
-
----
-
-**Describe the bug**
-A clear and concise description of what the bug is.
-
-**To Reproduce**
-Steps to reproduce the behavior:
-1. Go to '...'
-2. Click on '....'
-3. Scroll down to '....'
-4. See error
-
-**Expected behavior**
-A clear and concise description of what you expected to happen.
-
-**Screenshots**
-If applicable, add screenshots to help explain your problem.
-
-**Additional context**
-Add any other context about the problem here.
-"""
-
-            # Create feature request template
-            feature_template = """---
-name: Feature Request
-about: Suggest a new feature for ai-coder to implement
-title: '[FEATURE] '
-labels: feature
-assignees: ''
-
----
-
-**Is your feature request related to a problem? Please describe.**
-A clear and concise description of what the problem is. Ex. I'm always frustrated when [...]
+            # Try to create the label
+            description = f"AI workflow label: {label}"
+            if self.http_client is not None:
+                self._create_label_rest(label, description)
+            else:
+                cmd = ["gh", "label", "create", label, "--repo", self.config.repo_full_name, "--description", description]
+                subprocess.run(cmd, capture_output=True, text=True, check=True)
+            return label, True, None
+        except subprocess.CalledProcessError as e:
+            # Label might already exist
+            if "already exists" in e.stderr:
+                return f"{label} (already exists)", True, None
+            return label, False, e.stderr
 
-**Describe the solution you'd like**
-A clear and concise description of what you want to happen.
+    def _create_project_graphql(self, project_name: str) -> int:
+        """Create a project linked to the repository through the GraphQL API.
 
-**Describe alternatives you've considered**
-A clear and concise description of any alternative solutions or features you've considered.
-
-**Additional context**
-Add any other context or screenshots about the feature request here.
-"""
+        Returns:
+            Number of the new project
 
-            # Create documentation template
-            docs_template = """---
-name: Documentation
-about: Request documentation creation or updates
-title: '[DOCS] '
-labels: documentation
-assignees: ''
+        Raises:
+            GhApiError: If the repository can't be read or the project can't be created
+        """
+        repository = self.http_client.graphql(_GRAPHQL_REPOSITORY_IDS_QUERY, owner=self.config.repo_owner, name=self.config.repo_name)[
+            "repository"
+        ]
+        data = self.http_client.graphql(
+            _GRAPHQL_CREATE_PROJECT_MUTATION, ownerId=repository["owner"]["id"], repositoryId=repository["id"], title=project_name
+        )
+        return data["createProjectV2"]["projectV2"]["number"]
 
----
+    def _create_label_rest(self, label: str, description: str) -> None:
+        """Create a repository label through the REST API.
 
-**Documentation needed**
-Describe what documentation needs to be created or updated.
+        Raises:
+            GhApiError: If the label can't be created, with "already exists" in the message for existing labels
+        """
+        response = self.http_client.request(
+            "POST", f"/repos/{self.config.repo_full_name}/labels", body={"name": label, "description": description}
+        )
+        if response.status == 422 and b"already_exists" in response.body:
+            raise GhApiError(f"POST label {label}", f"label {label!r} already exists")
+        if response.status >= 400:
+            raise GhApiError(f"POST label {label}", response.body.decode(errors="replace"))
 
-**Target audience**
-Who is this documentation for? (developers, users, maintainers)
+    def _rest_send(self, method: str, path: str) -> dict:
+        """Send a REST API request through the HTTP client and return its decoded JSON body.
 
-**Scope**
-What should be covered in the documentation?
+        Raises:
+            GhApiError: If the request fails or GitHub answers with an error status
+        """
+        response = self.http_client.request(method, path)
+        if response.status >= 400:
+            raise GhApiError(f"{method} {path}", response.body.decode(errors="replace"))
+        return decode_json(response.body, f"{method} {path}")
 
-**Format**
-What format should the documentation be in? (README, Wiki, inline comments, etc.)
+    def setup_issue_templates(self) -> GitOperation:
+        """Create issue templates for AI workflow.
 
-**Additional context**
-Add any other context about the documentation request here.
-"""
+        Returns:
+            GitOperation result of template creation
+        """
+        try:
+            # Create .github/ISSUE_TEMPLATE directory if it doesn't exist
+            issue_template_dir = Path(".github") / "ISSUE_TEMPLATE"
+            issue_template_dir.mkdir(parents=True, exist_ok=True)
 
-            # Write templates
-            (issue_template_dir / "bug_report.md").write_text(bug_template)
-            (issue_template_dir / "feature_request.md").write_text(feature_template)
-            (issue_template_dir / "documentation.md").write_text(docs_template)
+            for name, template in _ISSUE_TEMPLATES:
+                (issue_template_dir / name).write_bytes(template)
 
             return GitOperation(
                 success=True, message="Issue templates created successfully", output=f"Templates created in {issue_template_dir}"
@@ -302,7 +408,7 @@ Add any other context about the documentation request here.
         """
         results = []
 
-        # Step 1: Validate GitHub CLI
+        # Step 1: Validate GitHub CLI, which every later step relies on
         cli_result = self.validate_github_cli()
         results.append(f"✓ GitHub CLI: {cli_result.message}")
         if not cli_result.success:
@@ -314,30 +420,32 @@ Add any other context about the documentation request here.
         if not repo_result.success:
             return GitOperation(success=False, message="Setup failed at repository validation", error=repo_result.error)
 
-        # Step 3: Create labels
-        label_result = self.create_required_labels()
-        results.append(f"✓ Labels: {label_result.message}")
-        if not label_result.success:
-            results.append(f"  ⚠️  Warning: {label_result.error}")
-
-        # Step 4: Create project board (if project number not provided)
-        if not self.config.project_number:
-            project_result = self.create_project_board(project_name)
-            if project_result.success:
-                self.config.project_number = int(project_result.output)
-                results.append(f"✓ Project Board: Created with number {self.config.project_number}")
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            # Steps 3 and 5: Labels and issue templates don't depend on the project board
+            label_future = executor.submit(self.create_required_labels)
+            template_future = executor.submit(self.setup_issue_templates)
+
+            # Step 4: Create project board (if project number not provided)
+            if not self.config.project_number:
+                project_result = self.create_project_board(project_name)
+                if project_result.success:
+                    self.config = replace(self.config, project_number=int(project_result.output))
+                    project_line = f"✓ Project Board: Created with number {self.config.project_number}"
+                else:
+                    project_line = f"✗ Project Board: {project_result.message}"
             else:
-                results.append(f"✗ Project Board: {project_result.message}")
-        else:
-            validate_result = self.validate_project_board_columns()
-            results.append(f"✓ Project Board: {validate_result.message}")
+                validate_result = self.validate_project_board_columns()
+                project_line = f"✓ Project Board: {validate_result.message}"
 
-        # Step 5: Create issue templates
-        template_result = self.setup_issue_templates()
-        results.append(f"✓ Issue Templates: {template_result.message}")
-
-        # Step 6: Create config file
+        # Step 6: Create config file, which records the project number set in step 4
         config_result = self.create_workflow_config_file()
+
+        label_result = label_future.result()
+        results.append(f"✓ Labels: {label_result.message}")
+        if not label_result.success:
+            results.append(f"  ⚠️  Warning: {label_result.error}")
+        results.append(project_line)
+        results.append(f"✓ Issue Templates: {template_future.result().message}")
         results.append(f"✓ Config File: {config_result.message}")
 
         return GitOperation(success=True, message="Complete setup finished successfully", output="\\n".join(results))
@@ -361,9 +469,10 @@ def main():
     # Create configuration
     config = WorkflowConfig(repo_owner=repo_owner, repo_name=repo_name, project_number=int(project_number) if project_number else None)
 
-    # Run setup
-    setup = ProjectBoardSetup(config)
-    result = setup.run_complete_setup(project_name)
+    # Run setup, sharing one API connection across all steps
+    with GhHttpClient() as http_client:
+        setup = ProjectBoardSetup(config, http_client)
+        result = setup.run_complete_setup(project_name)
 
     if result.success:
         print("\\n✅ Setup completed successfully!")
@@ -0,0 +1,194 @@
+r"""GitHub webhook listener for workflow status updates.
+
+Keeps an in-process snapshot of the workflow status of every issue and refreshes it
+from GitHub ``issues`` and ``projects_v2_item`` webhook events instead of polling
+GitHub with ``gh`` on every status request.
+
+Register the webhook for a repository with::
+
+    gh api repos/:owner/:repo/hooks \
+        -f name=web \
+        -f "config[url]=https://your-host.example.com/webhook" \
+        -f "config[content_type]=json" \
+        -f "config[secret]=$AIA_WEBHOOK_SECRET" \
+        -f "events[]=issues" \
+        -f "events[]=projects_v2_item"
+
+Project (v2) events are delivered to organization webhooks only; register the same
+hook with ``gh api orgs/:org/hooks`` when the project board belongs to an organization.
+"""
+
+import hashlib
+import hmac
+import json
+import logging
+import threading
+from collections.abc import Iterable
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+from aia.models import Issue, WorkflowStatus
+
+
+# Largest delivery accepted; GitHub caps webhook payloads at 25 MB
+MAX_WEBHOOK_BODY_BYTES = 25 * 1024 * 1024
+
+
+class WorkflowCache:
+    """Thread-safe workflow status snapshot keyed by issue number."""
+
+    def __init__(self):
+        """Initialize an empty (cold) cache."""
+        self._lock = threading.Lock()
+        self._statuses: dict[int, WorkflowStatus | None] = {}
+        self._populated = False
+
+    @property
+    def populated(self) -> bool:
+        """Whether the cache holds a complete snapshot."""
+        return self._populated
+
+    def load(self, issues: Iterable[Issue]) -> None:
+        """Replace the snapshot with the given issues.
+
+        Args:
+            issues: All open issues with their project status
+        """
+        statuses = {issue.number: issue.project_status for issue in issues}
+        with self._lock:
+            self._statuses = statuses
+            self._populated = True
+
+    def update(self, issue_number: int, status: WorkflowStatus | None) -> None:
+        """Set the workflow status of a single issue.
+
+        Args:
+            issue_number: Issue number
+            status: New workflow status, None if the issue is not on the board
+        """
+        with self._lock:
+            self._statuses[issue_number] = status
+
+    def remove(self, issue_number: int) -> None:
+        """Drop an issue from the snapshot.
+
+        Args:
+            issue_number: Issue number
+        """
+        with self._lock:
+            self._statuses.pop(issue_number, None)
+
+    def invalidate(self) -> None:
+        """Drop the snapshot so the next read goes back to GitHub."""
+        with self._lock:
+            self._statuses = {}
+            self._populated = False
+
+    def status_counts(self) -> dict[WorkflowStatus, int]:
+        """Count cached issues by workflow status.
+
+        Returns:
+            Dictionary mapping workflow status to issue count
+        """
+        status_counts = {status: 0 for status in WorkflowStatus}
+        with self._lock:
+            for status in self._statuses.values():
+                if status:
+                    status_counts[status] += 1
+        return status_counts
+
+
+def verify_signature(secret: bytes, body: bytes, signature: str | None) -> bool:
+    """Validate the X-Hub-Signature-256 header of a webhook delivery.
+
+    Args:
+        secret: Webhook secret configured on GitHub
+        body: Raw request body
+        signature: Value of the X-Hub-Signature-256 header
+
+    Returns:
+        True if the signature matches the body
+    """
+    if not signature:
+        return False
+    expected = "sha256=" + hmac.new(secret, body, hashlib.sha256).hexdigest()
+    return hmac.compare_digest(expected, signature)
+
+
+def apply_event(cache: WorkflowCache, event: str, payload: dict[str, Any]) -> None:
+    """Apply a GitHub webhook event to the workflow cache.
+
+    Args:
+        cache: Workflow cache to update
+        event: Value of the X-GitHub-Event header
+        payload: Decoded webhook payload
+    """
+    if event == "issues":
+        issue_number = payload["issue"]["number"]
+        if payload.get("action") in ("closed", "deleted", "transferred"):
+            cache.remove(issue_number)
+        elif payload.get("action") in ("opened", "reopened"):
+            cache.update(issue_number, None)
+    elif event == "projects_v2_item":
+        # Item payloads reference the issue by node id only, so re-read the board on next request
+        cache.invalidate()
+
+
+class WebhookHandler(BaseHTTPRequestHandler):
+    """Request handler accepting signed GitHub webhook deliveries."""
+
+    server: "WebhookServer"
+
+    def do_POST(self):  # noqa: N802
+        """Validate and apply a webhook delivery."""
+        try:
+            content_length = int(self.headers.get("Content-Length", 0))
+        except ValueError:
+            content_length = -1
+        if not 0 <= content_length <= MAX_WEBHOOK_BODY_BYTES:
+            self.server.logger.warning("Rejecting webhook delivery with Content-Length %r", self.headers.get("Content-Length"))
+            # The unread body can't be skipped reliably, so the connection is not reused
+            self.close_connection = True
+            self.send_response(HTTPStatus.BAD_REQUEST if content_length < 0 else HTTPStatus.CONTENT_TOO_LARGE)
+            self.end_headers()
+            return
+        body = self.rfile.read(content_length)
+
+        if not verify_signature(self.server.secret, body, self.headers.get("X-Hub-Signature-256")):
+            self.send_response(HTTPStatus.UNAUTHORIZED)
+            self.end_headers()
+            return
+
+        try:
+            apply_event(self.server.cache, self.headers.get("X-GitHub-Event", ""), json.loads(body))
+        except (json.JSONDecodeError, KeyError, TypeError) as e:
+            self.server.logger.warning("Ignoring malformed webhook delivery: %s", e)
+            self.send_response(HTTPStatus.BAD_REQUEST)
+            self.end_headers()
+            return
+
+        self.send_response(HTTPStatus.NO_CONTENT)
+        self.end_headers()
+
+    def log_message(self, format, *args):  # noqa: A002
+        """Route access logs through the module logger."""
+        self.server.logger.debug(format, *args)
+
+
+class WebhookServer(ThreadingHTTPServer):
+    """HTTP server feeding GitHub webhook events into a WorkflowCache.
+
+    Args:
+        cache: Workflow cache shared with the WorkflowCoordinator
+        secret: Webhook secret configured on GitHub
+        host: Interface to listen on
+        port: Port to listen on
+    """
+
+    def __init__(self, cache: WorkflowCache, secret: str, host: str = "127.0.0.1", port: int = 8080):
+        """Initialize webhook server."""
+        super().__init__((host, port), WebhookHandler)
+        self.cache = cache
+        self.secret = secret.encode()
+        self.logger = logging.getLogger(__name__)
@@ -4,36 +4,115 @@ Orchestrates the AI assistant workflow, managing transitions between
 different AI types and workflow states in the kanban process.
 """
 
+import asyncio
 import logging
-
+import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from collections.abc import Callable, Generator
+from contextlib import contextmanager
+
+from aia.cache import IssueCache
+from aia.gh_client import GhHttpClient
 from aia.git_aia_manager import AiaManagerBase, AiaType, AiaManagerFactory
 from aia.models import Issue, WorkflowConfig, WorkflowStatus, GitOperation
+from aia.webhook_server import WorkflowCache
 from aia import abk_common
 
 
-class WorkflowCoordinator:
+# Upper bound of provider calls (gh processes) running at the same time from async methods
+MAX_CONCURRENT_PROVIDER_CALLS = 10
+
+# Seconds a fetched issue, or issue list, is served from memory before asking the provider again
+ISSUE_CACHE_TTL = 60.0
+ISSUE_LIST_CACHE_TTL = 15.0
+
+# Assignment label of each AI type, e.g. "assigned:ai-coder"
+_ASSIGNED_LABEL = {ai_type: f"assigned:{ai_type.value}" for ai_type in AiaType}
+_ALL_ASSIGNED_LABELS = tuple(_ASSIGNED_LABEL.values())
+
+
+class WorkflowCoordinator(metaclass=abk_common.TracedMeta):
     """Coordinates workflow between different AI assistants.
 
     Manages the complete AI assistant workflow from issue assignment
     through code implementation, review, testing, and PR creation.
+    Public methods are traced when AIA_TRACE is set (see abk_common.TracedMeta).
 
     Args:
         provider: Git provider name ("github", "gitlab", "bitbucket")
         config: Workflow configuration with repository settings
+        cache: Optional workflow cache kept warm by the webhook server
+        issue_cache: ETag cache making single issue reads conditional requests; an in-memory cache
+            is created when not given for "github"
+        http_client: Keep-alive GitHub API client shared by all managers, created when not given for "github";
+            closed when the coordinator is used as a context manager
     """
 
-    def __init__(self, config: WorkflowConfig, provider: str = "github"):
+    __slots__ = (
+        "provider",
+        "config",
+        "cache",
+        "http_client",
+        "logger",
+        "managers",
+        "coder_manager",
+        "reviewer_manager",
+        "tester_manager",
+        "researcher_manager",
+        "marketeer_manager",
+        "_provider_calls",
+        "_cache_lock",
+        "_issue_cache",
+        "_issue_list_cache",
+    )
+
+    def __init__(
+        self,
+        config: WorkflowConfig,
+        provider: str = "github",
+        cache: WorkflowCache | None = None,
+        issue_cache: IssueCache | None = None,
+        http_client: GhHttpClient | None = None,
+    ):
         """Initialize workflow coordinator with managers for all AI types."""
         self.provider = provider
         self.config = config
+        self.cache = cache
+        if provider.lower() == "github":
+            # One connection pool for every AI type; the token is read on first request
+            http_client = http_client or GhHttpClient()
+            # Issues re-read after ISSUE_CACHE_TTL are revalidated by ETag; 304s cost no rate limit
+            issue_cache = issue_cache or IssueCache(":memory:")
+        self.http_client = http_client
         self.logger = logging.getLogger(__name__)
+        self._provider_calls = threading.BoundedSemaphore(MAX_CONCURRENT_PROVIDER_CALLS)
+        self._cache_lock = threading.Lock()
+        self._issue_cache: dict[tuple[str, str, int], tuple[float, Issue]] = {}
+        self._issue_list_cache: dict[tuple, tuple[float, list[Issue]]] = {}
 
         # Create managers for each AI type
         self.managers: dict[AiaType, AiaManagerBase] = {}
         for ai_type in AiaType:
-            self.managers[ai_type] = AiaManagerFactory.create_manager(provider, ai_type, config)
+            self.managers[ai_type] = AiaManagerFactory.create_manager(provider, ai_type, config, issue_cache, http_client)
+
+        # Direct references for the workflow methods
+        self.coder_manager = self.managers[AiaType.AI_CODER]
+        self.reviewer_manager = self.managers[AiaType.AI_REVIEWER]
+        self.tester_manager = self.managers[AiaType.AI_TESTER]
+        self.researcher_manager = self.managers[AiaType.AI_RESEARCHER]
+        self.marketeer_manager = self.managers[AiaType.AI_MARKETEER]
+
+    def __enter__(self) -> "WorkflowCoordinator":
+        """Enter context, returning the coordinator."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Exit context, closing the HTTP client connection."""
+        if self.http_client is not None:
+            self.http_client.close()
 
-    @abk_common.function_trace
     def get_manager(self, ai_type: AiaType) -> AiaManagerBase:
         """Get manager for specific AI type.
 
@@ -45,7 +124,94 @@ class WorkflowCoordinator:
         """
         return self.managers[ai_type]
 
-    @abk_common.function_trace
+    def _get_issue(self, ai_type: AiaType, issue_number: int) -> Issue | None:
+        """Get an issue through the AI type's manager, served from memory for ISSUE_CACHE_TTL seconds.
+
+        Args:
+            ai_type: AI assistant type whose manager fetches the issue
+            issue_number: Issue number
+
+        Returns:
+            Issue or None if not found
+        """
+        key = (self.provider, self.config.repo_full_name, issue_number)
+        now = time.monotonic()
+        with self._cache_lock:
+            cached = self._issue_cache.get(key)
+        if cached and cached[0] > now:
+            return cached[1]
+
+        issue = self.managers[ai_type].get_issue(issue_number)
+        if issue is not None:
+            with self._cache_lock:
+                self._issue_cache[key] = (now + ISSUE_CACHE_TTL, issue)
+        return issue
+
+    def _get_issues(self, ai_type: AiaType, status: WorkflowStatus, **filters) -> list[Issue]:
+        """Get issues through the AI type's manager, served from memory for ISSUE_LIST_CACHE_TTL seconds.
+
+        Args:
+            ai_type: AI assistant type whose manager fetches the issues
+            status: Workflow status filter
+            **filters: Label filters passed on to the manager
+
+        Returns:
+            List of issues
+        """
+        key = (status, *sorted(filters.items()))
+        now = time.monotonic()
+        with self._cache_lock:
+            cached = self._issue_list_cache.get(key)
+        if cached and cached[0] > now:
+            return cached[1]
+
+        issues = self.managers[ai_type].get_issues(status, **filters)
+        with self._cache_lock:
+            self._issue_list_cache[key] = (now + ISSUE_LIST_CACHE_TTL, issues)
+        return issues
+
+    def _load_and_validate(
+        self, ai_type: AiaType, issue_number: int, expected_status: WorkflowStatus | None = None, expected_assignee: AiaType | None = None
+    ) -> tuple[Issue | None, GitOperation | None]:
+        """Get an issue, from the TTL cache when fresh, and check it is ready for a workflow step.
+
+        Args:
+            ai_type: AI type whose manager fetches the issue on a cache miss
+            issue_number: Issue number
+            expected_status: Required project board status, if any
+            expected_assignee: Required assigned AI type, if any
+
+        Returns:
+            Tuple of (issue, None) if the issue passes, otherwise (None, failed GitOperation)
+        """
+        issue = self._get_issue(ai_type, issue_number)
+        if not issue:
+            return None, GitOperation(success=False, message=f"Issue {issue_number} not found")
+
+        if expected_status is not None and issue.project_status != expected_status:
+            # Column name without its emoji, e.g. "ToDo"
+            column = expected_status.value.split(" ", 1)[-1]
+            return None, GitOperation(success=False, message=f"Issue {issue_number} is not in {column} status")
+
+        if expected_assignee is not None and issue.get_assigned_ai() != expected_assignee.value:
+            return None, GitOperation(success=False, message=f"Issue {issue_number} is not assigned to {expected_assignee.value}")
+
+        return issue, None
+
+    @contextmanager
+    def _invalidates_issue(self, issue_number: int) -> Generator[None]:
+        """Drop cached copies of an issue, and all cached issue lists, once the enclosed writes are done.
+
+        Args:
+            issue_number: Issue number being modified
+        """
+        try:
+            yield
+        finally:
+            with self._cache_lock:
+                self._issue_cache.pop((self.provider, self.config.repo_full_name, issue_number), None)
+                self._issue_list_cache.clear()
+
     def start_coder_workflow(self, issue_number: int) -> GitOperation:
         """Start ai-coder workflow: ToDo → Doing, assign to ai-coder, create branch.
 
@@ -55,38 +221,28 @@ class WorkflowCoordinator:
         Returns:
             GitOperation with branch name in output if successful
         """
-        coder_manager = self.get_manager(AiaType.AI_CODER)
+        # Get the issue and check it is in ToDo status
+        issue, error = self._load_and_validate(AiaType.AI_CODER, issue_number, expected_status=WorkflowStatus.TODO)
+        if error:
+            return error
 
-        # Get the issue
-        issue = coder_manager.get_issue(issue_number)
-        if not issue:
-            return GitOperation(success=False, message=f"Issue {issue_number} not found")
+        with self._invalidates_issue(issue_number):
+            # Move to Doing status and assign to ai-coder
+            result = self.coder_manager.batch_transition(issue, WorkflowStatus.DOING, AiaType.AI_CODER)
+            if not result.success:
+                return result
 
-        # Check if issue is in ToDo status
-        if issue.project_status != WorkflowStatus.TODO:
-            return GitOperation(success=False, message=f"Issue {issue_number} is not in ToDo status")
-
-        # Move to Doing status
-        result = coder_manager.update_issue_status(issue, WorkflowStatus.DOING)
-        if not result.success:
-            return result
-
-        # Assign to ai-coder
-        result = coder_manager.assign_to_ai(issue, AiaType.AI_CODER)
-        if not result.success:
-            return result
+            # Create branch
+            result = self.coder_manager.create_branch(issue)
+            if not result.success:
+                return result
 
-        # Create branch
-        result = coder_manager.create_branch(issue)
-        if not result.success:
-            return result
+            branch_name = result.output
 
-        branch_name = result.output
-        self.logger.info(f"Started coder workflow for issue {issue_number} on branch {branch_name}")
+        self.logger.info("Started coder workflow for issue %s on branch %s", issue_number, branch_name)
 
         return GitOperation(success=True, message=f"Started coder workflow for issue {issue_number}", output=branch_name)
 
-    @abk_common.function_trace
     def complete_coder_workflow(self, issue_number: int) -> GitOperation:
         """Complete ai-coder workflow: Doing → Review, assign to ai-reviewer.
 
@@ -96,32 +252,21 @@ class WorkflowCoordinator:
         Returns:
             GitOperation with success/failure details
         """
-        coder_manager = self.get_manager(AiaType.AI_CODER)
+        # Get the issue and check it is assigned to ai-coder
+        issue, error = self._load_and_validate(AiaType.AI_CODER, issue_number, expected_assignee=AiaType.AI_CODER)
+        if error:
+            return error
 
-        # Get the issue
-        issue = coder_manager.get_issue(issue_number)
-        if not issue:
-            return GitOperation(success=False, message=f"Issue {issue_number} not found")
+        with self._invalidates_issue(issue_number):
+            # Move to Review status and assign to ai-reviewer
+            result = self.coder_manager.batch_transition(issue, WorkflowStatus.REVIEW, AiaType.AI_REVIEWER)
+            if not result.success:
+                return result
 
-        # Check if assigned to ai-coder
-        if issue.get_assigned_ai() != AiaType.AI_CODER.value:
-            return GitOperation(success=False, message=f"Issue {issue_number} is not assigned to ai-coder")
-
-        # Move to Review status
-        result = coder_manager.update_issue_status(issue, WorkflowStatus.REVIEW)
-        if not result.success:
-            return result
-
-        # Assign to ai-reviewer
-        result = coder_manager.assign_to_ai(issue, AiaType.AI_REVIEWER)
-        if not result.success:
-            return result
-
-        self.logger.info(f"Completed coder workflow for issue {issue_number}, assigned to reviewer")
+        self.logger.info("Completed coder workflow for issue %s, assigned to reviewer", issue_number)
 
         return GitOperation(success=True, message=f"Completed coder workflow for issue {issue_number}")
 
-    @abk_common.function_trace
     def complete_reviewer_workflow(self, issue_number: int) -> GitOperation:
         """Complete ai-reviewer workflow: Review → Testing, assign to ai-tester.
 
@@ -131,32 +276,21 @@ class WorkflowCoordinator:
         Returns:
             GitOperation with success/failure details
         """
-        reviewer_manager = self.get_manager(AiaType.AI_REVIEWER)
-
-        # Get the issue
-        issue = reviewer_manager.get_issue(issue_number)
-        if not issue:
-            return GitOperation(success=False, message=f"Issue {issue_number} not found")
-
-        # Check if assigned to ai-reviewer
-        if issue.get_assigned_ai() != AiaType.AI_REVIEWER.value:
-            return GitOperation(success=False, message=f"Issue {issue_number} is not assigned to ai-reviewer")
+        # Get the issue and check it is assigned to ai-reviewer
+        issue, error = self._load_and_validate(AiaType.AI_REVIEWER, issue_number, expected_assignee=AiaType.AI_REVIEWER)
+        if error:
+            return error
 
-        # Move to Testing status
-        result = reviewer_manager.update_issue_status(issue, WorkflowStatus.TESTING)
-        if not result.success:
-            return result
-
-        # Assign to ai-tester
-        result = reviewer_manager.assign_to_ai(issue, AiaType.AI_TESTER)
-        if not result.success:
-            return result
+        with self._invalidates_issue(issue_number):
+            # Move to Testing status and assign to ai-tester
+            result = self.reviewer_manager.batch_transition(issue, WorkflowStatus.TESTING, AiaType.AI_TESTER)
+            if not result.success:
+                return result
 
-        self.logger.info(f"Completed reviewer workflow for issue {issue_number}, assigned to tester")
+        self.logger.info("Completed reviewer workflow for issue %s, assigned to tester", issue_number)
 
         return GitOperation(success=True, message=f"Completed reviewer workflow for issue {issue_number}")
 
-    @abk_common.function_trace
     def complete_tester_workflow(self, issue_number: int, pr_title: str, pr_body: str) -> GitOperation:
         """Complete ai-tester workflow: Testing → Done, create PR, unassign AI.
 
@@ -168,40 +302,47 @@ class WorkflowCoordinator:
         Returns:
             GitOperation with success/failure details
         """
-        tester_manager = self.get_manager(AiaType.AI_TESTER)
-
-        # Get the issue
-        issue = tester_manager.get_issue(issue_number)
-        if not issue:
-            return GitOperation(success=False, message=f"Issue {issue_number} not found")
-
-        # Check if assigned to ai-tester
-        if issue.get_assigned_ai() != AiaType.AI_TESTER.value:
-            return GitOperation(success=False, message=f"Issue {issue_number} is not assigned to ai-tester")
-
-        # Generate branch name for PR
-        branch_name = tester_manager.generate_branch_name(issue)
-
-        # Create PR
-        result = tester_manager.create_pr(pr_title, pr_body, branch_name, self.config.default_base_branch)
-        if not result.success:
-            return result
-
-        # Move to Done status
-        result = tester_manager.update_issue_status(issue, WorkflowStatus.DONE)
-        if not result.success:
-            return result
-
-        # Remove AI assignment (ready for human review)
-        result = tester_manager.remove_label_from_issue(issue, f"assigned:{AiaType.AI_TESTER.value}")
-        if not result.success:
-            return result
-
-        self.logger.info(f"Completed tester workflow for issue {issue_number}, PR created")
+        # Get the issue and check it is assigned to ai-tester
+        issue, error = self._load_and_validate(AiaType.AI_TESTER, issue_number, expected_assignee=AiaType.AI_TESTER)
+        if error:
+            return error
+
+        with self._invalidates_issue(issue_number):
+            # Generate branch name for PR
+            branch_name = self.tester_manager.generate_branch_name(issue)
+
+            # Create PR while moving to Done status and removing AI assignment (ready for human review)
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                pr_future = executor.submit(self.tester_manager.create_pr, pr_title, pr_body, branch_name, self.config.default_base_branch)
+                transition_future = executor.submit(
+                    self.tester_manager.batch_transition,
+                    issue,
+                    WorkflowStatus.DONE,
+                    extra_labels_remove=(_ASSIGNED_LABEL[AiaType.AI_TESTER],),
+                )
+                pr_result, transition_result = pr_future.result(), transition_future.result()
+
+            if not pr_result.success:
+                if transition_result.success:
+                    # Without a PR the issue goes back to the tester
+                    rollback_result = self.tester_manager.batch_transition(issue, WorkflowStatus.TESTING, AiaType.AI_TESTER)
+                    if not rollback_result.success:
+                        self.logger.error(
+                            "Issue %s left in Done without a PR, moving back to Testing failed: %s", issue_number, rollback_result.message
+                        )
+                        return GitOperation(
+                            success=False,
+                            message=f"{pr_result.message}; moving issue {issue_number} back to Testing failed: {rollback_result.message}",
+                            error=f"{pr_result.error}; rollback: {rollback_result.error or rollback_result.message}",
+                        )
+                return pr_result
+            if not transition_result.success:
+                return transition_result
+
+        self.logger.info("Completed tester workflow for issue %s, PR created", issue_number)
 
         return GitOperation(success=True, message=f"Completed tester workflow for issue {issue_number}, PR created")
 
-    @abk_common.function_trace
     def get_issues_for_ai(self, ai_type: AiaType, status: WorkflowStatus | None = None) -> list[Issue]:
         """Get issues assigned to specific AI type, optionally filtered by status.
 
@@ -212,49 +353,93 @@ class WorkflowCoordinator:
         Returns:
             List of issues assigned to the AI type
         """
-        manager = self.get_manager(ai_type)
-
         if status:
-            # Get issues with specific status
-            all_issues = manager.get_issues(status)
-            # Filter by AI assignment
-            return [issue for issue in all_issues if issue.get_assigned_ai() == ai_type.value]
+            # Get issues with specific status, narrowed to the AI's label by GitHub
+            all_issues = self._get_issues(ai_type, status, label=_ASSIGNED_LABEL[ai_type])
+            # Filter by AI assignment (an issue's first AI label wins)
+            target = ai_type.value
+            return [issue for issue in all_issues if issue.get_assigned_ai() == target]
         else:
             # Get all issues assigned to this AI
-            return manager.get_assigned_issues()
+            return self.managers[ai_type].get_assigned_issues()
 
-    @abk_common.function_trace
     def get_todo_issues(self) -> list[Issue]:
         """Get unassigned issues in ToDo status ready for ai-coder.
 
         Returns:
             List of issues in ToDo status not assigned to any AI
         """
-        coder_manager = self.get_manager(AiaType.AI_CODER)
-        todo_issues = coder_manager.get_issues(WorkflowStatus.TODO)
+        todo_issues = self._get_issues(AiaType.AI_CODER, WorkflowStatus.TODO, exclude_labels=_ALL_ASSIGNED_LABELS)
 
-        # Filter out issues already assigned to any AI
+        # Filter out issues already assigned to any AI (including labels of unknown AI types)
         return [issue for issue in todo_issues if not issue.is_assigned_to_ai()]
 
-    @abk_common.function_trace
     def get_workflow_status(self) -> dict[WorkflowStatus, int]:
         """Get count of issues by workflow status.
 
+        Reads the webhook fed cache when it is warm. A cold cache is filled from the
+        complete, paginated list of open issues. Without a cache the provider counts
+        the project board directly.
+
         Returns:
             Dictionary mapping workflow status to issue count
         """
-        coder_manager = self.get_manager(AiaType.AI_CODER)
-        all_issues = coder_manager.get_issues()
+        if self.cache is None:
+            return self.coder_manager.get_status_counts()
+        if self.cache.populated:
+            return self.cache.status_counts()
 
-        status_counts = {status: 0 for status in WorkflowStatus}
+        try:
+            all_issues = self.coder_manager.get_project_issues()
+        except subprocess.CalledProcessError as e:
+            # A partial snapshot would keep serving wrong counts, so the cache stays cold
+            self.logger.error("Failed to load issues into the workflow cache: %s", e.stderr)
+            return self.coder_manager.get_status_counts()
 
-        for issue in all_issues:
-            if issue.project_status:
-                status_counts[issue.project_status] += 1
+        self.cache.load(all_issues)
+        return self.cache.status_counts()
 
-        return status_counts
+    def get_workflow_status_counts(self) -> dict[WorkflowStatus, int]:
+        """Get count of issues by workflow status without fetching the issues.
+
+        Returns:
+            Dictionary mapping workflow status to issue count
+        """
+        return self.coder_manager.get_status_counts()
+
+    async def get_workflow_status_async(self) -> dict[WorkflowStatus, int]:
+        """Async variant of get_workflow_status for use with asyncio.gather."""
+        return await self._run_provider_call(self.get_workflow_status)
+
+    async def get_workflow_status_counts_async(self) -> dict[WorkflowStatus, int]:
+        """Async variant of get_workflow_status_counts for use with asyncio.gather."""
+        return await self._run_provider_call(self.get_workflow_status_counts)
+
+    async def get_todo_issues_async(self) -> list[Issue]:
+        """Async variant of get_todo_issues for use with asyncio.gather."""
+        return await self._run_provider_call(self.get_todo_issues)
+
+    async def get_issues_for_ai_async(self, ai_type: AiaType, status: WorkflowStatus | None = None) -> list[Issue]:
+        """Async variant of get_issues_for_ai for use with asyncio.gather."""
+        return await self._run_provider_call(self.get_issues_for_ai, ai_type, status)
+
+    async def _run_provider_call(self, func: Callable, *args):
+        """Run blocking provider call in a worker thread so independent calls overlap.
+
+        Args:
+            func: Blocking coordinator method to run
+            *args: Arguments for the method
+
+        Returns:
+            Result of the method
+        """
+
+        def bounded_call():
+            with self._provider_calls:
+                return func(*args)
+
+        return await asyncio.to_thread(bounded_call)
 
-    @abk_common.function_trace
     def assign_researcher_to_issue(self, issue_number: int) -> GitOperation:
         """Assign ai-researcher to an issue for research phase.
 
@@ -264,23 +449,21 @@ class WorkflowCoordinator:
         Returns:
             GitOperation with success/failure details
         """
-        researcher_manager = self.get_manager(AiaType.AI_RESEARCHER)
-
         # Get the issue
-        issue = researcher_manager.get_issue(issue_number)
-        if not issue:
-            return GitOperation(success=False, message=f"Issue {issue_number} not found")
+        issue, error = self._load_and_validate(AiaType.AI_RESEARCHER, issue_number)
+        if error:
+            return error
 
-        # Assign to ai-researcher
-        result = researcher_manager.assign_to_ai(issue, AiaType.AI_RESEARCHER)
-        if not result.success:
-            return result
+        with self._invalidates_issue(issue_number):
+            # Assign to ai-researcher
+            result = self.researcher_manager.assign_to_ai(issue, AiaType.AI_RESEARCHER)
+            if not result.success:
+                return result
 
-        self.logger.info(f"Assigned ai-researcher to issue {issue_number}")
+        self.logger.info("Assigned ai-researcher to issue %s", issue_number)
 
         return GitOperation(success=True, message=f"Assigned ai-researcher to issue {issue_number}")
 
-    @abk_common.function_trace
     def complete_research_workflow(self, issue_number: int) -> GitOperation:
         """Complete research workflow and unassign ai-researcher.
 
@@ -290,37 +473,29 @@ class WorkflowCoordinator:
         Returns:
             GitOperation with success/failure details
         """
-        researcher_manager = self.get_manager(AiaType.AI_RESEARCHER)
+        # Get the issue and check it is assigned to ai-researcher
+        issue, error = self._load_and_validate(AiaType.AI_RESEARCHER, issue_number, expected_assignee=AiaType.AI_RESEARCHER)
+        if error:
+            return error
 
-        # Get the issue
-        issue = researcher_manager.get_issue(issue_number)
-        if not issue:
-            return GitOperation(success=False, message=f"Issue {issue_number} not found")
+        with self._invalidates_issue(issue_number):
+            # Remove researcher assignment
+            result = self.researcher_manager.batch_transition(issue, extra_labels_remove=(_ASSIGNED_LABEL[AiaType.AI_RESEARCHER],))
+            if not result.success:
+                return result
 
-        # Check if assigned to ai-researcher
-        if issue.get_assigned_ai() != AiaType.AI_RESEARCHER.value:
-            return GitOperation(success=False, message=f"Issue {issue_number} is not assigned to ai-researcher")
-
-        # Remove researcher assignment
-        result = researcher_manager.remove_label_from_issue(issue, f"assigned:{AiaType.AI_RESEARCHER.value}")
-        if not result.success:
-            return result
-
-        self.logger.info(f"Completed research workflow for issue {issue_number}")
+        self.logger.info("Completed research workflow for issue %s", issue_number)
 
         return GitOperation(success=True, message=f"Completed research workflow for issue {issue_number}")
 
-    @abk_common.function_trace
     def trigger_ai_coder(self) -> GitOperation:
         """Trigger ai-coder to pick up the highest priority ToDo issue.
 
         Returns:
             GitOperation with workflow start details
         """
-        coder_manager = self.get_manager(AiaType.AI_CODER)
-
         # Get the top priority ToDo issue
-        top_issue = coder_manager.get_top_priority_todo_issue()
+        top_issue = self.coder_manager.get_top_priority_todo_issue()
         if not top_issue:
             return GitOperation(success=False, message="No ToDo issues available for ai-coder")
 
@@ -329,23 +504,20 @@ class WorkflowCoordinator:
         if not result.success:
             return result
 
-        self.logger.info(f"ai-coder triggered for issue #{top_issue.number}: {top_issue.title}")
+        self.logger.info("ai-coder triggered for issue #%s: %s", top_issue.number, top_issue.title)
 
         return GitOperation(
             success=True, message=f"ai-coder started working on issue #{top_issue.number}: {top_issue.title}", output=result.output
         )
 
-    @abk_common.function_trace
     def trigger_ai_reviewer(self) -> GitOperation:
         """Trigger ai-reviewer to review issues in Review column.
 
         Returns:
             GitOperation with review workflow details
         """
-        reviewer_manager = self.get_manager(AiaType.AI_REVIEWER)
-
         # Get issues in Review column
-        review_issues = reviewer_manager.get_issues_in_column(WorkflowStatus.REVIEW)
+        review_issues = self.reviewer_manager.get_issues_in_column(WorkflowStatus.REVIEW)
         if not review_issues:
             return GitOperation(success=False, message="No issues in Review column for ai-reviewer")
 
@@ -353,30 +525,27 @@ class WorkflowCoordinator:
         issue = review_issues[0]
 
         # Comment on the issue with review start notification
-        comment_result = reviewer_manager.comment_on_pr(
+        comment_result = self.reviewer_manager.comment_on_pr(
             self.config.repo_full_name, issue.number, "🔍 ai-reviewer started reviewing this issue..."
         )
 
         if not comment_result.success:
-            self.logger.warning(f"Could not add review comment: {comment_result.message}")
+            self.logger.warning("Could not add review comment: %s", comment_result.message)
 
-        self.logger.info(f"ai-reviewer triggered for issue #{issue.number}: {issue.title}")
+        self.logger.info("ai-reviewer triggered for issue #%s: %s", issue.number, issue.title)
 
         return GitOperation(
             success=True, message=f"ai-reviewer started reviewing issue #{issue.number}: {issue.title}", output=f"issue_{issue.number}"
         )
 
-    @abk_common.function_trace
     def trigger_ai_tester(self) -> GitOperation:
         """Trigger ai-tester to test issues in Testing column.
 
         Returns:
             GitOperation with testing workflow details
         """
-        tester_manager = self.get_manager(AiaType.AI_TESTER)
-
         # Get issues in Testing column
-        testing_issues = tester_manager.get_issues_in_column(WorkflowStatus.TESTING)
+        testing_issues = self.tester_manager.get_issues_in_column(WorkflowStatus.TESTING)
         if not testing_issues:
             return GitOperation(success=False, message="No issues in Testing column for ai-tester")
 
@@ -384,20 +553,19 @@ class WorkflowCoordinator:
         issue = testing_issues[0]
 
         # Comment on the issue with testing start notification
-        comment_result = tester_manager.comment_on_pr(
+        comment_result = self.tester_manager.comment_on_pr(
             self.config.repo_full_name, issue.number, "🧪 ai-tester started testing this issue..."
         )
 
         if not comment_result.success:
-            self.logger.warning(f"Could not add testing comment: {comment_result.message}")
+            self.logger.warning("Could not add testing comment: %s", comment_result.message)
 
-        self.logger.info(f"ai-tester triggered for issue #{issue.number}: {issue.title}")
+        self.logger.info("ai-tester triggered for issue #%s: %s", issue.number, issue.title)
 
         return GitOperation(
             success=True, message=f"ai-tester started testing issue #{issue.number}: {issue.title}", output=f"issue_{issue.number}"
         )
 
-    @abk_common.function_trace
     def simulate_complete_workflow(self, issue_number: int) -> GitOperation:
         """Simulate a complete AI workflow for testing purposes.
 
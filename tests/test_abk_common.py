@@ -1,8 +1,9 @@
 """Unit tests for abk_common module."""
 
+import os
 from unittest.mock import Mock, patch
 
-from aia.abk_common import function_trace, PerformanceTimer
+from aia.abk_common import function_trace, PerformanceTimer, TRACE_ENV_VAR, TracedMeta
 
 
 class TestFunctionTrace:
@@ -25,13 +26,72 @@ class TestFunctionTrace:
 
         # Check log messages
         calls = mock_logger.info.call_args_list
-        assert "Entering test_function" in str(calls[0])
-        assert "Exiting test_function" in str(calls[1])
+        assert calls[0][0] == ("Entering %s", "test_function")
+        assert calls[1][0] == ("Exiting %s", "test_function")
+
+    @patch("aia.abk_common.logging.getLogger")
+    def test_function_trace_disabled_logger(self, mock_get_logger):
+        """Test function_trace skips logging when INFO is disabled and keeps function metadata."""
+        mock_logger = Mock()
+        mock_logger.isEnabledFor.return_value = False
+        mock_get_logger.return_value = mock_logger
+
+        @function_trace
+        def test_function(x, y):
+            """Add two numbers."""
+            return x + y
+
+        assert test_function(1, 2) == 3
+        mock_logger.info.assert_not_called()
+        mock_get_logger.assert_called_once_with("test_function")
+        assert test_function.__name__ == "test_function"
+        assert test_function.__doc__ == "Add two numbers."
+
+
+class TestTracedMeta:
+    """Test TracedMeta metaclass."""
+
+    @staticmethod
+    def _make_class():
+        class Traced(metaclass=TracedMeta):
+            def public(self):
+                return "public"
+
+            def _private(self):
+                return "private"
+
+            async def run(self):
+                return "async"
+
+        return Traced
+
+    def test_methods_untouched_without_env(self):
+        """Test classes are built unchanged when tracing is not enabled."""
+        with patch.dict(os.environ, clear=True):
+            traced = self._make_class()
+
+        assert not hasattr(traced.public, "__wrapped__")
+        assert traced().public() == "public"
+
+    def test_public_methods_traced_with_env(self):
+        """Test only public synchronous methods are wrapped when tracing is enabled."""
+        with patch.dict(os.environ, {TRACE_ENV_VAR: "1"}):
+            traced = self._make_class()
+
+        assert traced.public.__wrapped__.__name__ == "public"
+        assert not hasattr(traced._private, "__wrapped__")
+        assert not hasattr(traced.run, "__wrapped__")
+        assert traced().public() == "public"
 
 
 class TestPerformanceTimer:
     """Test PerformanceTimer context manager."""
 
+    @staticmethod
+    def _logged_message(mock_logger):
+        message, *args = mock_logger.info.call_args[0]
+        return message % tuple(args)
+
     def test_performance_timer_with_default_logger(self):
         """Test PerformanceTimer with default logger."""
         with patch("aia.abk_common.logging.getLogger") as mock_get_logger:
@@ -54,13 +114,16 @@ class TestPerformanceTimer:
         """Test PerformanceTimer as context manager."""
         mock_logger = Mock()
 
-        with patch("aia.abk_common.timeit.default_timer", side_effect=[1.0, 1.1]), PerformanceTimer("test_operation", mock_logger):
+        with (
+            patch("aia.abk_common.time.perf_counter_ns", side_effect=[1_000_000_000, 1_100_000_000]),
+            PerformanceTimer("test_operation", mock_logger),
+        ):
             # Simulate some work
             pass
 
         # Check that logger.info was called with timing information
         mock_logger.info.assert_called_once()
-        call_args = mock_logger.info.call_args[0][0]
+        call_args = self._logged_message(mock_logger)
         assert "Executing test_operation took" in call_args
         assert "ms" in call_args
 
@@ -69,9 +132,44 @@ class TestPerformanceTimer:
         mock_logger = Mock()
 
         # Mock timer to return specific values
-        with patch("aia.abk_common.timeit.default_timer", side_effect=[1.0, 1.05]), PerformanceTimer("test_operation", mock_logger):
+        with (
+            patch("aia.abk_common.time.perf_counter_ns", side_effect=[1_000_000_000, 1_050_000_000]),
+            PerformanceTimer("test_operation", mock_logger),
+        ):
             pass
 
         # Should log 50ms (0.05 seconds * 1000)
-        call_args = mock_logger.info.call_args[0][0]
+        call_args = self._logged_message(mock_logger)
         assert "50." in call_args and "ms" in call_args
+
+    def test_performance_timer_perf_counter_ns(self):
+        """Test PerformanceTimer reads perf_counter_ns and converts nanoseconds to milliseconds."""
+        mock_logger = Mock()
+
+        with (
+            patch("aia.abk_common.time.perf_counter_ns", side_effect=[0, 1_234_567]) as mock_counter,
+            PerformanceTimer("test_operation", mock_logger),
+        ):
+            pass
+
+        assert mock_counter.call_count == 2
+        assert self._logged_message(mock_logger) == "Executing test_operation took 1.235 ms"
+
+    def test_performance_timer_defers_formatting(self):
+        """Test PerformanceTimer passes format arguments to the logger instead of a formatted string."""
+        mock_logger = Mock()
+
+        with patch("aia.abk_common.time.perf_counter_ns", side_effect=[0, 50_000_000]), PerformanceTimer("test_operation", mock_logger):
+            pass
+
+        assert mock_logger.info.call_args[0] == ("Executing %s took %.3f ms", "test_operation", 50.0)
+
+    def test_performance_timer_skips_disabled_logger(self):
+        """Test PerformanceTimer does not log when INFO is disabled."""
+        mock_logger = Mock()
+        mock_logger.isEnabledFor.return_value = False
+
+        with PerformanceTimer("test_operation", mock_logger):
+            pass
+
+        mock_logger.info.assert_not_called()
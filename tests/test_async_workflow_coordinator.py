@@ -0,0 +1,75 @@
+"""Unit tests for async_workflow_coordinator module."""
+
+import asyncio
+from unittest.mock import Mock, patch
+
+from aia.async_workflow_coordinator import AsyncWorkflowCoordinator
+from aia.git_aia_manager import AiaType
+from aia.models import GitOperation, WorkflowStatus
+from aia.workflow_coordinator import MAX_CONCURRENT_PROVIDER_CALLS, WorkflowCoordinator
+
+
+class TestAsyncWorkflowCoordinator:
+    """Test AsyncWorkflowCoordinator class."""
+
+    @patch("aia.workflow_coordinator.AiaManagerFactory")
+    def test_get_issues_gathers_in_order(self, mock_factory, sample_config, sample_issue):
+        """Test several issues are fetched through the manager and returned in request order."""
+        mock_manager = Mock()
+        mock_manager.get_issue.side_effect = lambda number: sample_issue if number == 1 else None
+        mock_factory.create_manager.return_value = mock_manager
+
+        coordinator = AsyncWorkflowCoordinator(sample_config, "github")
+        issues = asyncio.run(coordinator.get_issues([2, 1]))
+
+        assert issues == [None, sample_issue]
+        assert mock_manager.get_issue.call_count == 2
+
+    @patch("aia.workflow_coordinator.AiaManagerFactory")
+    def test_workflow_methods_delegate(self, mock_factory, sample_config):
+        """Test workflow coroutines return the synchronous coordinator results."""
+        mock_factory.create_manager.return_value = Mock()
+        coordinator = AsyncWorkflowCoordinator(sample_config, "github")
+
+        async def run_both():
+            async with coordinator:
+                return await asyncio.gather(coordinator.start_coder_workflow(7), coordinator.get_workflow_status_counts())
+
+        with (
+            patch.object(WorkflowCoordinator, "start_coder_workflow", return_value=GitOperation(success=True, message="started")) as start,
+            patch.object(WorkflowCoordinator, "get_workflow_status_counts", return_value={WorkflowStatus.TODO: 1}),
+            patch.object(WorkflowCoordinator, "__exit__") as exit_,
+        ):
+            started, counts = asyncio.run(run_both())
+
+        assert started.message == "started"
+        assert counts == {WorkflowStatus.TODO: 1}
+        start.assert_called_once_with(7)
+        exit_.assert_called_once()
+
+    @patch("aia.workflow_coordinator.AiaManagerFactory")
+    def test_shares_coordinator_provider_call_limit(self, mock_factory, sample_config):
+        """Test coroutines run under the synchronous coordinator's provider call limit."""
+        mock_factory.create_manager.return_value = Mock()
+        coordinator = AsyncWorkflowCoordinator(sample_config, "github")
+        sync_coordinator = coordinator.coordinator
+        held = []
+
+        def start(_issue_number):
+            held.append(sync_coordinator._provider_calls._value)
+            return GitOperation(success=True, message="started")
+
+        with patch.object(WorkflowCoordinator, "start_coder_workflow", side_effect=start):
+            asyncio.run(coordinator.start_coder_workflow(7))
+
+        assert held == [MAX_CONCURRENT_PROVIDER_CALLS - 1]
+
+    @patch("aia.workflow_coordinator.AiaManagerFactory")
+    def test_get_issues_uses_ai_type_manager(self, mock_factory, sample_config):
+        """Test the manager of the requested AI type fetches the issues."""
+        mock_factory.create_manager.side_effect = lambda provider, ai_type, *args: Mock(name=ai_type.value)
+        coordinator = AsyncWorkflowCoordinator(sample_config, "github")
+
+        asyncio.run(coordinator.get_issues([3], AiaType.AI_TESTER))
+
+        coordinator.coordinator.tester_manager.get_issue.assert_called_once_with(3)
@@ -0,0 +1,40 @@
+"""Unit tests for cache module."""
+
+from aia.cache import IssueCache
+
+
+class TestIssueCache:
+    """Test IssueCache class."""
+
+    def test_put_and_get(self, tmp_path):
+        """Test stored payloads survive reopening the database."""
+        path = tmp_path / "issues.sqlite"
+        cache = IssueCache(path)
+        cache.put("owner/repo", 1, '"etag-1"', {"number": 1, "title": "First"})
+        cache.close()
+
+        cache = IssueCache(path)
+        assert cache.get("owner/repo", 1) == ('"etag-1"', {"number": 1, "title": "First"})
+        assert cache.get("owner/repo", 2) is None
+        assert cache.get("other/repo", 1) is None
+
+    def test_put_replaces_entry(self):
+        """Test storing an issue again replaces its ETag and payload."""
+        cache = IssueCache(":memory:")
+        cache.put("owner/repo", 1, '"old"', {"title": "Old"})
+        cache.put("owner/repo", 1, '"new"', {"title": "New"})
+
+        assert cache.get("owner/repo", 1) == ('"new"', {"title": "New"})
+
+    def test_invalidate(self):
+        """Test invalidating a single issue and a whole repository."""
+        cache = IssueCache(":memory:")
+        for number in (1, 2):
+            cache.put("owner/repo", number, f'"{number}"', {"number": number})
+
+        cache.invalidate("owner/repo", 1)
+        assert cache.get("owner/repo", 1) is None
+        assert cache.get("owner/repo", 2) is not None
+
+        cache.invalidate("owner/repo")
+        assert cache.get("owner/repo", 2) is None
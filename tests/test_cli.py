@@ -0,0 +1,124 @@
+"""Unit tests for cli module."""
+
+import os
+from unittest.mock import Mock, patch
+
+from aia.cli import AiaCLI, _gh_path
+from aia.git_aia_manager import AiaType
+from aia.models import WorkflowConfig
+
+
+REMOTE_URL = "git@github.com:test-owner/test-repo.git"
+
+
+class TestGitRemoteUrl:
+    """Test AiaCLI.git_remote_url."""
+
+    @patch("aia.cli.subprocess.run")
+    def test_remote_url_cached_on_disk(self, mock_run, tmp_path, monkeypatch):
+        """Test a second CLI run in the same repository reuses the cached URL instead of running git."""
+        (tmp_path / ".git").mkdir()
+        (tmp_path / ".git" / "config").write_text("[core]\n")
+        monkeypatch.chdir(tmp_path)
+        mock_run.return_value = Mock(returncode=0, stdout=f"{REMOTE_URL}\n".encode())
+
+        with patch("aia.cli.REMOTE_CACHE_DIR", tmp_path / "cache"):
+            assert AiaCLI.__new__(AiaCLI).git_remote_url == REMOTE_URL
+            assert AiaCLI.__new__(AiaCLI).git_remote_url == REMOTE_URL
+
+        mock_run.assert_called_once()
+
+    @patch("aia.cli.subprocess.run")
+    def test_remote_url_reread_after_git_config_change(self, mock_run, tmp_path, monkeypatch):
+        """Test the cached URL is ignored once .git/config was modified."""
+        git_config = tmp_path / ".git" / "config"
+        git_config.parent.mkdir()
+        git_config.write_text("[core]\n")
+        monkeypatch.chdir(tmp_path)
+        mock_run.return_value = Mock(returncode=0, stdout=f"{REMOTE_URL}\n".encode())
+
+        with patch("aia.cli.REMOTE_CACHE_DIR", tmp_path / "cache"):
+            assert AiaCLI.__new__(AiaCLI).git_remote_url == REMOTE_URL
+            stat = git_config.stat()
+            os.utime(git_config, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+            assert AiaCLI.__new__(AiaCLI).git_remote_url == REMOTE_URL
+
+        assert mock_run.call_count == 2
+
+    @patch("aia.cli.subprocess.run")
+    def test_no_remote_returns_none(self, mock_run, tmp_path, monkeypatch):
+        """Test a failing git call, e.g. outside a repository, yields None."""
+        monkeypatch.chdir(tmp_path)
+        mock_run.return_value = Mock(returncode=128, stdout=b"")
+
+        assert AiaCLI.__new__(AiaCLI).git_remote_url is None
+
+
+class TestGhPath:
+    """Test _gh_path lookup."""
+
+    @patch("aia.cli.shutil.which", return_value="/usr/bin/gh")
+    def test_gh_looked_up_once(self, mock_which):
+        """Test gh is resolved on PATH once and reused by later calls."""
+        _gh_path.cache_clear()
+        try:
+            assert _gh_path() == "/usr/bin/gh"
+            assert _gh_path() == "/usr/bin/gh"
+        finally:
+            _gh_path.cache_clear()
+
+        mock_which.assert_called_once_with("gh")
+
+
+class TestLoadConfig:
+    """Test AiaCLI._load_config."""
+
+    def test_config_from_env(self):
+        """Test repository settings come from the environment, ignoring a malformed project number."""
+        env = {"GITHUB_REPO_OWNER": "env-owner", "GITHUB_REPO_NAME": "env-repo", "GITHUB_PROJECT_NUMBER": "abc"}
+
+        with patch.dict(os.environ, env):
+            config = AiaCLI.__new__(AiaCLI)._load_config()
+
+        assert config.repo_full_name == "env-owner/env-repo"
+        assert config.project_number is None
+
+
+class TestRun:
+    """Test AiaCLI.run."""
+
+    def test_only_invoked_command_parser_built(self):
+        """Test a command run builds its own subparser and dispatches to it."""
+        cli = AiaCLI.__new__(AiaCLI)
+
+        with patch.object(AiaCLI, "info_command") as mock_info, patch.object(AiaCLI, "_add_trigger_parser") as mock_trigger_parser:
+            cli.run(["info"])
+
+        mock_info.assert_called_once()
+        mock_trigger_parser.assert_not_called()
+
+    def test_top_level_help_lists_all_commands(self, capsys):
+        """Test running without a command prints help covering every command."""
+        AiaCLI.__new__(AiaCLI).run([])
+
+        help_text = capsys.readouterr().out
+        for command in ("setup", "status", "trigger", "validate", "create-issue", "info"):
+            assert command in help_text
+
+
+class TestGetManager:
+    """Test AiaCLI._get_manager."""
+
+    @patch("aia.git_aia_manager.AiaManagerFactory.create_manager")
+    def test_manager_created_once_per_key(self, mock_create, sample_config):
+        """Test repeated lookups reuse the manager and other repositories get their own."""
+        cli = AiaCLI.__new__(AiaCLI)
+        cli._managers = {}
+        other_config = WorkflowConfig(repo_owner="other-owner", repo_name="other-repo")
+
+        first = cli._get_manager("github", AiaType.AI_CODER, sample_config)
+        second = cli._get_manager("github", AiaType.AI_CODER, sample_config)
+        cli._get_manager("github", AiaType.AI_CODER, other_config)
+
+        assert first is second
+        assert mock_create.call_count == 2
@@ -0,0 +1,141 @@
+"""Unit tests for gh_client module."""
+
+import http.client
+import json
+import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock, patch
+
+import pytest
+
+from aia.gh_client import GhApiError, GhHttpClient, decode_json
+
+
+TEST_TOKEN = "gho_test"  # noqa: S105
+
+
+def _response(status: int, body: dict, headers: list[tuple[str, str]] | None = None) -> Mock:
+    response = Mock(status=status)
+    response.read.return_value = json.dumps(body).encode()
+    response.getheaders.return_value = headers or []
+    return response
+
+
+class TestGhHttpClient:
+    """Test GhHttpClient class."""
+
+    @patch("aia.gh_client.subprocess.run")
+    def test_token_read_once_from_gh(self, mock_run):
+        """Test the gh token is requested only once."""
+        mock_run.return_value = Mock(stdout=f"{TEST_TOKEN}\n")
+
+        client = GhHttpClient()
+
+        assert client.token == TEST_TOKEN
+        assert client.token == TEST_TOKEN
+        mock_run.assert_called_once()
+        assert mock_run.call_args[0][0] == ["gh", "auth", "token"]
+
+    @patch("aia.gh_client.subprocess.run")
+    def test_token_without_gh_raises_api_error(self, mock_run):
+        """Test a missing gh CLI surfaces as GhApiError, a CalledProcessError."""
+        mock_run.side_effect = FileNotFoundError("gh")
+
+        with pytest.raises(subprocess.CalledProcessError) as exc_info:
+            GhHttpClient().request("GET", "/repos/o/r")
+        assert exc_info.value.stderr == "GitHub CLI not found"
+
+    @patch("aia.gh_client.http.client.HTTPSConnection")
+    def test_connection_reused(self, mock_connection_class):
+        """Test consecutive requests share one connection."""
+        connection = mock_connection_class.return_value
+        connection.getresponse.side_effect = [_response(200, {}, [("ETag", '"abc"')]), _response(200, {})]
+
+        with GhHttpClient(token=TEST_TOKEN) as client:
+            first = client.request("GET", "/repos/o/r/issues/1")
+            client.request("GET", "/repos/o/r/issues/2")
+
+        mock_connection_class.assert_called_once()
+        assert first.headers == {"etag": '"abc"'}
+        assert connection.request.call_args[1]["headers"]["Authorization"] == f"Bearer {TEST_TOKEN}"
+        connection.close.assert_called_once()
+
+    @patch("aia.gh_client.http.client.HTTPSConnection")
+    def test_concurrent_requests_run_in_parallel(self, mock_connection_class):
+        """Test requests from two threads are in flight at once, each on its own pooled connection."""
+        both_sent = threading.Barrier(2, timeout=5)
+
+        def getresponse():
+            both_sent.wait()
+            return _response(200, {})
+
+        def connection(*_args, **_kwargs):
+            return Mock(getresponse=Mock(side_effect=getresponse))
+
+        mock_connection_class.side_effect = connection
+
+        with GhHttpClient(token=TEST_TOKEN) as client, ThreadPoolExecutor(max_workers=2) as pool:
+            responses = list(pool.map(lambda number: client.request("GET", f"/repos/o/r/issues/{number}"), [1, 2]))
+            assert len(client._idle) == 2
+
+        assert [response.status for response in responses] == [200, 200]
+        assert mock_connection_class.call_count == 2
+
+    @patch("aia.gh_client.http.client.HTTPSConnection")
+    def test_reconnects_after_remote_disconnect(self, mock_connection_class):
+        """Test a connection closed by the server is replaced and the request retried."""
+        stale, fresh = Mock(), Mock()
+        stale.getresponse.side_effect = http.client.RemoteDisconnected("closed")
+        fresh.getresponse.return_value = _response(200, {"data": {"viewer": {"login": "me"}}})
+        mock_connection_class.side_effect = [stale, fresh]
+
+        client = GhHttpClient(token=TEST_TOKEN)
+
+        assert client.graphql("{ viewer { login } }") == {"viewer": {"login": "me"}}
+        stale.close.assert_called_once()
+
+    @patch("aia.gh_client.http.client.HTTPSConnection")
+    def test_post_not_resent_after_disconnect(self, mock_connection_class):
+        """Test a POST is not resent when the connection drops, since GitHub may have applied it."""
+        mock_connection_class.return_value.getresponse.side_effect = http.client.RemoteDisconnected("closed")
+
+        client = GhHttpClient(token=TEST_TOKEN)
+
+        with pytest.raises(GhApiError):
+            client.request("POST", "/repos/o/r/issues/1/comments", body={"body": "hi"})
+        with pytest.raises(GhApiError):
+            client.graphql("mutation { addComment(input: {}) { clientMutationId } }")
+        assert mock_connection_class.return_value.request.call_count == 2
+
+    @patch("aia.gh_client.http.client.HTTPSConnection")
+    def test_graphql_errors_raise(self, mock_connection_class):
+        """Test GraphQL errors surface as GhApiError, a CalledProcessError."""
+        mock_connection_class.return_value.getresponse.return_value = _response(200, {"errors": [{"message": "bad"}]})
+
+        client = GhHttpClient(token=TEST_TOKEN)
+
+        with pytest.raises(subprocess.CalledProcessError) as exc_info:
+            client.graphql("{ nope }")
+        assert isinstance(exc_info.value, GhApiError)
+        assert "bad" in exc_info.value.stderr
+
+    @patch("aia.gh_client.http.client.HTTPSConnection")
+    def test_graphql_non_json_error_page_raises(self, mock_connection_class):
+        """Test an HTML error page surfaces as GhApiError instead of a JSON decode error."""
+        response = Mock(status=502)
+        response.read.return_value = b"<html>Bad Gateway</html>"
+        response.getheaders.return_value = []
+        mock_connection_class.return_value.getresponse.return_value = response
+
+        client = GhHttpClient(token=TEST_TOKEN)
+
+        with pytest.raises(GhApiError) as exc_info:
+            client.graphql("{ viewer { login } }")
+        assert "HTTP 502" in exc_info.value.stderr
+
+    def test_decode_json_invalid_body_raises(self):
+        """Test a non-JSON success body surfaces as GhApiError."""
+        with pytest.raises(GhApiError):
+            decode_json(b"<html></html>", "GET /repos/o/r")
+        assert decode_json(b"", "DELETE /repos/o/r/labels/x") == {}
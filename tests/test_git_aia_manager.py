@@ -5,6 +5,8 @@ from unittest.mock import Mock, patch
 import json
 import subprocess
 
+from aia.cache import IssueCache
+from aia.gh_client import GhResponse
 from aia.git_aia_manager import GitBranchType, AiaType, AiaManagerBase, GitHubAiaManager, AiaManagerFactory
 from aia.models import Issue, WorkflowStatus, GitOperation, IssueState, WorkflowConfig
 
@@ -249,6 +251,339 @@ class TestGitHubAiaManager:
         assert issue.number == 123
         assert issue.title == "Test issue"
 
+    @patch("aia.git_aia_manager.subprocess.run")
+    def test_get_issue_conditional_reuses_cached_payload(self, mock_run, sample_config):
+        """Test get_issue with an issue cache stores the ETag and reuses the payload on 304."""
+        payload = {
+            "number": 123,
+            "title": "Test issue",
+            "body": None,
+            "state": "open",
+            "labels": [{"name": "feature"}],
+            "assignees": [{"login": "octocat"}],
+            "created_at": "2025-01-01T12:00:00Z",
+            "updated_at": "2025-01-01T12:30:00Z",
+            "html_url": "https://github.com/test/repo/issues/123",
+        }
+        mock_run.side_effect = [
+            Mock(stdout=f'HTTP/2.0 200 OK\r\nEtag: "abc"\r\n\r\n{json.dumps(payload)}', stderr=""),
+            Mock(stdout='HTTP/2.0 304 Not Modified\r\nEtag: "abc"\r\n\r\n', stderr="gh: HTTP 304"),
+        ]
+
+        manager = GitHubAiaManager(AiaType.AI_CODER, sample_config, IssueCache(":memory:"))
+        first = manager.get_issue(123)
+        second = manager.get_issue(123)
+
+        assert first == second
+        assert second.labels == ("feature",)
+        assert second.assignees == ["octocat"]
+        assert second.body == ""
+        assert second.state == IssueState.OPEN
+        assert 'If-None-Match: "abc"' not in mock_run.call_args_list[0][0][0]
+        assert 'If-None-Match: "abc"' in mock_run.call_args_list[1][0][0]
+
+    @patch("aia.git_aia_manager.subprocess.run")
+    def test_get_issue_conditional_failure(self, mock_run, sample_config):
+        """Test get_issue with an issue cache returns None on error responses."""
+        mock_run.return_value = Mock(stdout="HTTP/2.0 404 Not Found\r\n\r\n{}", stderr="gh: Not Found (HTTP 404)")
+
+        manager = GitHubAiaManager(AiaType.AI_CODER, sample_config, IssueCache(":memory:"))
+
+        assert manager.get_issue(999) is None
+
+    @patch("aia.git_aia_manager.subprocess.run")
+    def test_batch_fetch_issues_single_graphql_call(self, mock_run, sample_config):
+        """Test batch_fetch_issues resolves all issues and their status in one call."""
+
+        def issue_node(number, status):
+            return {
+                "number": number,
+                "title": f"Issue {number}",
+                "body": "",
+                "state": "OPEN",
+                "url": f"https://github.com/test/repo/issues/{number}",
+                "createdAt": "2025-01-01T12:00:00Z",
+                "updatedAt": "2025-01-01T12:30:00Z",
+                "labels": {"nodes": [{"name": "feature"}]},
+                "assignees": {"nodes": [{"login": "dev"}]},
+                "projectItems": {"nodes": [{"project": {"number": 1}, "fieldValueByName": {"name": status}}]},
+            }
+
+        mock_result = Mock()
+        mock_result.stdout = json.dumps(
+            {"data": {"repository": {"i123": issue_node(123, "📋 ToDo"), "i124": issue_node(124, "🔄 Doing"), "i999": None}}}
+        )
+        mock_run.return_value = mock_result
+
+        manager = GitHubAiaManager(AiaType.AI_CODER, sample_config)
+        issues = manager.batch_fetch_issues([123, 124, 999, 123])
+
+        assert mock_run.call_count == 1
+        cmd = mock_run.call_args[0][0]
+        assert cmd[:3] == ["gh", "api", "graphql"]
+        assert "i123: issue(number: 123)" in cmd[4]
+        assert [issue.number for issue in issues] == [123, 124]
+        assert issues[0].project_status == WorkflowStatus.TODO
+        assert issues[1].project_status == WorkflowStatus.DOING
+        assert issues[0].labels == ("feature",)
+        assert issues[0].assignees == ["dev"]
+
+    @patch("aia.git_aia_manager.subprocess.run")
+    def test_graphql_routed_through_http_client(self, mock_run, sample_config):
+        """Test GraphQL queries use the HTTP client instead of spawning gh when one is given."""
+        http_client = Mock()
+        http_client.graphql.return_value = {"repository": {"i1": None}}
+
+        manager = GitHubAiaManager(AiaType.AI_CODER, sample_config, http_client=http_client)
+        issues = manager.batch_fetch_issues([1])
+
+        assert issues == []
+        http_client.graphql.assert_called_once()
+        assert http_client.graphql.call_args[1] == {"owner": "test-owner", "name": "test-repo"}
+        mock_run.assert_not_called()
+
+    @patch("aia.git_aia_manager.subprocess.run")
+    def test_batch_fetch_issues_empty(self, mock_run, sample_config):
+        """Test batch_fetch_issues does not call GitHub without issue numbers."""
+        manager = GitHubAiaManager(AiaType.AI_CODER, sample_config)
+
+        assert manager.batch_fetch_issues([]) == []
+        mock_run.assert_not_called()
+
+    @patch("aia.git_aia_manager.subprocess.run")
+    def test_get_issues_with_status_single_search(self, mock_run, sample_config):
+        """Test get_issues with a status filter runs one GraphQL search carrying the label filters."""
+
+        def issue_node(number, status):
+            return {
+                "number": number,
+                "title": f"Issue {number}",
+                "body": "",
+                "state": "OPEN",
+                "url": f"https://github.com/test/repo/issues/{number}",
+                "createdAt": "2025-01-01T12:00:00Z",
+                "updatedAt": "2025-01-01T12:30:00Z",
+                "labels": {"nodes": [{"name": "assigned:ai-coder"}]},
+                "assignees": {"nodes": []},
+                "projectItems": {"nodes": [{"project": {"number": 1}, "fieldValueByName": {"name": status}}]},
+            }
+
+        mock_run.return_value = Mock(
+            stdout=json.dumps(
+                {
+                    "data": {
+                        "search": {
+                            "pageInfo": {"hasNextPage": False, "endCursor": None},
+                            "nodes": [issue_node(123, WorkflowStatus.TODO.value), issue_node(124, WorkflowStatus.DOING.value)],
+                        }
+                    }
+                }
+            )
+        )
+
+        manager = GitHubAiaManager(AiaType.AI_CODER, sample_config)
+        issues = manager.get_issues(WorkflowStatus.TODO, label="assigned:ai-coder", exclude_labels=("assigned:ai-tester",))
+
+        assert [issue.number for issue in issues] == [123]
+        mock_run.assert_called_once()
+        cmd = mock_run.call_args[0][0]
+        assert cmd[:3] == ["gh", "api", "graphql"]
+        assert 'search=repo:test-owner/test-repo is:issue is:open label:"assigned:ai-coder" -label:"assigned:ai-tester"' in cmd
+
+    @patch("aia.git_aia_manager.subprocess.run")
+    def test_top_priority_todo_stops_after_first_match(self, mock_run, sample_config):
+        """Test the top ToDo issue is taken from the first result page without fetching the next one."""
+        node = {
+            "number": 7,
+            "title": "Issue 7",
+            "body": "",
+            "state": "OPEN",
+            "url": "https://github.com/test/repo/issues/7",
+            "createdAt": "2025-01-01T12:00:00Z",
+            "updatedAt": "2025-01-01T12:30:00Z",
+            "labels": {"nodes": []},
+            "assignees": {"nodes": []},
+            "projectItems": {"nodes": [{"project": {"number": 1}, "fieldValueByName": {"name": WorkflowStatus.TODO.value}}]},
+        }
+        mock_run.return_value = Mock(
+            stdout=json.dumps({"data": {"search": {"pageInfo": {"hasNextPage": True, "endCursor": "c1"}, "nodes": [node, node]}}})
+        )
+
+        manager = GitHubAiaManager(AiaType.AI_CODER, sample_config)
+        issue = manager.get_top_priority_todo_issue()
+
+        assert issue.number == 7
+        mock_run.assert_called_once()
+
+    @patch("aia.git_aia_manager.subprocess.run")
+    def test_get_project_board_info_groups_by_status(self, mock_run, sample_config):
+        """Test board info groups issues by their project status from one GraphQL search."""
+        nodes = [
+            {
+                "number": number,
+                "title": f"Issue {number}",
+                "body": "",
+                "state": "OPEN",
+                "url": f"https://github.com/test/repo/issues/{number}",
+                "createdAt": "2025-01-01T12:00:00Z",
+                "updatedAt": "2025-01-01T12:30:00Z",
+                "labels": {"nodes": []},
+                "assignees": {"nodes": []},
+                "projectItems": {"nodes": [{"project": {"number": 1}, "fieldValueByName": {"name": status}}] if status else []},
+            }
+            for number, status in ((1, WorkflowStatus.TODO.value), (2, WorkflowStatus.TODO.value), (3, None))
+        ]
+        mock_run.return_value = Mock(
+            stdout=json.dumps({"data": {"search": {"pageInfo": {"hasNextPage": False, "endCursor": None}, "nodes": nodes}}})
+        )
+
+        manager = GitHubAiaManager(AiaType.AI_CODER, sample_config)
+        board_info = manager.get_project_board_info()
+
+        mock_run.assert_called_once()
+        assert board_info["total_issues"] == 3
+        assert board_info["columns"][WorkflowStatus.TODO.value]["count"] == 2
+        assert board_info["columns"][WorkflowStatus.DONE.value] == {"count": 0, "issues": []}
+
+    @patch("aia.git_aia_manager.subprocess.run")
+    def test_get_project_issues_follows_all_pages(self, mock_run, sample_config):
+        """Test project issues are read from every search result page, past gh's default list limit."""
+
+        def page(numbers, has_next):
+            nodes = [
+                {
+                    "number": number,
+                    "title": f"Issue {number}",
+                    "body": "",
+                    "state": "OPEN",
+                    "url": f"https://github.com/test/repo/issues/{number}",
+                    "createdAt": "2025-01-01T12:00:00Z",
+                    "updatedAt": "2025-01-01T12:30:00Z",
+                    "labels": {"nodes": []},
+                    "assignees": {"nodes": []},
+                    "projectItems": {"nodes": [{"project": {"number": 1}, "fieldValueByName": {"name": WorkflowStatus.DOING.value}}]},
+                }
+                for number in numbers
+            ]
+            search = {"pageInfo": {"hasNextPage": has_next, "endCursor": "c1" if has_next else None}, "nodes": nodes}
+            return Mock(stdout=json.dumps({"data": {"search": search}}))
+
+        mock_run.side_effect = [page(range(1, 31), True), page(range(31, 41), False)]
+
+        manager = GitHubAiaManager(AiaType.AI_CODER, sample_config)
+        issues = manager.get_project_issues()
+
+        assert len(issues) == 40
+        assert all(issue.project_status == WorkflowStatus.DOING for issue in issues)
+        assert issues[0].state == IssueState.OPEN
+        assert mock_run.call_count == 2
+
+    @patch("aia.git_aia_manager.subprocess.run")
+    def test_get_issues_label_filters_passed_to_gh(self, mock_run, sample_config):
+        """Test label filters are applied by gh instead of in Python."""
+        mock_run.return_value = Mock(stdout="[]")
+
+        manager = GitHubAiaManager(AiaType.AI_CODER, sample_config)
+        manager.get_issues(label="assigned:ai-coder")
+        manager.get_issues(exclude_labels=("assigned:ai-coder", "assigned:ai-tester"))
+
+        include_cmd = mock_run.call_args_list[0][0][0]
+        exclude_cmd = mock_run.call_args_list[1][0][0]
+        assert include_cmd[include_cmd.index("--label") + 1] == "assigned:ai-coder"
+        assert exclude_cmd[exclude_cmd.index("--search") + 1] == '-label:"assigned:ai-coder" -label:"assigned:ai-tester"'
+
+    @patch("aia.git_aia_manager.subprocess.run")
+    def test_get_status_counts_paginates_project_items(self, mock_run, sample_config):
+        """Test get_status_counts counts board items page by page without issue content."""
+
+        def page(nodes, has_next, cursor=None):
+            items = {"pageInfo": {"hasNextPage": has_next, "endCursor": cursor}, "nodes": nodes}
+            return Mock(stdout=json.dumps({"data": {"repositoryOwner": {"projectV2": {"items": items}}}}))
+
+        def item(status, item_type="ISSUE"):
+            return {"type": item_type, "fieldValueByName": {"name": status} if status else None}
+
+        mock_run.side_effect = [
+            page([item("📋 ToDo"), item("📋 ToDo"), item("🔄 Doing", "PULL_REQUEST")], True, "c1"),
+            page([item("✅ Done"), item(None), item("Unknown")], False),
+        ]
+
+        manager = GitHubAiaManager(AiaType.AI_CODER, sample_config)
+        status_counts = manager.get_status_counts()
+
+        assert mock_run.call_count == 2
+        assert "cursor=c1" in mock_run.call_args_list[1][0][0]
+        assert status_counts[WorkflowStatus.TODO] == 2
+        assert status_counts[WorkflowStatus.DOING] == 0
+        assert status_counts[WorkflowStatus.DONE] == 1
+
+    @patch("aia.git_aia_manager.subprocess.run")
+    def test_get_status_counts_failure(self, mock_run, sample_config):
+        """Test get_status_counts returns zero counts when GitHub call fails."""
+        mock_run.side_effect = subprocess.CalledProcessError(1, "gh", stderr="API Error")
+
+        manager = GitHubAiaManager(AiaType.AI_CODER, sample_config)
+        status_counts = manager.get_status_counts()
+
+        assert set(status_counts.values()) == {0}
+
+    def test_batch_transition_single_mutation(self, sample_config):
+        """Test status and label changes are sent as one aliased GraphQL mutation."""
+        http_client = Mock()
+        http_client.graphql.side_effect = [
+            {
+                "repository": {
+                    "label": {"id": "L_reviewer"},
+                    "issue": {
+                        "id": "I_123",
+                        "labels": {"nodes": [{"id": "L_feature", "name": "feature"}, {"id": "L_coder", "name": "assigned:ai-coder"}]},
+                        "projectItems": {
+                            "nodes": [
+                                {
+                                    "id": "PVTI_1",
+                                    "project": {
+                                        "id": "PVT_1",
+                                        "number": 1,
+                                        "field": {
+                                            "id": "F_status",
+                                            "options": [
+                                                {"id": "O_todo", "name": WorkflowStatus.TODO.value},
+                                                {"id": "O_review", "name": WorkflowStatus.REVIEW.value},
+                                            ],
+                                        },
+                                    },
+                                }
+                            ]
+                        },
+                    },
+                }
+            },
+            {},
+        ]
+
+        manager = GitHubAiaManager(AiaType.AI_CODER, sample_config, http_client=http_client)
+        issue = Issue(123, "Test", "", IssueState.OPEN, ["feature", "assigned:ai-coder"], [], None, None, "")
+        result = manager.batch_transition(issue, WorkflowStatus.REVIEW, AiaType.AI_REVIEWER)
+
+        assert result.success is True
+        assert http_client.graphql.call_count == 2
+        mutation = http_client.graphql.call_args_list[1][0][0]
+        assert mutation.count("clientMutationId") == 3
+        assert 'singleSelectOptionId: "O_review"' in mutation
+        assert 'labelIds: ["L_reviewer"]' in mutation
+        assert 'labelIds: ["L_coder"]' in mutation
+
+    @patch("aia.git_aia_manager.subprocess.run")
+    def test_batch_transition_failure(self, mock_run, sample_config, sample_issue):
+        """Test batch_transition reports GitHub errors as failed operation."""
+        mock_run.side_effect = subprocess.CalledProcessError(1, "gh", stderr="API Error")
+
+        manager = GitHubAiaManager(AiaType.AI_CODER, sample_config)
+        result = manager.batch_transition(sample_issue, WorkflowStatus.DOING, AiaType.AI_CODER)
+
+        assert result.success is False
+        assert result.error == "API Error"
+
     @patch("aia.git_aia_manager.subprocess.run")
     def test_update_issue_status_success(self, mock_run, sample_config, sample_issue):
         """Test successful issue status update."""
@@ -273,6 +608,68 @@ class TestGitHubAiaManager:
         assert result.success is True
         assert "Added label 'priority:high'" in result.message
 
+    @patch("aia.git_aia_manager.subprocess.run")
+    def test_label_writes_routed_through_http_client(self, mock_run, sample_config, sample_issue):
+        """Test label writes use the REST API on the HTTP client instead of gh."""
+        http_client = Mock()
+        http_client.request.return_value = GhResponse(200, {}, b"[]")
+
+        manager = GitHubAiaManager(AiaType.AI_CODER, sample_config, http_client=http_client)
+        added = manager.add_label_to_issue(sample_issue, "assigned:ai-coder")
+        removed = manager.remove_label_from_issue(sample_issue, "priority:high")
+
+        assert added.success and removed.success
+        assert http_client.request.call_args_list[0][0] == ("POST", "/repos/test-owner/test-repo/issues/123/labels")
+        assert http_client.request.call_args_list[0][1] == {"body": {"labels": ["assigned:ai-coder"]}}
+        assert http_client.request.call_args_list[1][0] == ("DELETE", "/repos/test-owner/test-repo/issues/123/labels/priority%3Ahigh")
+        mock_run.assert_not_called()
+
+    def test_create_pr_http_error(self, sample_config):
+        """Test an error status from the REST API fails the operation with GitHub's message."""
+        http_client = Mock()
+        http_client.request.return_value = GhResponse(422, {}, b'{"message": "Validation Failed"}')
+
+        manager = GitHubAiaManager(AiaType.AI_CODER, sample_config, http_client=http_client)
+        result = manager.create_pr("Title", "Body", "feature", "main")
+
+        assert result.success is False
+        assert "Validation Failed" in result.error
+
+    @patch("aia.git_aia_manager.subprocess.run")
+    def test_assign_to_ai_replaces_other_assignments(self, mock_run, sample_config, sample_issue):
+        """Test assigning removes other AI assignment labels and adds the new one."""
+        sample_issue.labels = ["feature", "assigned:ai-coder", "assigned:ai-reviewer"]
+
+        manager = GitHubAiaManager(AiaType.AI_TESTER, sample_config)
+        result = manager.assign_to_ai(sample_issue, AiaType.AI_TESTER)
+
+        assert result.success is True
+        edits = sorted(call[0][0][-2:] for call in mock_run.call_args_list)
+        assert edits == [
+            ["--add-label", "assigned:ai-tester"],
+            ["--remove-label", "assigned:ai-coder"],
+            ["--remove-label", "assigned:ai-reviewer"],
+        ]
+
+    @patch("aia.git_aia_manager.subprocess.run")
+    def test_assign_to_ai_reports_failed_removal(self, mock_run, sample_config, sample_issue):
+        """Test a failed removal of another AI assignment label fails the assignment."""
+        sample_issue.labels = ["assigned:ai-coder", "assigned:ai-reviewer"]
+
+        def edit(cmd, **_kwargs):
+            if cmd[-1] == "assigned:ai-reviewer":
+                raise subprocess.CalledProcessError(1, cmd, stderr="label not removed")
+            return Mock()
+
+        mock_run.side_effect = edit
+
+        manager = GitHubAiaManager(AiaType.AI_TESTER, sample_config)
+        result = manager.assign_to_ai(sample_issue, AiaType.AI_TESTER)
+
+        assert result.success is False
+        assert result.error == "label not removed"
+        assert mock_run.call_count == 3
+
     @patch("aia.git_aia_manager.subprocess.run")
     def test_create_branch_success(self, mock_run, sample_config, sample_issue):
         """Test successful branch creation."""
@@ -300,16 +697,15 @@ class TestGitHubAiaManager:
         assert "Created commit on branch 'feature-branch'" in result.message
         assert result.output == "Commit created successfully"
 
-        # Should call git add for each file, then git commit
-        assert mock_run.call_count == 3  # 2 git add calls + 1 git commit call
+        # Should call git add once for all files, then git commit
+        assert mock_run.call_count == 2
 
-        # Verify git add calls
-        add_calls = mock_run.call_args_list[:2]
-        assert add_calls[0][0][0] == ["git", "add", "file1.py"]
-        assert add_calls[1][0][0] == ["git", "add", "file2.py"]
+        # Verify git add call
+        add_call = mock_run.call_args_list[0]
+        assert add_call[0][0] == ["git", "add", "--", "file1.py", "file2.py"]
 
         # Verify git commit call
-        commit_call = mock_run.call_args_list[2]
+        commit_call = mock_run.call_args_list[1]
         assert commit_call[0][0] == ["git", "commit", "-m", "Add new features"]
 
     @patch("aia.git_aia_manager.subprocess.run")
@@ -0,0 +1,126 @@
+"""Unit tests for github_app_setup module."""
+
+import json
+import subprocess
+from unittest.mock import Mock, patch
+
+from aia.gh_client import GhResponse
+from aia.github_app_setup import GitHubAppConfig, GitHubAppSetup
+
+
+TEST_WEBHOOK_SECRET = "whsec_test"  # noqa: S105
+REQUIRED_PERMISSIONS = {"issues": "write", "pull_requests": "write", "contents": "write", "projects": "write"}
+
+
+class TestGitHubAppSetup:
+    """Test GitHubAppSetup class."""
+
+    @patch("aia.github_app_setup.subprocess.run")
+    def test_validate_permissions_through_http_client(self, mock_run, tmp_path):
+        """Test installation permissions are read from the REST API without gh."""
+        http_client = Mock()
+        http_client.request.return_value = GhResponse(200, {}, json.dumps({"id": 1, "permissions": REQUIRED_PERMISSIONS}).encode())
+
+        setup = GitHubAppSetup(str(tmp_path), http_client=http_client)
+        result = setup.validate_app_permissions("test-owner/test-repo")
+
+        assert result.success is True
+        http_client.request.assert_called_once_with("GET", "/repos/test-owner/test-repo/installation")
+        mock_run.assert_not_called()
+
+    def test_validate_permissions_http_error(self, tmp_path):
+        """Test an error status fails validation with GitHub's message."""
+        http_client = Mock()
+        http_client.request.return_value = GhResponse(404, {}, b'{"message": "Not Found"}')
+
+        setup = GitHubAppSetup(str(tmp_path), http_client=http_client)
+        result = setup.validate_app_permissions("test-owner/test-repo")
+
+        assert result.success is False
+        assert "Not Found" in result.error
+
+    @patch("aia.github_app_setup.subprocess.run")
+    def test_validate_permissions_missing(self, mock_run, tmp_path):
+        """Test the gh fallback reports missing permissions."""
+        mock_run.return_value = Mock(stdout=json.dumps({"id": 1, "permissions": {**REQUIRED_PERMISSIONS, "projects": "read"}}).encode())
+
+        setup = GitHubAppSetup(str(tmp_path))
+        result = setup.validate_app_permissions("test-owner/test-repo")
+
+        assert result.success is False
+        assert "projects:write" in result.message
+
+    @patch("aia.github_app_setup.subprocess.run")
+    def test_permissions_cached_per_repository(self, mock_run, tmp_path):
+        """Test repeated validations reuse the permissions until the TTL expires."""
+        mock_run.return_value = Mock(stdout=json.dumps({"id": 1, "permissions": REQUIRED_PERMISSIONS}).encode())
+
+        setup = GitHubAppSetup(str(tmp_path))
+        assert setup.validate_app_permissions("test-owner/test-repo").success
+        assert setup.validate_app_permissions("test-owner/test-repo").success
+        assert mock_run.call_count == 1
+
+        setup.validate_app_permissions("test-owner/other-repo")
+        assert mock_run.call_count == 2
+
+    @patch("aia.github_app_setup.subprocess.run")
+    def test_permissions_cache_disabled(self, mock_run, tmp_path):
+        """Test a TTL of 0 reads the permissions every time."""
+        mock_run.return_value = Mock(stdout=json.dumps({"id": 1, "permissions": REQUIRED_PERMISSIONS}).encode())
+
+        setup = GitHubAppSetup(str(tmp_path), cache_ttl=0)
+        setup.validate_app_permissions("test-owner/test-repo")
+        setup.validate_app_permissions("test-owner/test-repo")
+
+        assert mock_run.call_count == 2
+
+    def test_manifest_file_matches_manifest(self, tmp_path):
+        """Test the manifest file holds the generated manifest and callers get their own copy."""
+        setup = GitHubAppSetup(str(tmp_path))
+
+        result = setup.create_app_manifest_file()
+        manifest = setup.generate_app_manifest()
+        manifest["default_permissions"]["issues"] = "read"
+
+        assert result.success is True
+        assert json.loads((tmp_path / "app_manifest.json").read_text())["default_permissions"]["issues"] == "write"
+        assert setup.generate_app_manifest()["default_permissions"]["issues"] == "write"
+
+    def test_setup_complete_writes_all_files(self, tmp_path):
+        """Test complete setup writes the manifest, environment template and instructions."""
+        result = GitHubAppSetup(str(tmp_path)).setup_github_app_complete("test-owner/test-repo")
+
+        assert result.success
+        assert result.output.splitlines()[0].startswith("✓ Manifest:")
+        for name in ("app_manifest.json", ".env.template", "SETUP_INSTRUCTIONS.md"):
+            assert (tmp_path / name).read_text()
+
+    def test_app_config_reused_until_file_changes(self, tmp_path):
+        """Test the app config is parsed once and re-read after it is saved again."""
+        setup = GitHubAppSetup(str(tmp_path))
+        assert setup.load_app_config() is None
+
+        setup.save_app_config(
+            GitHubAppConfig(app_id="1", private_key_path="key.pem", installation_id="2", webhook_secret=TEST_WEBHOOK_SECRET)
+        )
+        first = setup.load_app_config()
+        assert setup.load_app_config() is first
+
+        setup.save_app_config(
+            GitHubAppConfig(app_id="10", private_key_path="key.pem", installation_id="2", webhook_secret=TEST_WEBHOOK_SECRET)
+        )
+        assert setup.load_app_config().app_id == "10"
+
+        (tmp_path / "config.json").write_text("[]")
+        assert setup.load_app_config() is None
+
+    @patch("aia.github_app_setup.subprocess.run")
+    def test_validate_permissions_gh_error(self, mock_run, tmp_path):
+        """Test a failing gh call reports its decoded error message."""
+        mock_run.side_effect = subprocess.CalledProcessError(1, ["gh"], stderr=b"HTTP 404: Not Found")
+
+        result = GitHubAppSetup(str(tmp_path)).validate_app_permissions("test-owner/test-repo")
+
+        assert result.success is False
+        assert result.error == "HTTP 404: Not Found"
+        assert mock_run.call_args[0][0] == ["gh", "api", "/repos/test-owner/test-repo/installation"]
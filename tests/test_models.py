@@ -1,7 +1,10 @@
 """Unit tests for models module."""
 
+import dataclasses
 from datetime import datetime
 
+import pytest
+
 from aia.models import Issue, IssueState, WorkflowConfig, WorkflowStatus, GitOperation, PullRequest, PullRequestState
 
 
@@ -36,11 +39,44 @@ class TestIssue:
         short_name = issue.get_short_name()
         assert short_name == "fix-user-auth--session-managem"
 
+    def test_get_short_name_drops_underscores_keeps_unicode(self):
+        """Test short name keeps unicode letters and drops underscores."""
+        issue = Issue(
+            number=1,
+            title="Café_menu v2",
+            body="",
+            state=IssueState.OPEN,
+            labels=[],
+            assignees=[],
+            created_at=datetime.now(),
+            updated_at=datetime.now(),
+            url="",
+        )
+        assert issue.get_short_name() == "cafémenu-v2"
+
     def test_has_label(self, sample_issue):
         """Test checking if issue has specific label."""
         assert sample_issue.has_label("feature") is True
         assert sample_issue.has_label("bug") is False
 
+    def test_labels_stored_as_tuple(self, sample_issue):
+        """Test list labels are stored as an immutable tuple."""
+        assert isinstance(sample_issue.labels, tuple)
+        with pytest.raises(AttributeError):
+            sample_issue.labels.append("bug")
+
+    def test_reassigned_labels_reindexed(self, sample_issue):
+        """Test label lookups follow labels reassigned after construction."""
+        assert sample_issue.get_assigned_ai() is None
+
+        sample_issue.labels = ["bug", "assigned:ai-coder"]
+
+        assert sample_issue.has_label("bug") is True
+        assert sample_issue.has_label("feature") is False
+        assert sample_issue.is_assigned_to_ai() is True
+        assert sample_issue.get_assigned_ai() == "ai-coder"
+        assert sample_issue.labels == ("bug", "assigned:ai-coder")
+
     def test_is_assigned_to_ai_false(self, sample_issue):
         """Test AI assignment check when not assigned."""
         assert sample_issue.is_assigned_to_ai() is False
@@ -100,6 +136,15 @@ class TestWorkflowConfig:
         assert config.project_number is None
         assert config.default_base_branch == "main"
 
+    def test_config_is_immutable(self, sample_config):
+        """Test config is frozen and replace() recomputes the full name."""
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            sample_config.project_number = 2
+
+        renamed = dataclasses.replace(sample_config, repo_name="other-repo")
+        assert renamed.repo_full_name == "test-owner/other-repo"
+        assert hash(renamed) != hash(sample_config)
+
 
 class TestGitOperation:
     """Test GitOperation model."""
@@ -200,6 +245,12 @@ class TestEnums:
         assert WorkflowStatus.TESTING.value == "🧪 Testing"
         assert WorkflowStatus.DONE.value == "✅ Done"
 
+    def test_workflow_status_from_column(self):
+        """Test workflow status lookup by project column name."""
+        assert WorkflowStatus.from_column("🔄 Doing") is WorkflowStatus.DOING
+        assert WorkflowStatus.from_column("Backlog") is None
+        assert WorkflowStatus.from_column(None) is None
+
     def test_issue_state_values(self):
         """Test issue state enum values."""
         assert IssueState.OPEN.value == "open"
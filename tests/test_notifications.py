@@ -0,0 +1,147 @@
+"""Unit tests for notifications module."""
+
+import asyncio
+import json
+from datetime import datetime
+from unittest.mock import Mock
+
+from aia.git_aia_manager import AiaType
+from aia.models import GitOperation, Issue, IssueState, WorkflowStatus
+from aia.notifications import WorkflowNotifications, WorkflowTracker
+
+
+def _issue(number: int) -> Issue:
+    now = datetime.now()
+    return Issue(
+        number=number,
+        title=f"Issue {number}",
+        body="",
+        state=IssueState.OPEN,
+        labels=[],
+        assignees=[],
+        created_at=now,
+        updated_at=now,
+        url=f"https://github.com/o/r/issues/{number}",
+    )
+
+
+class TestWorkflowNotifications:
+    """Test WorkflowNotifications class."""
+
+    def setup_method(self):
+        """Set up a notifications instance around a mock manager."""
+        self.manager = Mock()
+        self.manager.config.repo_full_name = "o/r"
+        self.manager.comment_on_pr.return_value = GitOperation(success=True, message="ok")
+        self.notifications = WorkflowNotifications(self.manager)
+
+    def test_comment_posted_immediately(self):
+        """Test notifications outside a batch post their comment right away."""
+        result = self.notifications.notify_workflow_error(_issue(1), AiaType.AI_CODER, "boom")
+
+        assert result.message == "ok"
+        self.manager.comment_on_pr.assert_called_once()
+        assert self.manager.comment_on_pr.call_args[0][:2] == ("o/r", 1)
+
+    def test_batched_comments_posted_on_exit(self):
+        """Test batched notifications are queued and posted in order per issue on exit."""
+        with self.notifications.batched():
+            queued = self.notifications.notify_workflow_start(_issue(1), AiaType.AI_CODER, "feature/1")
+            self.notifications.notify_workflow_start(_issue(2), AiaType.AI_CODER, "feature/2")
+            self.notifications.notify_workflow_progress(_issue(1), AiaType.AI_CODER, "halfway")
+            self.manager.comment_on_pr.assert_not_called()
+
+        assert queued.success
+        assert self.manager.comment_on_pr.call_count == 3
+        issue_1_messages = [call[0][2] for call in self.manager.comment_on_pr.call_args_list if call[0][1] == 1]
+        assert "halfway" not in issue_1_messages[0]
+        assert "halfway" in issue_1_messages[1]
+        assert self.notifications.flush() == []
+
+    def test_status_report_groups_by_status(self):
+        """Test the status report lists issues under their status in first seen order."""
+        todo, doing, unknown = _issue(1), _issue(2), _issue(3)
+        todo.project_status = WorkflowStatus.TODO
+        doing.project_status = WorkflowStatus.DOING
+        second_todo = _issue(4)
+        second_todo.project_status = WorkflowStatus.TODO
+
+        report = self.notifications.generate_status_report([todo, doing, unknown, second_todo]).splitlines()
+
+        todo_header = report.index(f"**{WorkflowStatus.TODO.value}** (2 issues)")
+        assert report[todo_header + 1 : todo_header + 3] == ["  • #1: Issue 1", "  • #4: Issue 4"]
+        assert report.index(f"**{WorkflowStatus.DOING.value}** (1 issues)") > todo_header
+        assert "**Unknown** (1 issues)" in report
+
+    def test_notify_many(self):
+        """Test comments on several issues are posted together, in item order."""
+        items = [(_issue(1), "first"), (_issue(2), "second"), (_issue(1), "third")]
+
+        results = asyncio.run(self.notifications.notify_many(items))
+
+        assert len(results) == 3
+        posted = [call[0][1:] for call in self.manager.comment_on_pr.call_args_list]
+        assert sorted(posted) == [(1, "first"), (1, "third"), (2, "second")]
+        assert posted.index((1, "first")) < posted.index((1, "third"))
+
+
+class TestWorkflowTracker:
+    """Test WorkflowTracker class."""
+
+    def test_export_events_as_json_lines(self, tmp_path):
+        """Test exported events are one JSON document per line."""
+        tracker = WorkflowTracker()
+        tracker.track_event("start", 1, AiaType.AI_CODER)
+        tracker.track_event("complete", 1, AiaType.AI_CODER, duration=2.5)
+
+        output = tmp_path / "events.jsonl"
+        assert tracker.export_events(str(output))
+
+        events = [json.loads(line) for line in output.read_text().splitlines()]
+        assert [event["event_type"] for event in events] == ["start", "complete"]
+        assert events[1]["duration"] == 2.5
+
+    def test_events_appended_to_log(self, tmp_path):
+        """Test tracked events are appended to a non-empty log file, while only this tracker's events are exported."""
+        log_path = tmp_path / "events.log"
+        log_path.write_text('{"event_type": "earlier"}\n')
+        with WorkflowTracker(log_path) as tracker:
+            tracker.track_event("start", 1, AiaType.AI_CODER)
+            tracker.track_event("complete", 1, AiaType.AI_CODER, duration=2.0)
+
+            output = tmp_path / "events.jsonl"
+            assert tracker.export_events(str(output))
+
+        assert [json.loads(line)["event_type"] for line in log_path.read_text().splitlines()] == ["earlier", "start", "complete"]
+        assert [json.loads(line) for line in output.read_text().splitlines()] == tracker.events
+
+    def test_events_written_as_tracked(self, tmp_path):
+        """Test each tracked event is on disk before the tracker is closed."""
+        log_path = tmp_path / "events.log"
+        with WorkflowTracker(log_path) as tracker:
+            tracker.track_event("start", 1, AiaType.AI_CODER)
+            assert json.loads(log_path.read_text())["event_type"] == "start"
+
+        assert tracker._log is None
+
+    def test_workflow_metrics(self):
+        """Test metrics aggregate success, duration and AI type over all events."""
+        tracker = WorkflowTracker()
+        tracker.track_event("start", 1, AiaType.AI_CODER)
+        tracker.track_event("complete", 1, AiaType.AI_CODER, duration=3.0)
+        tracker.track_event("complete", 2, AiaType.AI_REVIEWER, duration=1.0, success=False)
+
+        metrics = tracker.get_workflow_metrics()
+
+        assert metrics["total_events"] == 3
+        assert metrics["successful_events"] == 2
+        assert metrics["success_rate"] == 66.67
+        assert metrics["average_duration"] == 2.0
+        assert metrics["ai_type_distribution"] == {AiaType.AI_CODER.value: 2, AiaType.AI_REVIEWER.value: 1}
+        assert metrics["latest_event"]["issue_number"] == 2
+        assert metrics["latest_event"]["success"] is False
+        assert [event["duration"] for event in tracker.events] == [None, 3.0, 1.0]
+        assert tracker.events is tracker.events
+
+        tracker.track_event("start", 3, AiaType.AI_TESTER)
+        assert len(tracker.events) == 4
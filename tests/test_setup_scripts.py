@@ -0,0 +1,136 @@
+"""Unit tests for setup_scripts module."""
+
+import json
+import subprocess
+from dataclasses import replace
+from unittest.mock import Mock, patch
+
+from aia.gh_client import GhHttpClient, GhResponse
+from aia.models import GitOperation
+from aia.setup_scripts import ProjectBoardSetup
+
+
+def _response(status: int, body: dict) -> GhResponse:
+    return GhResponse(status, {}, json.dumps(body).encode())
+
+
+class TestProjectBoardSetup:
+    """Test ProjectBoardSetup class."""
+
+    @patch("aia.setup_scripts.subprocess.run")
+    def test_repository_access_through_http_client(self, mock_run, sample_config):
+        """Test repository access is validated over the REST API without gh."""
+        http_client = Mock()
+        http_client.request.return_value = _response(
+            200, {"name": "test-repo", "owner": {"login": "test-owner"}, "html_url": "https://github.com/test-owner/test-repo"}
+        )
+
+        result = ProjectBoardSetup(sample_config, http_client).validate_repository_access()
+
+        assert result.success is True
+        assert result.message == "Repository access validated: https://github.com/test-owner/test-repo"
+        http_client.request.assert_called_once_with("GET", "/repos/test-owner/test-repo")
+        mock_run.assert_not_called()
+
+    @patch("aia.gh_client.subprocess.run", side_effect=FileNotFoundError("gh"))
+    def test_repository_access_without_gh(self, _mock_run, sample_config):
+        """Test a missing gh CLI fails repository validation cleanly when the client needs its token."""
+        result = ProjectBoardSetup(sample_config, GhHttpClient()).validate_repository_access()
+
+        assert result.success is False
+        assert result.error == "GitHub CLI not found"
+
+    def test_create_labels_through_http_client(self, sample_config):
+        """Test labels are created over the REST API and existing ones are accepted."""
+        http_client = Mock()
+        already_exists = {"message": "Validation Failed", "errors": [{"resource": "Label", "code": "already_exists"}]}
+        http_client.request.side_effect = lambda method, path, body: (
+            _response(422, already_exists) if body["name"] == "bug" else _response(201, {"name": body["name"]})
+        )
+        setup = ProjectBoardSetup(sample_config, http_client)
+
+        result = setup.create_required_labels()
+
+        assert result.success is True
+        assert "bug (already exists)" in result.output
+        assert http_client.request.call_count == len(setup.required_labels)
+
+    def test_create_project_board_through_graphql(self, sample_config):
+        """Test the project is created for the repository owner and linked to the repository."""
+        http_client = Mock()
+        http_client.graphql.side_effect = [
+            {"repository": {"id": "R_1", "owner": {"id": "U_1"}}},
+            {"createProjectV2": {"projectV2": {"number": 7}}},
+        ]
+
+        result = ProjectBoardSetup(sample_config, http_client).create_project_board("AI Workflow")
+
+        assert result.success is True
+        assert result.output == "7"
+        assert http_client.graphql.call_args[1] == {"ownerId": "U_1", "repositoryId": "R_1", "title": "AI Workflow"}
+
+    @patch("aia.setup_scripts.subprocess.run")
+    def test_create_labels_reports_failures(self, mock_run, sample_config):
+        """Test labels gh fails to create are reported while the others are created."""
+
+        def run_label_create(cmd, **_kwargs):
+            if cmd[3] == "research":
+                raise subprocess.CalledProcessError(1, cmd, stderr="HTTP 403")
+            return Mock(stdout="")
+
+        mock_run.side_effect = run_label_create
+        setup = ProjectBoardSetup(sample_config)
+
+        result = setup.create_required_labels()
+
+        assert result.success is False
+        assert result.message == "Some labels failed to create: research: HTTP 403"
+        assert mock_run.call_count == len(setup.required_labels)
+
+    def test_complete_setup_records_created_project(self, sample_config):
+        """Test the config file is written after the project board is created and steps report in order."""
+        setup = ProjectBoardSetup(replace(sample_config, project_number=None))
+        ok = GitOperation(success=True, message="ok")
+        recorded_project_numbers = []
+        with (
+            patch.object(setup, "validate_github_cli", return_value=ok),
+            patch.object(setup, "validate_repository_access", return_value=ok),
+            patch.object(setup, "create_required_labels", return_value=ok),
+            patch.object(setup, "setup_issue_templates", return_value=ok),
+            patch.object(setup, "create_project_board", return_value=GitOperation(success=True, message="created", output="7")),
+            patch.object(
+                setup, "create_workflow_config_file", side_effect=lambda: recorded_project_numbers.append(setup.config.project_number) or ok
+            ),
+        ):
+            result = setup.run_complete_setup("AI Workflow")
+
+        assert result.success is True
+        assert recorded_project_numbers == [7]
+        steps = [line.split(":")[0] for line in result.output.split("\\n")]
+        assert steps == ["✓ GitHub CLI", "✓ Repository", "✓ Labels", "✓ Project Board", "✓ Issue Templates", "✓ Config File"]
+
+    @patch("aia.gh_client.subprocess.run", side_effect=FileNotFoundError("gh"))
+    @patch("aia.setup_scripts.subprocess.run", side_effect=FileNotFoundError("gh"))
+    def test_complete_setup_without_gh(self, _mock_setup_run, _mock_client_run, sample_config):
+        """Test setup stops at the CLI check, before any API call, when gh is not installed."""
+        http_client = GhHttpClient()
+        setup = ProjectBoardSetup(sample_config, http_client)
+
+        with patch.object(http_client, "request") as mock_request:
+            result = setup.run_complete_setup("AI Workflow")
+
+        assert result.success is False
+        assert result.message == "Setup failed at GitHub CLI validation"
+        assert result.error == "GitHub CLI not installed"
+        mock_request.assert_not_called()
+
+    def test_issue_templates_written(self, sample_config, tmp_path, monkeypatch):
+        """Test the issue templates are written under .github/ISSUE_TEMPLATE."""
+        monkeypatch.chdir(tmp_path)
+
+        result = ProjectBoardSetup(sample_config).setup_issue_templates()
+
+        assert result.success is True
+        template_dir = tmp_path / ".github" / "ISSUE_TEMPLATE"
+        assert sorted(path.name for path in template_dir.iterdir()) == ["bug_report.md", "documentation.md", "feature_request.md"]
+        assert (template_dir / "bug_report.md").read_text().startswith("---\nname: Bug Report\n")
@@ -0,0 +1,131 @@
+"""Unit tests for webhook_server module."""
+
+import hashlib
+import hmac
+import http.client
+import json
+import threading
+
+from aia.models import Issue, IssueState, WorkflowStatus
+from aia.webhook_server import MAX_WEBHOOK_BODY_BYTES, WebhookServer, WorkflowCache, apply_event, verify_signature
+
+
+def _issue(number: int, status: WorkflowStatus | None) -> Issue:
+    return Issue(number, f"Issue {number}", "", IssueState.OPEN, [], [], None, None, "", status)
+
+
+class TestWorkflowCache:
+    """Test WorkflowCache class."""
+
+    def test_cold_until_loaded(self):
+        """Test cache reports populated only after a snapshot is loaded."""
+        cache = WorkflowCache()
+        assert not cache.populated
+
+        cache.load([_issue(1, WorkflowStatus.TODO)])
+        assert cache.populated
+
+        cache.invalidate()
+        assert not cache.populated
+
+    def test_status_counts(self):
+        """Test counts reflect loaded, updated and removed issues."""
+        cache = WorkflowCache()
+        cache.load([_issue(1, WorkflowStatus.TODO), _issue(2, WorkflowStatus.TODO), _issue(3, None)])
+
+        cache.update(2, WorkflowStatus.DOING)
+        cache.remove(1)
+
+        status_counts = cache.status_counts()
+        assert status_counts[WorkflowStatus.TODO] == 0
+        assert status_counts[WorkflowStatus.DOING] == 1
+        assert sum(status_counts.values()) == 1
+
+
+class TestWebhookEvents:
+    """Test signature validation and event handling."""
+
+    def test_verify_signature(self):
+        """Test only a matching sha256 signature is accepted."""
+        body = b'{"action": "opened"}'
+        signature = "sha256=" + hmac.new(b"secret", body, hashlib.sha256).hexdigest()
+
+        assert verify_signature(b"secret", body, signature)
+        assert not verify_signature(b"other", body, signature)
+        assert not verify_signature(b"secret", body, None)
+
+    def test_apply_issue_closed_removes_issue(self):
+        """Test closed issues leave the snapshot."""
+        cache = WorkflowCache()
+        cache.load([_issue(1, WorkflowStatus.REVIEW)])
+
+        apply_event(cache, "issues", {"action": "closed", "issue": {"number": 1}})
+
+        assert cache.populated
+        assert cache.status_counts()[WorkflowStatus.REVIEW] == 0
+
+    def test_apply_project_item_invalidates(self):
+        """Test project item changes drop the snapshot."""
+        cache = WorkflowCache()
+        cache.load([_issue(1, WorkflowStatus.TODO)])
+
+        apply_event(cache, "projects_v2_item", {"action": "edited"})
+
+        assert not cache.populated
+
+
+class TestWebhookServer:
+    """Test WebhookServer end to end."""
+
+    def _post(self, server: WebhookServer, body: bytes, headers: dict[str, str]) -> int:
+        connection = http.client.HTTPConnection(*server.server_address)
+        try:
+            connection.request("POST", "/webhook", body=body, headers=headers)
+            return connection.getresponse().status
+        finally:
+            connection.close()
+
+    def test_signed_delivery_updates_cache(self):
+        """Test signed deliveries are applied and unsigned ones rejected."""
+        cache = WorkflowCache()
+        cache.load([_issue(1, WorkflowStatus.TODO)])
+        server = WebhookServer(cache, "secret", port=0)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+
+        try:
+            body = json.dumps({"action": "deleted", "issue": {"number": 1}}).encode()
+            signature = "sha256=" + hmac.new(b"secret", body, hashlib.sha256).hexdigest()
+
+            assert self._post(server, body, {"X-GitHub-Event": "issues"}) == 401
+            assert cache.status_counts()[WorkflowStatus.TODO] == 1
+
+            assert self._post(server, body, {"X-GitHub-Event": "issues", "X-Hub-Signature-256": signature}) == 204
+            assert cache.status_counts()[WorkflowStatus.TODO] == 0
+        finally:
+            server.shutdown()
+            server.server_close()
+
+    def test_invalid_content_length_rejected(self):
+        """Test a malformed or oversized Content-Length is answered without reading the body."""
+        server = WebhookServer(WorkflowCache(), "secret", port=0)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+
+        def post_with_length(content_length: str) -> int:
+            connection = http.client.HTTPConnection(*server.server_address, timeout=5)
+            try:
+                connection.putrequest("POST", "/webhook")
+                connection.putheader("Content-Length", content_length)
+                connection.endheaders()
+                return connection.getresponse().status
+            finally:
+                connection.close()
+
+        try:
+            assert post_with_length("abc") == 400
+            assert post_with_length("-1") == 400
+            assert post_with_length(str(MAX_WEBHOOK_BODY_BYTES + 1)) == 413
+        finally:
+            server.shutdown()
+            server.server_close()
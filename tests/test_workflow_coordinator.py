@@ -1,11 +1,16 @@
 """Unit tests for workflow_coordinator module."""
 
+import asyncio
+import subprocess
 from unittest.mock import Mock, patch
 import logging
 
 from aia.workflow_coordinator import WorkflowCoordinator
+from aia.cache import IssueCache
+from aia.gh_client import GhHttpClient
 from aia.git_aia_manager import AiaType
 from aia.models import Issue, WorkflowStatus, GitOperation, IssueState
+from aia.webhook_server import WorkflowCache
 
 
 class TestWorkflowCoordinator:
@@ -26,6 +31,16 @@ class TestWorkflowCoordinator:
         # Should create managers for all AI types
         assert mock_factory.create_manager.call_count == len(AiaType)
 
+        # All managers share one HTTP client and one ETag issue cache
+        assert isinstance(coordinator.http_client, GhHttpClient)
+        assert {id(call[0][4]) for call in mock_factory.create_manager.call_args_list} == {id(coordinator.http_client)}
+        issue_caches = {call[0][3] for call in mock_factory.create_manager.call_args_list}
+        assert len(issue_caches) == 1
+        assert isinstance(issue_caches.pop(), IssueCache)
+
+        # Attributes live in slots
+        assert not hasattr(coordinator, "__dict__")
+
     @patch("aia.workflow_coordinator.AiaManagerFactory")
     def test_get_manager(self, mock_factory, sample_config):
         """Test getting specific manager."""
@@ -37,6 +52,19 @@ class TestWorkflowCoordinator:
 
         assert manager == mock_manager
 
+    @patch("aia.workflow_coordinator.AiaManagerFactory")
+    def test_manager_attributes(self, mock_factory, sample_config):
+        """Test per AI type manager attributes reference the managers by type."""
+        mock_factory.create_manager.side_effect = lambda provider, ai_type, *args: Mock(name=ai_type.value)
+
+        coordinator = WorkflowCoordinator(sample_config, "github")
+
+        assert coordinator.coder_manager is coordinator.get_manager(AiaType.AI_CODER)
+        assert coordinator.reviewer_manager is coordinator.get_manager(AiaType.AI_REVIEWER)
+        assert coordinator.tester_manager is coordinator.get_manager(AiaType.AI_TESTER)
+        assert coordinator.researcher_manager is coordinator.get_manager(AiaType.AI_RESEARCHER)
+        assert coordinator.marketeer_manager is coordinator.get_manager(AiaType.AI_MARKETEER)
+
     @patch("aia.workflow_coordinator.AiaManagerFactory")
     def test_start_coder_workflow_success(self, mock_factory, sample_config, sample_issue):
         """Test successful coder workflow start."""
@@ -45,8 +73,7 @@ class TestWorkflowCoordinator:
 
         # Mock manager methods
         mock_manager.get_issue.return_value = sample_issue
-        mock_manager.update_issue_status.return_value = GitOperation(True, "Status updated")
-        mock_manager.assign_to_ai.return_value = GitOperation(True, "Assigned")
+        mock_manager.batch_transition.return_value = GitOperation(True, "Transitioned")
         mock_manager.create_branch.return_value = GitOperation(True, "Branch created", "F/123/test-branch")
 
         coordinator = WorkflowCoordinator(sample_config, "github")
@@ -58,10 +85,29 @@ class TestWorkflowCoordinator:
 
         # Verify method calls
         mock_manager.get_issue.assert_called_once_with(123)
-        mock_manager.update_issue_status.assert_called_once_with(sample_issue, WorkflowStatus.DOING)
-        mock_manager.assign_to_ai.assert_called_once_with(sample_issue, AiaType.AI_CODER)
+        mock_manager.batch_transition.assert_called_once_with(sample_issue, WorkflowStatus.DOING, AiaType.AI_CODER)
         mock_manager.create_branch.assert_called_once_with(sample_issue)
 
+    @patch("aia.workflow_coordinator.AiaManagerFactory")
+    def test_issue_cached_until_written(self, mock_factory, sample_config, sample_issue):
+        """Test repeated reads of an issue hit memory until a workflow writes to it."""
+        mock_manager = Mock()
+        mock_factory.create_manager.return_value = mock_manager
+        mock_manager.get_issue.return_value = sample_issue
+        mock_manager.batch_transition.return_value = GitOperation(False, "Update failed")
+
+        coordinator = WorkflowCoordinator(sample_config, "github")
+
+        # Rejected before any write: second call is served from the cache
+        coordinator.complete_coder_workflow(123)
+        coordinator.complete_coder_workflow(123)
+        assert mock_manager.get_issue.call_count == 1
+
+        # A (failed) write invalidates the cached issue
+        coordinator.start_coder_workflow(123)
+        coordinator.start_coder_workflow(123)
+        assert mock_manager.get_issue.call_count == 2
+
     @patch("aia.workflow_coordinator.AiaManagerFactory")
     def test_start_coder_workflow_issue_not_found(self, mock_factory, sample_config):
         """Test coder workflow start when issue not found."""
@@ -122,8 +168,7 @@ class TestWorkflowCoordinator:
         )
 
         mock_manager.get_issue.return_value = issue
-        mock_manager.update_issue_status.return_value = GitOperation(True, "Status updated")
-        mock_manager.assign_to_ai.return_value = GitOperation(True, "Assigned to reviewer")
+        mock_manager.batch_transition.return_value = GitOperation(True, "Transitioned")
 
         coordinator = WorkflowCoordinator(sample_config, "github")
         result = coordinator.complete_coder_workflow(123)
@@ -132,8 +177,7 @@ class TestWorkflowCoordinator:
         assert "Completed coder workflow" in result.message
 
         # Verify transitions
-        mock_manager.update_issue_status.assert_called_once_with(issue, WorkflowStatus.REVIEW)
-        mock_manager.assign_to_ai.assert_called_once_with(issue, AiaType.AI_REVIEWER)
+        mock_manager.batch_transition.assert_called_once_with(issue, WorkflowStatus.REVIEW, AiaType.AI_REVIEWER)
 
     @patch("aia.workflow_coordinator.AiaManagerFactory")
     def test_complete_reviewer_workflow_success(self, mock_factory, sample_config):
@@ -155,8 +199,7 @@ class TestWorkflowCoordinator:
         )
 
         mock_manager.get_issue.return_value = issue
-        mock_manager.update_issue_status.return_value = GitOperation(True, "Status updated")
-        mock_manager.assign_to_ai.return_value = GitOperation(True, "Assigned to tester")
+        mock_manager.batch_transition.return_value = GitOperation(True, "Transitioned")
 
         coordinator = WorkflowCoordinator(sample_config, "github")
         result = coordinator.complete_reviewer_workflow(123)
@@ -165,8 +208,7 @@ class TestWorkflowCoordinator:
         assert "Completed reviewer workflow" in result.message
 
         # Verify transitions
-        mock_manager.update_issue_status.assert_called_once_with(issue, WorkflowStatus.TESTING)
-        mock_manager.assign_to_ai.assert_called_once_with(issue, AiaType.AI_TESTER)
+        mock_manager.batch_transition.assert_called_once_with(issue, WorkflowStatus.TESTING, AiaType.AI_TESTER)
 
     @patch("aia.workflow_coordinator.AiaManagerFactory")
     def test_complete_tester_workflow_success(self, mock_factory, sample_config):
@@ -190,8 +232,7 @@ class TestWorkflowCoordinator:
         mock_manager.get_issue.return_value = issue
         mock_manager.generate_branch_name.return_value = "F/123/test-issue"
         mock_manager.create_pr.return_value = GitOperation(True, "PR created")
-        mock_manager.update_issue_status.return_value = GitOperation(True, "Status updated")
-        mock_manager.remove_label_from_issue.return_value = GitOperation(True, "Label removed")
+        mock_manager.batch_transition.return_value = GitOperation(True, "Transitioned")
 
         coordinator = WorkflowCoordinator(sample_config, "github")
         result = coordinator.complete_tester_workflow(123, "Fix: Test issue", "Fixes #123")
@@ -201,8 +242,46 @@ class TestWorkflowCoordinator:
 
         # Verify all operations
         mock_manager.create_pr.assert_called_once_with("Fix: Test issue", "Fixes #123", "F/123/test-issue", "main")
-        mock_manager.update_issue_status.assert_called_once_with(issue, WorkflowStatus.DONE)
-        mock_manager.remove_label_from_issue.assert_called_once_with(issue, "assigned:ai-tester")
+        mock_manager.batch_transition.assert_called_once_with(issue, WorkflowStatus.DONE, extra_labels_remove=("assigned:ai-tester",))
+
+    @patch("aia.workflow_coordinator.AiaManagerFactory")
+    def test_complete_tester_workflow_pr_fails_rolls_back(self, mock_factory, sample_config):
+        """Test a failed PR moves the already transitioned issue back to Testing."""
+        mock_manager = Mock()
+        mock_factory.create_manager.return_value = mock_manager
+        issue = Issue(123, "Test issue", "", IssueState.OPEN, ["assigned:ai-tester"], [], None, None, "")
+        mock_manager.get_issue.return_value = issue
+        mock_manager.generate_branch_name.return_value = "F/123/test-issue"
+        mock_manager.create_pr.return_value = GitOperation(False, "PR creation failed", error="no commits")
+        mock_manager.batch_transition.return_value = GitOperation(True, "Transitioned")
+
+        coordinator = WorkflowCoordinator(sample_config, "github")
+        result = coordinator.complete_tester_workflow(123, "Fix: Test issue", "Fixes #123")
+
+        assert result.success is False
+        assert result.message == "PR creation failed"
+        mock_manager.batch_transition.assert_called_with(issue, WorkflowStatus.TESTING, AiaType.AI_TESTER)
+
+    @patch("aia.workflow_coordinator.AiaManagerFactory")
+    def test_complete_tester_workflow_rollback_fails(self, mock_factory, sample_config):
+        """Test a failed rollback after a failed PR is reported with the PR error."""
+        mock_manager = Mock()
+        mock_factory.create_manager.return_value = mock_manager
+        issue = Issue(123, "Test issue", "", IssueState.OPEN, ["assigned:ai-tester"], [], None, None, "")
+        mock_manager.get_issue.return_value = issue
+        mock_manager.generate_branch_name.return_value = "F/123/test-issue"
+        mock_manager.create_pr.return_value = GitOperation(False, "PR creation failed", error="no commits")
+        mock_manager.batch_transition.side_effect = [
+            GitOperation(True, "Transitioned"),
+            GitOperation(False, "Transition failed", error="HTTP 502"),
+        ]
+
+        coordinator = WorkflowCoordinator(sample_config, "github")
+        result = coordinator.complete_tester_workflow(123, "Fix: Test issue", "Fixes #123")
+
+        assert result.success is False
+        assert "moving issue 123 back to Testing failed" in result.message
+        assert result.error == "no commits; rollback: HTTP 502"
 
     @patch("aia.workflow_coordinator.AiaManagerFactory")
     def test_assign_researcher_to_issue(self, mock_factory, sample_config, sample_issue):
@@ -241,7 +320,7 @@ class TestWorkflowCoordinator:
         )
 
         mock_manager.get_issue.return_value = issue
-        mock_manager.remove_label_from_issue.return_value = GitOperation(True, "Label removed")
+        mock_manager.batch_transition.return_value = GitOperation(True, "Transitioned")
 
         coordinator = WorkflowCoordinator(sample_config, "github")
         result = coordinator.complete_research_workflow(123)
@@ -249,7 +328,7 @@ class TestWorkflowCoordinator:
         assert result.success is True
         assert "Completed research workflow" in result.message
 
-        mock_manager.remove_label_from_issue.assert_called_once_with(issue, "assigned:ai-researcher")
+        mock_manager.batch_transition.assert_called_once_with(issue, extra_labels_remove=("assigned:ai-researcher",))
 
     @patch("aia.workflow_coordinator.AiaManagerFactory")
     def test_get_issues_for_ai(self, mock_factory, sample_config, sample_issue):
@@ -258,17 +337,14 @@ class TestWorkflowCoordinator:
         mock_factory.create_manager.return_value = mock_manager
 
         # Test with status filter
-        mock_manager.get_issues.return_value = [sample_issue]
+        coder_issue = Issue(123, "Test", "", IssueState.OPEN, ["feature", "assigned:ai-coder"], [], None, None, "", WorkflowStatus.DOING)
+        mock_manager.get_issues.return_value = [coder_issue, sample_issue]
 
         coordinator = WorkflowCoordinator(sample_config, "github")
+        issues = coordinator.get_issues_for_ai(AiaType.AI_CODER, WorkflowStatus.DOING)
 
-        # Mock the assigned AI check
-        with patch.object(sample_issue, "get_assigned_ai", return_value="ai-coder"):
-            issues = coordinator.get_issues_for_ai(AiaType.AI_CODER, WorkflowStatus.DOING)
-
-        assert len(issues) == 1
-        assert issues[0] == sample_issue
-        mock_manager.get_issues.assert_called_once_with(WorkflowStatus.DOING)
+        assert issues == [coder_issue]
+        mock_manager.get_issues.assert_called_once_with(WorkflowStatus.DOING, label="assigned:ai-coder")
 
         # Test without status filter
         mock_manager.get_assigned_issues.return_value = [sample_issue]
@@ -321,41 +397,108 @@ class TestWorkflowCoordinator:
 
     @patch("aia.workflow_coordinator.AiaManagerFactory")
     def test_get_workflow_status(self, mock_factory, sample_config):
-        """Test getting workflow status counts."""
+        """Test getting workflow status counts from the provider's project board count."""
         mock_manager = Mock()
         mock_factory.create_manager.return_value = mock_manager
 
-        # Create issues in different statuses
-        issues = [
-            Issue(123, "Test1", "", IssueState.OPEN, [], [], None, None, "", WorkflowStatus.TODO),
-            Issue(124, "Test2", "", IssueState.OPEN, [], [], None, None, "", WorkflowStatus.TODO),
-            Issue(125, "Test3", "", IssueState.OPEN, [], [], None, None, "", WorkflowStatus.DOING),
-            Issue(126, "Test4", "", IssueState.OPEN, [], [], None, None, "", WorkflowStatus.DONE),
-        ]
-
-        mock_manager.get_issues.return_value = issues
+        mock_manager.get_status_counts.return_value = {
+            WorkflowStatus.TRIAGE: 0,
+            WorkflowStatus.TODO: 2,
+            WorkflowStatus.DOING: 1,
+            WorkflowStatus.REVIEW: 0,
+            WorkflowStatus.TESTING: 0,
+            WorkflowStatus.DONE: 1,
+        }
 
         coordinator = WorkflowCoordinator(sample_config, "github")
         status_counts = coordinator.get_workflow_status()
 
+        mock_manager.get_issues.assert_not_called()
+
         assert status_counts[WorkflowStatus.TODO] == 2
         assert status_counts[WorkflowStatus.DOING] == 1
         assert status_counts[WorkflowStatus.REVIEW] == 0
         assert status_counts[WorkflowStatus.TESTING] == 0
         assert status_counts[WorkflowStatus.DONE] == 1
 
+    @patch("aia.workflow_coordinator.AiaManagerFactory")
+    def test_get_workflow_status_counts(self, mock_factory, sample_config):
+        """Test workflow status counts delegate to the provider count query."""
+        mock_manager = Mock()
+        mock_factory.create_manager.return_value = mock_manager
+        mock_manager.get_status_counts.return_value = {WorkflowStatus.TODO: 3}
+
+        coordinator = WorkflowCoordinator(sample_config, "github")
+        status_counts = coordinator.get_workflow_status_counts()
+
+        assert status_counts == {WorkflowStatus.TODO: 3}
+        mock_manager.get_issues.assert_not_called()
+
+    @patch("aia.workflow_coordinator.AiaManagerFactory")
+    def test_get_workflow_status_cold_cache_loads_snapshot(self, mock_factory, sample_config):
+        """Test a cold cache is filled from the complete project issue list and then serves reads."""
+        mock_manager = Mock()
+        mock_factory.create_manager.return_value = mock_manager
+        mock_manager.get_project_issues.return_value = [
+            Issue(123 + number, "Test", "", IssueState.OPEN, [], [], None, None, "", WorkflowStatus.REVIEW) for number in range(45)
+        ]
+
+        cache = WorkflowCache()
+        coordinator = WorkflowCoordinator(sample_config, "github", cache=cache)
+
+        assert coordinator.get_workflow_status()[WorkflowStatus.REVIEW] == 45
+        assert coordinator.get_workflow_status()[WorkflowStatus.REVIEW] == 45
+
+        assert cache.populated
+        mock_manager.get_project_issues.assert_called_once_with()
+        mock_manager.get_issues.assert_not_called()
+
+    @patch("aia.workflow_coordinator.AiaManagerFactory")
+    def test_get_workflow_status_cold_cache_load_fails(self, mock_factory, sample_config):
+        """Test a failed issue listing leaves the cache cold and falls back to the provider count."""
+        mock_manager = Mock()
+        mock_factory.create_manager.return_value = mock_manager
+        mock_manager.get_project_issues.side_effect = subprocess.CalledProcessError(1, ["gh"], stderr="HTTP 502")
+        mock_manager.get_status_counts.return_value = {WorkflowStatus.TODO: 4}
+
+        cache = WorkflowCache()
+        coordinator = WorkflowCoordinator(sample_config, "github", cache=cache)
+
+        assert coordinator.get_workflow_status() == {WorkflowStatus.TODO: 4}
+        assert not cache.populated
+
+    @patch("aia.workflow_coordinator.AiaManagerFactory")
+    def test_async_reads_gather(self, mock_factory, sample_config, sample_issue):
+        """Test async read variants can be gathered and return the sync results."""
+        mock_manager = Mock()
+        mock_factory.create_manager.return_value = mock_manager
+        mock_manager.get_status_counts.return_value = {WorkflowStatus.TODO: 1}
+        mock_manager.get_issues.return_value = [sample_issue]
+
+        coordinator = WorkflowCoordinator(sample_config, "github")
+
+        async def gather_reads():
+            return await asyncio.gather(coordinator.get_workflow_status_counts_async(), coordinator.get_todo_issues_async())
+
+        status_counts, todo_issues = asyncio.run(gather_reads())
+
+        assert status_counts == {WorkflowStatus.TODO: 1}
+        assert todo_issues == [sample_issue]
+        assert mock_manager.get_issues.call_args[0] == (WorkflowStatus.TODO,)
+        assert "assigned:ai-coder" in mock_manager.get_issues.call_args[1]["exclude_labels"]
+
 
 class TestWorkflowCoordinatorErrorHandling:
     """Test error handling in WorkflowCoordinator."""
 
     @patch("aia.workflow_coordinator.AiaManagerFactory")
     def test_start_coder_workflow_update_status_failure(self, mock_factory, sample_config, sample_issue):
-        """Test start_coder_workflow when update_issue_status fails."""
+        """Test start_coder_workflow when the status update fails."""
         mock_manager = Mock()
         mock_factory.create_manager.return_value = mock_manager
 
         mock_manager.get_issue.return_value = sample_issue
-        mock_manager.update_issue_status.return_value = GitOperation(False, "Update failed")
+        mock_manager.batch_transition.return_value = GitOperation(False, "Update failed")
 
         coordinator = WorkflowCoordinator(sample_config, "github")
         result = coordinator.start_coder_workflow(123)
@@ -365,13 +508,12 @@ class TestWorkflowCoordinatorErrorHandling:
 
     @patch("aia.workflow_coordinator.AiaManagerFactory")
     def test_start_coder_workflow_assign_failure(self, mock_factory, sample_config, sample_issue):
-        """Test start_coder_workflow when assign_to_ai fails."""
+        """Test start_coder_workflow when the assignment fails."""
         mock_manager = Mock()
         mock_factory.create_manager.return_value = mock_manager
 
         mock_manager.get_issue.return_value = sample_issue
-        mock_manager.update_issue_status.return_value = GitOperation(True, "Updated")
-        mock_manager.assign_to_ai.return_value = GitOperation(False, "Assignment failed")
+        mock_manager.batch_transition.return_value = GitOperation(False, "Assignment failed")
 
         coordinator = WorkflowCoordinator(sample_config, "github")
         result = coordinator.start_coder_workflow(123)
@@ -386,8 +528,6 @@ class TestWorkflowCoordinatorErrorHandling:
         mock_factory.create_manager.return_value = mock_manager
 
         mock_manager.get_issue.return_value = sample_issue
-        mock_manager.update_issue_status.return_value = GitOperation(True, "Updated")
-        mock_manager.assign_to_ai.return_value = GitOperation(True, "Assigned")
         mock_manager.create_branch.return_value = GitOperation(False, "Branch creation failed")
 
         coordinator = WorkflowCoordinator(sample_config, "github")
@@ -495,6 +635,7 @@ class TestWorkflowCoordinatorErrorHandling:
         mock_manager.get_issue.return_value = issue
         mock_manager.generate_branch_name.return_value = "F/123/test"
         mock_manager.create_pr.return_value = GitOperation(False, "PR creation failed")
+        mock_manager.batch_transition.return_value = GitOperation(True, "Transitioned")
 
         coordinator = WorkflowCoordinator(sample_config, "github")
         result = coordinator.complete_tester_workflow(123, "PR Title", "PR Body")
@@ -502,6 +643,9 @@ class TestWorkflowCoordinatorErrorHandling:
         assert result.success is False
         assert "PR creation failed" in result.message
 
+        # The concurrent Done transition is rolled back
+        mock_manager.batch_transition.assert_called_with(issue, WorkflowStatus.TESTING, AiaType.AI_TESTER)
+
     @patch("aia.workflow_coordinator.AiaManagerFactory")
     def test_complete_tester_workflow_status_update_failure(self, mock_factory, sample_config):
         """Test complete_tester_workflow when status update fails."""
@@ -523,7 +667,7 @@ class TestWorkflowCoordinatorErrorHandling:
         mock_manager.get_issue.return_value = issue
         mock_manager.generate_branch_name.return_value = "F/123/test"
         mock_manager.create_pr.return_value = GitOperation(True, "PR created")
-        mock_manager.update_issue_status.return_value = GitOperation(False, "Status update failed")
+        mock_manager.batch_transition.return_value = GitOperation(False, "Status update failed")
 
         coordinator = WorkflowCoordinator(sample_config, "github")
         result = coordinator.complete_tester_workflow(123, "PR Title", "PR Body")
@@ -589,7 +733,7 @@ class TestWorkflowCoordinatorErrorHandling:
         )
 
         mock_manager.get_issue.return_value = issue
-        mock_manager.update_issue_status.return_value = GitOperation(False, "Status update failed")
+        mock_manager.batch_transition.return_value = GitOperation(False, "Status update failed")
 
         coordinator = WorkflowCoordinator(sample_config, "github")
         result = coordinator.complete_coder_workflow(123)
@@ -616,8 +760,7 @@ class TestWorkflowCoordinatorErrorHandling:
         )
 
         mock_manager.get_issue.return_value = issue
-        mock_manager.update_issue_status.return_value = GitOperation(True, "Status updated")
-        mock_manager.assign_to_ai.return_value = GitOperation(False, "Assignment failed")
+        mock_manager.batch_transition.return_value = GitOperation(False, "Assignment failed")
 
         coordinator = WorkflowCoordinator(sample_config, "github")
         result = coordinator.complete_coder_workflow(123)
@@ -657,7 +800,7 @@ class TestWorkflowCoordinatorErrorHandling:
         )
 
         mock_manager.get_issue.return_value = issue
-        mock_manager.update_issue_status.return_value = GitOperation(False, "Status update failed")
+        mock_manager.batch_transition.return_value = GitOperation(False, "Status update failed")
 
         coordinator = WorkflowCoordinator(sample_config, "github")
         result = coordinator.complete_reviewer_workflow(123)
@@ -684,8 +827,7 @@ class TestWorkflowCoordinatorErrorHandling:
         )
 
         mock_manager.get_issue.return_value = issue
-        mock_manager.update_issue_status.return_value = GitOperation(True, "Status updated")
-        mock_manager.assign_to_ai.return_value = GitOperation(False, "Assignment failed")
+        mock_manager.batch_transition.return_value = GitOperation(False, "Assignment failed")
 
         coordinator = WorkflowCoordinator(sample_config, "github")
         result = coordinator.complete_reviewer_workflow(123)
@@ -727,8 +869,7 @@ class TestWorkflowCoordinatorErrorHandling:
         mock_manager.get_issue.return_value = issue
         mock_manager.generate_branch_name.return_value = "F/123/test"
         mock_manager.create_pr.return_value = GitOperation(True, "PR created")
-        mock_manager.update_issue_status.return_value = GitOperation(True, "Status updated")
-        mock_manager.remove_label_from_issue.return_value = GitOperation(False, "Label removal failed")
+        mock_manager.batch_transition.return_value = GitOperation(False, "Label removal failed")
 
         coordinator = WorkflowCoordinator(sample_config, "github")
         result = coordinator.complete_tester_workflow(123, "PR Title", "PR Body")
@@ -795,7 +936,7 @@ class TestWorkflowCoordinatorErrorHandling:
         )
 
         mock_manager.get_issue.return_value = issue
-        mock_manager.remove_label_from_issue.return_value = GitOperation(False, "Label removal failed")
+        mock_manager.batch_transition.return_value = GitOperation(False, "Label removal failed")
 
         coordinator = WorkflowCoordinator(sample_config, "github")
         result = coordinator.complete_research_workflow(123)
@@ -816,9 +957,9 @@ class TestWorkflowCoordinatorErrorHandling:
             Issue(125, "Test3", "", IssueState.OPEN, [], [], None, None, "", WorkflowStatus.DOING),
         ]
 
-        mock_manager.get_issues.return_value = issues
+        mock_manager.get_project_issues.return_value = issues
 
-        coordinator = WorkflowCoordinator(sample_config, "github")
+        coordinator = WorkflowCoordinator(sample_config, "github", cache=WorkflowCache())
         status_counts = coordinator.get_workflow_status()
 
         assert status_counts[WorkflowStatus.TODO] == 1